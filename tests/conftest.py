@@ -1,10 +1,12 @@
 """Test configuration and fixtures for whisper-dictate."""
 
 import atexit
+import copy
 import os
+import subprocess
 import sys
-import tempfile
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Generator
 from unittest.mock import Mock, patch
 
@@ -17,6 +19,12 @@ from whisper_dictate.transcription import TranscriptionResult  # noqa: E402
 # Add project root to path for toggle_dictate module
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# Minimal WAV file header shared by audio-file fixtures (built once at import)
+_WAV_HEADER: bytes = (
+    b"RIFF\x26\x00\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00\x80>\x00\x00"
+    b"\x00}\x00\x00\x02\x00\x10\x00data\x02\x00\x00\x00\x00\x00"
+)
+
 
 @pytest.fixture(scope="session", autouse=True)
 def mock_cli_setup():
@@ -118,46 +126,54 @@ def reset_persistent_notification_state():
     import whisper_dictate.notifications as notifications_module
 
     # Store original values
-    original_time = notifications_module.PersistentNotification._last_operation_time
-    original_recording = notifications_module._recording_notification
+    original_time = notifications_module.PersistentNotification._last_operation_time_ns
+    original_recording = notifications_module.get_recording_notification()
+    original_disabled = notifications_module._NOTIFIER_DISABLED
 
     # Apply patch with explicit control
     patcher = patch.object(notifications_module, "is_dunst_running", return_value=True)
     patcher.start()
 
-    notifications_module.PersistentNotification._last_operation_time = 0.0
-    notifications_module._recording_notification = None
+    notifications_module.PersistentNotification._last_operation_time_ns = 0
+    notifications_module.set_recording_notification(None)
+    # Tests exercise the full send paths even when the host has the
+    # WHISPER_DICTATE_NO_NOTIFY kill switch set or no display server
+    notifications_module._NOTIFIER_DISABLED = False
+    notifications_module._recent.clear()
+    notifications_module._update_coalescer.reset()
+    notifications_module.is_dunstify_available.cache_clear()
+    for urgency, burst in notifications_module._NOTIFY_RATE_PER_S.items():
+        notifications_module._rate_buckets[urgency] = [burst, 0.0]
 
     yield
 
     # Explicit cleanup
     patcher.stop()
-    notifications_module.PersistentNotification._last_operation_time = original_time
-    notifications_module._recording_notification = original_recording
+    notifications_module.PersistentNotification._last_operation_time_ns = original_time
+    notifications_module.set_recording_notification(original_recording)
+    notifications_module._NOTIFIER_DISABLED = original_disabled
 
 
 @pytest.fixture
-def temp_audio_file() -> Generator[Path, None, None]:
-    """Create a temporary audio file for testing."""
-    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-        # Create minimal WAV file header for testing
-        wav_header = (
-            b"RIFF\x26\x00\x00\x00WAVEfmt \x10\x00\x00\x00\x01\x00\x01\x00\x80>\x00\x00"
-            b"\x00}\x00\x00\x02\x00\x10\x00data\x02\x00\x00\x00\x00\x00"
-        )
-        tmp.write(wav_header)
-        tmp.flush()
-        yield Path(tmp.name)
-    # Cleanup
-    try:
-        os.unlink(tmp.name)
-    except OSError:
-        pass
+def temp_audio_file(tmp_path: Path) -> Path:
+    """Create a temporary audio file for testing.
 
+    Uses pytest's tmp_path so cleanup is handled by pytest's directory
+    rotation instead of a manual unlink in teardown.
+    """
+    audio_file = tmp_path / "test_audio.wav"
+    audio_file.write_bytes(_WAV_HEADER)
+    return audio_file
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def mock_config() -> AppConfig:
-    """Create a mock configuration for testing."""
+    """Create a mock configuration for testing.
+
+    Session-scoped: tests consume it read-only, so the config objects are
+    built once per process. Use mock_config_no_clip (or copy.deepcopy) for
+    tests that need to change a field.
+    """
     return AppConfig(
         audio=AudioConfig(
             sample_rate=16000,
@@ -174,6 +190,17 @@ def mock_config() -> AppConfig:
     )
 
 
+@pytest.fixture
+def mock_config_no_clip(mock_config: AppConfig) -> AppConfig:
+    """Copy of mock_config with clipboard copying disabled.
+
+    Function-scoped copy so the session-scoped mock_config is never mutated.
+    """
+    config = copy.deepcopy(mock_config)
+    config.copy_to_clipboard = False
+    return config
+
+
 @pytest.fixture
 def mock_config_mp3_enabled() -> AppConfig:
     """Create a mock configuration with MP3 enabled for testing."""
@@ -212,81 +239,133 @@ def mock_config_mp3_keep_wav() -> AppConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_transcription_result() -> TranscriptionResult:
     """Create a mock transcription result for testing."""
     return TranscriptionResult(text="This is a test transcription.", language="en")
 
 
+class _StubResponse:
+    """Lightweight stand-in for an OpenAI transcription response."""
+
+    text = "This is a test transcription."
+    language = "en"
+
+
+class _StubOpenAIClient:
+    """Hand-written stub for the OpenAI client.
+
+    Only the transcription endpoint is wired up; `create` stays a Mock so
+    tests can assert calls and inject side effects, but the surrounding
+    object tree avoids spec'd MagicMock construction.
+    """
+
+    def __init__(self) -> None:
+        self.audio = SimpleNamespace(
+            transcriptions=SimpleNamespace(create=Mock(return_value=_StubResponse()))
+        )
+
+
+@pytest.fixture
+def mock_openai_client() -> _StubOpenAIClient:
+    """Stub OpenAI client for testing transcription.
+
+    Passed explicitly as the `client` argument, so no patching of
+    openai.OpenAI is needed.
+    """
+    return _StubOpenAIClient()
+
+
+class _StubRunResult:
+    """Minimal stand-in for a successful subprocess.CompletedProcess."""
+
+    returncode = 0
+    stdout = "mock output"
+    stderr = ""
+
+
 @pytest.fixture
-def mock_openai_client() -> Generator[Mock, None, None]:
-    """Mock OpenAI client for testing transcription."""
-    with patch("openai.OpenAI") as mock_client_class:
-        mock_client = Mock()
-        mock_client_class.return_value = mock_client
+def mock_subprocess(monkeypatch: pytest.MonkeyPatch) -> list:
+    """Stub subprocess.run for testing clipboard and notifications.
 
-        # Mock successful transcription response
-        mock_response = Mock()
-        mock_response.text = "This is a test transcription."
-        mock_response.language = "en"
-        mock_client.audio.transcriptions.create.return_value = mock_response
+    Returns the list of recorded (args, kwargs) calls.
+    """
+    calls: list = []
 
-        yield mock_client
+    def _run(*args, **kwargs):
+        calls.append((args, kwargs))
+        return _StubRunResult()
+
+    monkeypatch.setattr(subprocess, "run", _run)
+    return calls
 
 
 @pytest.fixture
-def mock_subprocess() -> Generator[Mock, None, None]:
-    """Mock subprocess for testing clipboard and notifications."""
-    with patch("subprocess.run") as mock_run:
-        # Default successful response
-        mock_run.return_value.returncode = 0
-        mock_run.return_value.stdout = "mock output"
-        mock_run.return_value.stderr = ""
-        yield mock_run
+def mock_sd_rec(monkeypatch: pytest.MonkeyPatch) -> list:
+    """Stub sounddevice.rec for testing audio recording.
+
+    Returns the list of recorded (args, kwargs) calls. Tests take only
+    the sounddevice fixture they actually need.
+    """
+    import sounddevice
+
+    calls: list = []
+
+    def _rec(*args, **kwargs):
+        calls.append((args, kwargs))
+        return [[0.1], [0.2], [0.3]]
+
+    monkeypatch.setattr(sounddevice, "rec", _rec)
+    return calls
 
 
 @pytest.fixture
-def mock_sounddevice() -> Generator[dict[str, Mock], None, None]:
-    """Mock sounddevice for testing audio recording."""
-    with (
-        patch("sounddevice.rec") as mock_rec,
-        patch("sounddevice.wait") as mock_wait,
-        patch("sounddevice.query_devices") as mock_query,
-    ):
-        # Mock successful recording
-        mock_rec.return_value = [[0.1], [0.2], [0.3]]  # Mock audio data
-        mock_wait.return_value = None
+def mock_sd_query(monkeypatch: pytest.MonkeyPatch) -> list:
+    """Stub sounddevice.query_devices for testing device enumeration.
+
+    Returns the list of recorded (args, kwargs) calls.
+    """
+    import sounddevice
 
-        # Mock device query
-        mock_query.return_value = [
+    calls: list = []
+
+    def _query(*args, **kwargs):
+        calls.append((args, kwargs))
+        return [
             {"name": "default", "max_input_channels": 2},
             {"name": "pulse", "max_input_channels": 2},
         ]
 
-        yield {"rec": mock_rec, "wait": mock_wait, "query": mock_query}
+    monkeypatch.setattr(sounddevice, "query_devices", _query)
+    return calls
 
 
 @pytest.fixture
-def mock_soundfile() -> Generator[Mock, None, None]:
-    """Mock soundfile for testing audio file operations."""
-    with patch("soundfile.write") as mock_write:
-        mock_write.return_value = None
-        yield mock_write
+def mock_soundfile(monkeypatch: pytest.MonkeyPatch) -> list:
+    """Stub soundfile.write for testing audio file operations.
 
+    Returns the list of recorded (args, kwargs) calls.
+    """
+    import soundfile
 
-@pytest.fixture
-def temp_env_vars() -> Generator[None, None, None]:
-    """Set up temporary environment variables for testing."""
-    original_env = dict(os.environ)
+    calls: list = []
 
-    # Set test environment variables
-    os.environ["OPENAI_API_KEY"] = "test-api-key"
+    def _write(*args, **kwargs):
+        calls.append((args, kwargs))
+        return None
+
+    monkeypatch.setattr(soundfile, "write", _write)
+    return calls
 
-    yield
 
-    # Restore original environment
-    os.environ.clear()
-    os.environ.update(original_env)
+@pytest.fixture
+def temp_env_vars(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Set up temporary environment variables for testing.
+
+    monkeypatch records only the deltas it sets, so restoration is O(1)
+    instead of snapshotting and replacing the whole environment.
+    """
+    monkeypatch.setenv("OPENAI_API_KEY", "test-api-key")
 
 
 @pytest.fixture
@@ -1,13 +1,77 @@
 """Tests for audio recording functionality."""
 
+import tempfile
+
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
 
 from whisper_dictate.audio import AudioRecorder
 from whisper_dictate.config import AudioConfig
 
 
+class _CallRecorder:
+    """Plain callable that records calls and optionally raises or returns."""
+
+    def __init__(self, result=None):
+        self.calls: list = []
+        self.result = result
+        self.side_effect = None
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.result
+
+
+class _StubTempFile:
+    """Stand-in for tempfile.NamedTemporaryFile's context manager."""
+
+    name = "/tmp/test.wav"
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def audio_patches(monkeypatch):
+    """Stub out sounddevice/soundfile/tempfile for record_to_file tests.
+
+    Uses monkeypatch attribute assignment instead of nested patch()
+    contexts; call details are recorded in plain lists.
+    """
+    import sounddevice
+    import soundfile
+
+    # Resolve PortAudioError once here rather than per test body. A real
+    # module-top import would load sounddevice (and PortAudio) at
+    # collection time, which the conftest mock deliberately prevents.
+    global PortAudioError
+    PortAudioError = sounddevice.PortAudioError
+
+    rec = _CallRecorder(result=[[0.1], [0.2], [0.3]])
+    write = _CallRecorder()
+    query = _CallRecorder()
+
+    # sounddevice.wait is deliberately not stubbed: no real recording runs
+    # in tests, so it is already a no-op.
+    monkeypatch.setattr(sounddevice, "rec", rec)
+    monkeypatch.setattr(sounddevice, "query_devices", query)
+    monkeypatch.setattr(soundfile, "write", write)
+    monkeypatch.setattr(tempfile, "NamedTemporaryFile", lambda *a, **k: _StubTempFile())
+
+    # Device enumeration is memoized; start each test with a cold cache
+    from whisper_dictate.audio import _query_input_devices
+
+    _query_input_devices.cache_clear()
+
+    return SimpleNamespace(rec=rec, write=write, query=query)
+
+
 class TestAudioRecorder:
     """Test the AudioRecorder class."""
 
@@ -18,207 +82,220 @@ class TestAudioRecorder:
         recorder = AudioRecorder(config)
         assert recorder.config == config
 
-    def test_record_to_file_success(self):
-        """Test successful audio recording to file."""
-        config = AudioConfig(sample_rate=16000, channels=1, duration=1.0, device=None)
+    @pytest.mark.parametrize(
+        "channels,duration,device,expected_frames",
+        [
+            (1, None, None, 16000),  # defaults
+            (1, 2.5, None, 40000),  # custom duration: 16000 * 2.5
+            (1, None, "pulse", 16000),  # specific device
+            (2, None, None, 16000),  # stereo channel config
+        ],
+    )
+    def test_record_to_file(
+        self, channels, duration, device, expected_frames, audio_patches
+    ):
+        """Test recording with the supported parameter combinations."""
+        config = AudioConfig(
+            sample_rate=16000, channels=channels, duration=1.0, device=device
+        )
 
         recorder = AudioRecorder(config)
 
-        with (
-            patch("sounddevice.rec") as mock_rec,
-            patch("sounddevice.wait") as mock_wait,
-            patch("soundfile.write") as _mock_write,
-            patch("tempfile.NamedTemporaryFile") as mock_temp,
-        ):
-            # Mock audio data
-            mock_rec.return_value = [[0.1], [0.2], [0.3]]
-            mock_wait.return_value = None
-
-            # Mock temporary file
-            mock_temp_file = Mock()
-            mock_temp_file.name = "/tmp/test.wav"
-            mock_temp.return_value.__enter__.return_value = mock_temp_file
-
-            result = recorder.record_to_file()
-
-            assert isinstance(result, Path)
-            assert result == Path("/tmp/test.wav")
-
-            # Verify recording parameters
-            mock_rec.assert_called_once()
-            rec_args = mock_rec.call_args
-            assert rec_args[0][0] == 16000  # sample_rate * duration
-            assert rec_args[1]["samplerate"] == 16000
-            assert rec_args[1]["channels"] == 1
-            assert rec_args[1]["dtype"] == "float32"
-
-    def test_record_to_file_custom_duration(self):
-        """Test recording with custom duration."""
-        config = AudioConfig(sample_rate=16000, channels=1, duration=5.0, device=None)
+        result = recorder.record_to_file(duration=duration)
+
+        assert isinstance(result, Path)
+        assert result == Path("/tmp/test.wav")
+
+        # Verify recording parameters
+        assert len(audio_patches.rec.calls) == 1
+        rec_args, rec_kwargs = audio_patches.rec.calls[-1]
+        assert rec_args[0] == expected_frames
+        assert rec_kwargs["samplerate"] == 16000
+        assert rec_kwargs["channels"] == channels
+        assert rec_kwargs["device"] == device
+        assert rec_kwargs["dtype"] == "float32"
+
+    def test_record_to_file_downmixes_stereo(self, audio_patches):
+        """Test that stereo recordings are mono-mixed before writing."""
+        config = AudioConfig(sample_rate=16000, channels=2, duration=1.0, device=None)
+
+        recorder = AudioRecorder(config)
+
+        audio_patches.rec.result = [[0.1, 0.3], [0.2, 0.4], [0.3, 0.5]]
+        recorder.record_to_file()
+
+        write_args, _ = audio_patches.write.calls[-1]
+        written = write_args[1]
+        assert written.ndim == 1
+        assert written == pytest.approx([0.2, 0.3, 0.4])
+        # sample rate is passed through unchanged at 16 kHz
+        assert write_args[2] == 16000
+
+    def test_record_to_file_trims_edge_silence(self, audio_patches):
+        """Test that leading/trailing silence is trimmed before writing."""
+        import numpy as np
+
+        config = AudioConfig(sample_rate=16000, channels=1, duration=1.5, device=None)
 
         recorder = AudioRecorder(config)
 
-        with (
-            patch("sounddevice.rec") as mock_rec,
-            patch("sounddevice.wait") as mock_wait,
-            patch("soundfile.write") as _mock_write,
-            patch("tempfile.NamedTemporaryFile") as mock_temp,
-        ):
-            mock_rec.return_value = [[0.1], [0.2], [0.3]]
-            mock_wait.return_value = None
+        # 0.5 s silence, 0.5 s of signal, 0.5 s silence
+        audio_patches.rec.result = np.concatenate(
+            [np.zeros(8000), np.full(8000, 0.5), np.zeros(8000)]
+        ).astype(np.float32)
+
+        recorder.record_to_file()
 
-            mock_temp_file = Mock()
-            mock_temp_file.name = "/tmp/test.wav"
-            mock_temp.return_value.__enter__.return_value = mock_temp_file
+        write_args, _ = audio_patches.write.calls[-1]
+        written = write_args[1]
+        # The voiced span plus padding survives; most edge silence is gone
+        assert 8000 <= len(written) < 16000
+        assert written.max() == pytest.approx(0.5)
+
+    def test_record_to_file_encodes_opus_by_default(self, audio_patches):
+        """Test that recordings are written as OGG/Opus by default."""
+        config = AudioConfig(sample_rate=16000, channels=1, duration=1.0, device=None)
+
+        recorder = AudioRecorder(config)
 
-            result = recorder.record_to_file(duration=2.5)
+        recorder.record_to_file()
 
-            assert isinstance(result, Path)
+        _, write_kwargs = audio_patches.write.calls[-1]
+        assert write_kwargs["format"] == "OGG"
+        assert write_kwargs["subtype"] == "OPUS"
 
-            # Verify custom duration was used
-            mock_rec.assert_called_once()
-            rec_args = mock_rec.call_args
-            assert rec_args[0][0] == 40000  # 16000 * 2.5
+    def test_record_to_file_wav_encode_format(self, audio_patches):
+        """Test that encode_format='wav' writes a real PCM_16 WAV file."""
+        import numpy as np
 
-    def test_record_to_file_with_device(self):
-        """Test recording with specific device."""
         config = AudioConfig(
-            sample_rate=16000, channels=1, duration=1.0, device="pulse"
+            sample_rate=16000, channels=1, duration=1.0, device=None,
+            encode_format="wav",
         )
 
         recorder = AudioRecorder(config)
 
-        with (
-            patch("sounddevice.rec") as mock_rec,
-            patch("sounddevice.wait") as mock_wait,
-            patch("soundfile.write") as _mock_write,
-            patch("tempfile.NamedTemporaryFile") as mock_temp,
-        ):
-            mock_rec.return_value = [[0.1], [0.2], [0.3]]
-            mock_wait.return_value = None
+        result = recorder.record_to_file()
 
-            mock_temp_file = Mock()
-            mock_temp_file.name = "/tmp/test.wav"
-            mock_temp.return_value.__enter__.return_value = mock_temp_file
+        # The WAV path bypasses soundfile and writes through mmap
+        assert audio_patches.write.calls == []
+        data = result.read_bytes()
+        assert data[:4] == b"RIFF"
+        assert data[8:12] == b"WAVE"
+        samples = np.frombuffer(data[44:], dtype=np.int16)
+        assert samples.tolist() == [3277, 6553, 9830]
 
-            result = recorder.record_to_file()
+    def test_record_to_file_falls_back_to_wav_without_opus(
+        self, audio_patches, monkeypatch
+    ):
+        """Test WAV fallback when libsndfile rejects the Opus encode."""
+        import soundfile
 
-            assert isinstance(result, Path)
+        def write(path, data, rate, format=None, subtype=None):
+            raise RuntimeError("Format not recognised")
 
-            # Verify device parameter
-            rec_args = mock_rec.call_args
-            assert rec_args[1]["device"] == "pulse"
+        monkeypatch.setattr(soundfile, "write", write)
 
-    def test_record_to_file_portaudio_error(self):
-        """Test handling of PortAudio errors."""
         config = AudioConfig(sample_rate=16000, channels=1, duration=1.0, device=None)
 
         recorder = AudioRecorder(config)
 
-        with patch("sounddevice.rec") as mock_rec:
-            from sounddevice import PortAudioError
+        result = recorder.record_to_file()
 
-            mock_rec.side_effect = PortAudioError("Device not found")
+        assert isinstance(result, Path)
+        assert result.read_bytes()[:4] == b"RIFF"
 
-            with pytest.raises(PortAudioError, match="Device not found"):
-                recorder.record_to_file()
+    def test_record_to_bytes(self, audio_patches):
+        """Test in-memory recording returns a named, rewound buffer."""
+        import io
 
-    def test_record_to_file_soundfile_error(self):
-        """Test handling of soundfile write errors."""
         config = AudioConfig(sample_rate=16000, channels=1, duration=1.0, device=None)
 
         recorder = AudioRecorder(config)
 
-        with (
-            patch("sounddevice.rec") as mock_rec,
-            patch("sounddevice.wait") as mock_wait,
-            patch("soundfile.write") as _mock_write,
-            patch("tempfile.NamedTemporaryFile") as mock_temp,
-        ):
-            mock_rec.return_value = [[0.1], [0.2], [0.3]]
-            mock_wait.return_value = None
+        result = recorder.record_to_bytes()
 
-            mock_temp_file = Mock()
-            mock_temp_file.name = "/tmp/test.wav"
-            mock_temp.return_value.__enter__.return_value = mock_temp_file
+        assert isinstance(result, io.BytesIO)
+        assert result.name == "recording.ogg"
+        assert result.tell() == 0
 
-            _mock_write.side_effect = IOError("Cannot write file")
+        # The encode went through soundfile with the Opus settings
+        write_args, write_kwargs = audio_patches.write.calls[-1]
+        assert write_args[0] is result
+        assert write_kwargs["format"] == "OGG"
+        assert write_kwargs["subtype"] == "OPUS"
 
-            with pytest.raises(IOError, match="Cannot write file"):
-                recorder.record_to_file()
-
-    def test_get_audio_devices(self):
-        """Test getting available audio devices."""
+    def test_record_to_file_portaudio_error(self, audio_patches):
+        """Test handling of PortAudio errors."""
         config = AudioConfig(sample_rate=16000, channels=1, duration=1.0, device=None)
 
         recorder = AudioRecorder(config)
 
-        with patch("sounddevice.query_devices") as mock_query:
-            mock_query.return_value = [
-                {"name": "default", "max_input_channels": 2},
-                {"name": "pulse", "max_input_channels": 2},
-                {"name": "hw:0,0", "max_input_channels": 1},
-                {"name": "hw:1,0", "max_input_channels": 0},  # Output only
-            ]
-
-            devices = recorder.get_audio_devices()
+        audio_patches.rec.side_effect = PortAudioError("Device not found")
 
-            assert devices == ("default", "pulse", "hw:0,0")
-            mock_query.assert_called_once()
+        with pytest.raises(PortAudioError, match="Device not found"):
+            recorder.record_to_file()
 
-    def test_get_audio_devices_empty(self):
-        """Test getting audio devices when none are available."""
+    def test_record_to_file_soundfile_error(self, audio_patches):
+        """Test handling of soundfile write errors."""
         config = AudioConfig(sample_rate=16000, channels=1, duration=1.0, device=None)
 
         recorder = AudioRecorder(config)
 
-        with patch("sounddevice.query_devices") as mock_query:
-            mock_query.return_value = [
-                {"name": "hw:0,0", "max_input_channels": 0},
-                {"name": "hw:1,0", "max_input_channels": 0},
-            ]
-
-            devices = recorder.get_audio_devices()
+        audio_patches.write.side_effect = IOError("Cannot write file")
 
-            assert devices == ()
+        with pytest.raises(IOError, match="Cannot write file"):
+            recorder.record_to_file()
 
-    def test_get_audio_devices_query_error(self):
-        """Test handling of device query errors."""
+    def test_get_audio_devices(self, audio_patches):
+        """Test getting available audio devices."""
         config = AudioConfig(sample_rate=16000, channels=1, duration=1.0, device=None)
 
         recorder = AudioRecorder(config)
 
-        with patch("sounddevice.query_devices") as mock_query:
-            from sounddevice import PortAudioError
+        audio_patches.query.result = [
+            {"name": "default", "max_input_channels": 2},
+            {"name": "pulse", "max_input_channels": 2},
+            {"name": "hw:0,0", "max_input_channels": 1},
+            {"name": "hw:1,0", "max_input_channels": 0},  # Output only
+        ]
 
-            mock_query.side_effect = PortAudioError("Query failed")
+        devices = recorder.get_audio_devices()
 
-            with pytest.raises(PortAudioError, match="Query failed"):
-                recorder.get_audio_devices()
+        assert devices == ("default", "pulse", "hw:0,0")
+        assert len(audio_patches.query.calls) == 1
 
-    def test_record_to_file_channels_config(self):
-        """Test recording with different channel configurations."""
-        config = AudioConfig(sample_rate=16000, channels=2, duration=1.0, device=None)
+        # Second call is served from the memoized result
+        assert recorder.get_audio_devices() == devices
+        assert len(audio_patches.query.calls) == 1
+
+        # refresh=True forces a re-probe
+        recorder.get_audio_devices(refresh=True)
+        assert len(audio_patches.query.calls) == 2
+
+    def test_get_audio_devices_empty(self, audio_patches):
+        """Test getting audio devices when none are available."""
+        config = AudioConfig(sample_rate=16000, channels=1, duration=1.0, device=None)
 
         recorder = AudioRecorder(config)
 
-        with (
-            patch("sounddevice.rec") as mock_rec,
-            patch("sounddevice.wait") as mock_wait,
-            patch("soundfile.write") as _mock_write,
-            patch("tempfile.NamedTemporaryFile") as mock_temp,
-        ):
-            mock_rec.return_value = [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]]
-            mock_wait.return_value = None
+        audio_patches.query.result = [
+            {"name": "hw:0,0", "max_input_channels": 0},
+            {"name": "hw:1,0", "max_input_channels": 0},
+        ]
+
+        devices = recorder.get_audio_devices()
 
-            mock_temp_file = Mock()
-            mock_temp_file.name = "/tmp/test.wav"
-            mock_temp.return_value.__enter__.return_value = mock_temp_file
+        assert devices == ()
+
+    def test_get_audio_devices_query_error(self, audio_patches):
+        """Test handling of device query errors."""
+        config = AudioConfig(sample_rate=16000, channels=1, duration=1.0, device=None)
+
+        recorder = AudioRecorder(config)
 
-            result = recorder.record_to_file()
+        audio_patches.query.side_effect = PortAudioError("Query failed")
 
-            assert isinstance(result, Path)
+        with pytest.raises(PortAudioError, match="Query failed"):
+            recorder.get_audio_devices()
 
-            # Verify channels parameter
-            rec_args = mock_rec.call_args
-            assert rec_args[1]["channels"] == 2
@@ -600,7 +600,7 @@ class TestTranscriptionQualityEquivalence:
                 mock_client_class.return_value = mock_client
                 mock_client.audio.transcriptions.create.return_value = mock_response
 
-                config = OpenAIConfig(api_key="test-key")
+                config = OpenAIConfig(api_key="test-key", need_language=True)
                 transcriber = WhisperTranscriber(config, client=mock_client)
 
                 # Should not raise any error - MP3 should be supported directly
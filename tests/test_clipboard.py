@@ -1,200 +1,242 @@
 """Tests for clipboard functionality."""
 
-from unittest.mock import Mock, patch
+import shutil
+import subprocess
+from types import SimpleNamespace
 
-from whisper_dictate.clipboard import ClipboardManager
+import pytest
+
+from whisper_dictate import clipboard
+from whisper_dictate.clipboard import ClipboardManager, _detect_clipboard_tools
+
+
+def _which_for(found):
+    """Build a shutil.which replacement that resolves only the given tools."""
+    return lambda tool: f"/usr/bin/{tool}" if tool in found else None
+
+
+class _FakePopen:
+    """subprocess.Popen stand-in recording the command and stdin writes."""
+
+    def __init__(self, cmd, returncode=None, **kwargs):
+        self.cmd = cmd
+        self.kwargs = kwargs
+        self.returncode = returncode
+        self.stdin = self
+        self.written = b""
+        self.closed = False
+
+    def write(self, data):
+        self.written += data
+
+    def close(self):
+        self.closed = True
+
+    def poll(self):
+        return self.returncode
+
+
+class _PopenFactory:
+    """Callable producing _FakePopen instances from a per-call spec list.
+
+    Each spec is either an exception (raised from the constructor, as a
+    missing binary would) or a returncode for poll(); specs past the end
+    default to a detached still-running process (returncode None).
+    """
+
+    def __init__(self, specs=()):
+        self._specs = list(specs)
+        self.procs = []
+
+    def __call__(self, cmd, **kwargs):
+        spec = self._specs.pop(0) if self._specs else None
+        if isinstance(spec, BaseException):
+            raise spec
+        proc = _FakePopen(cmd, returncode=spec, **kwargs)
+        self.procs.append(proc)
+        return proc
+
+
+def _mgr_with(tools):
+    """Build a ClipboardManager with the given tools, skipping detection.
+
+    Bypasses __init__ via __new__ so no "which" probes run; only the
+    test_init_* tests exercise the real constructor path.
+    """
+    manager = ClipboardManager.__new__(ClipboardManager)
+    manager.available_tools = list(tools)
+    return manager
+
+
+@pytest.fixture
+def clip_mgr():
+    """ClipboardManager with xclip available, built without probing."""
+    return _mgr_with(["xclip"])
+
+
+@pytest.fixture
+def clip_mgr_with():
+    """Factory for ClipboardManagers with an arbitrary tool set."""
+    return _mgr_with
 
 
 class TestClipboardManager:
     """Test the ClipboardManager class."""
-    
-    def test_init_no_tools_available(self):
+
+    def test_init_no_tools_available(self, monkeypatch):
         """Test initialization when no clipboard tools are available."""
-        from subprocess import CalledProcessError
-        
-        with patch('subprocess.run') as mock_run:
-            # Simulate "which" command failing for all tools
-            mock_run.side_effect = [
-                CalledProcessError(1, "which"),  # xclip not found
-                CalledProcessError(1, "which"),  # xsel not found
-                CalledProcessError(1, "which"),  # wl-copy not found
-            ]
-            
-            manager = ClipboardManager()
-            assert manager.available_tools == []
-    
-    def test_init_with_xclip_available(self):
+        # No tool resolves in PATH and pyperclip is not installed
+        monkeypatch.setattr(clipboard, "_get_pyperclip", lambda: None)
+        monkeypatch.setattr(shutil, "which", _which_for(set()))
+        _detect_clipboard_tools.cache_clear()
+
+        manager = ClipboardManager()
+        assert manager.available_tools == []
+
+    def test_init_with_xclip_available(self, monkeypatch):
         """Test initialization when xclip is available."""
-        from subprocess import CalledProcessError
-        
-        with patch('subprocess.run') as mock_run:
-            # Simulate xclip being available
-            mock_run.side_effect = [
-                Mock(returncode=0),  # xclip found
-                CalledProcessError(1, "which"),  # xsel not found
-                CalledProcessError(1, "which"),  # wl-copy not found
-            ]
-            
-            manager = ClipboardManager()
-            assert manager.available_tools == ["xclip"]
-    
-    def test_init_with_multiple_tools_available(self):
+        # Only xclip resolves; xsel/wl-copy/pyperclip are not found
+        monkeypatch.setattr(clipboard, "_get_pyperclip", lambda: None)
+        monkeypatch.setattr(shutil, "which", _which_for({"xclip"}))
+        _detect_clipboard_tools.cache_clear()
+
+        manager = ClipboardManager()
+        assert manager.available_tools == ["xclip"]
+
+    def test_init_with_multiple_tools_available(self, monkeypatch):
         """Test initialization with multiple clipboard tools available."""
-        with patch('subprocess.run') as mock_run:
-            # Simulate multiple tools being available
-            mock_run.side_effect = [
-                Mock(returncode=0),  # xclip found
-                Mock(returncode=0),  # xsel found
-                Mock(returncode=0),  # wl-copy found
-            ]
-            
-            manager = ClipboardManager()
-            assert manager.available_tools == ["xclip", "xsel", "wl-copy"]
+        # Simulate all tools being available
+        monkeypatch.setattr(clipboard, "_get_pyperclip", lambda: None)
+        monkeypatch.setattr(
+            shutil, "which", _which_for({"xclip", "xsel", "wl-copy"})
+        )
+        _detect_clipboard_tools.cache_clear()
+
+        manager = ClipboardManager()
+        assert manager.available_tools == ["wl-copy", "xsel", "xclip"]
+
+    def test_init_prefers_pyperclip_when_installed(self, monkeypatch):
+        """Test that pyperclip is registered ahead of the CLI tools."""
+        monkeypatch.setattr(
+            clipboard, "_get_pyperclip", lambda: SimpleNamespace()
+        )
+        monkeypatch.setattr(shutil, "which", _which_for({"xsel"}))
+        _detect_clipboard_tools.cache_clear()
+
+        manager = ClipboardManager()
+        assert manager.available_tools == ["pyperclip", "xsel"]
     
-    def test_copy_to_clipboard_no_tools(self):
+    def test_copy_to_clipboard_no_tools(self, clip_mgr_with):
         """Test copying when no clipboard tools are available."""
-        manager = ClipboardManager()
-        manager.available_tools = []
-        
+        manager = clip_mgr_with([])
+
         result = manager.copy_to_clipboard("test text")
         assert result is False
-    
-    def test_copy_to_clipboard_xclip_success(self):
-        """Test successful copy using xclip."""
-        manager = ClipboardManager()
-        manager.available_tools = ["xclip"]
-        
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = Mock(returncode=0)
-            
-            result = manager.copy_to_clipboard("test text")
-            assert result is True
-            
-            mock_run.assert_called_once_with(
-                ["xclip", "-selection", "clipboard"],
-                input=b"test text",
-                check=True,
-                timeout=5
-            )
-    
-    def test_copy_to_clipboard_xsel_success(self):
-        """Test successful copy using xsel."""
-        manager = ClipboardManager()
-        manager.available_tools = ["xsel"]
-        
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = Mock(returncode=0)
-            
-            result = manager.copy_to_clipboard("test text")
-            assert result is True
-            
-            mock_run.assert_called_once_with(
-                ["xsel", "--clipboard", "--input"],
-                input=b"test text",
-                check=True,
-                timeout=5
-            )
-    
-    def test_copy_to_clipboard_wl_copy_success(self):
-        """Test successful copy using wl-copy."""
-        manager = ClipboardManager()
-        manager.available_tools = ["wl-copy"]
-        
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = Mock(returncode=0)
-            
-            result = manager.copy_to_clipboard("test text")
-            assert result is True
-            
-            mock_run.assert_called_once_with(
-                ["wl-copy"],
-                input=b"test text",
-                check=True,
-                timeout=5
-            )
-    
-    def test_copy_to_clipboard_fallback_behavior(self):
+
+    @pytest.mark.parametrize(
+        "tool,cmd,text,expected_input",
+        [
+            ("xclip", ["xclip", "-selection", "clipboard", "-loops", "1"], "test text", b"test text"),
+            ("xsel", ["xsel", "--clipboard", "--input"], "test text", b"test text"),
+            ("wl-copy", ["wl-copy"], "test text", b"test text"),
+            (
+                "xclip",
+                ["xclip", "-selection", "clipboard", "-loops", "1"],
+                "Hello 世界 🌍",
+                "Hello 世界 🌍".encode("utf-8"),
+            ),
+            ("xclip", ["xclip", "-selection", "clipboard", "-loops", "1"], "", b""),
+        ],
+    )
+    def test_copy_to_clipboard_success(
+        self, clip_mgr_with, monkeypatch, tool, cmd, text, expected_input
+    ):
+        """Test successful copies per tool, including unicode and empty text."""
+        manager = clip_mgr_with([tool])
+
+        popen = _PopenFactory()
+        monkeypatch.setattr(subprocess, "Popen", popen)
+
+        result = manager.copy_to_clipboard(text)
+        assert result is True
+
+        assert len(popen.procs) == 1
+        proc = popen.procs[0]
+        assert proc.cmd == cmd
+        assert proc.written == expected_input
+        assert proc.closed is True
+        # The spawn is detached; no blocking wait on the tool
+        assert proc.kwargs["start_new_session"] is True
+
+    def test_copy_to_clipboard_fallback_behavior(self, monkeypatch):
         """Test fallback behavior when first tool fails."""
-        from subprocess import CalledProcessError
-        
-        manager = ClipboardManager()
-        manager.available_tools = ["xclip", "xsel"]
-        
-        with patch('subprocess.run') as mock_run:
-            # First call fails, second succeeds
-            mock_run.side_effect = [
-                CalledProcessError(1, "xclip"),  # xclip fails
-                Mock(returncode=0),  # xsel succeeds
-            ]
-            
-            result = manager.copy_to_clipboard("test text")
-            assert result is True
-            
-            # Should have tried both tools
-            assert mock_run.call_count == 2
-    
-    def test_copy_to_clipboard_all_tools_fail(self):
+        manager = _mgr_with(["xclip", "xsel"])
+
+        # xclip binary is missing, xsel works
+        popen = _PopenFactory([FileNotFoundError("xclip"), None])
+        monkeypatch.setattr(subprocess, "Popen", popen)
+
+        result = manager.copy_to_clipboard("test text")
+        assert result is True
+
+        # Should have tried both tools
+        assert popen.procs[0].cmd[0] == "xsel"
+
+    def test_copy_to_clipboard_all_tools_fail(self, monkeypatch):
         """Test when all available tools fail."""
-        from subprocess import CalledProcessError
-        
-        manager = ClipboardManager()
-        manager.available_tools = ["xclip", "xsel"]
-        
-        with patch('subprocess.run') as mock_run:
-            mock_run.side_effect = [
-                CalledProcessError(1, "xclip"),
-                CalledProcessError(1, "xsel"),
-            ]
-            
-            result = manager.copy_to_clipboard("test text")
-            assert result is False
-    
-    def test_copy_to_clipboard_timeout_error(self):
-        """Test handling of subprocess timeout."""
-        manager = ClipboardManager()
-        manager.available_tools = ["xclip"]
-        
-        with patch('subprocess.run') as mock_run:
-            from subprocess import TimeoutExpired
-            mock_run.side_effect = TimeoutExpired("xclip", 5)
-            
-            result = manager.copy_to_clipboard("test text")
-            assert result is False
-    
-    def test_copy_to_clipboard_unicode_text(self):
-        """Test copying unicode text."""
-        manager = ClipboardManager()
-        manager.available_tools = ["xclip"]
-        
-        unicode_text = "Hello 世界 🌍"
-        
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = Mock(returncode=0)
-            
-            result = manager.copy_to_clipboard(unicode_text)
-            assert result is True
-            
-            mock_run.assert_called_once_with(
-                ["xclip", "-selection", "clipboard"],
-                input=unicode_text.encode("utf-8"),
-                check=True,
-                timeout=5
-            )
+        manager = _mgr_with(["xclip", "xsel"])
+
+        popen = _PopenFactory(
+            [FileNotFoundError("xclip"), FileNotFoundError("xsel")]
+        )
+        monkeypatch.setattr(subprocess, "Popen", popen)
+
+        result = manager.copy_to_clipboard("test text")
+        assert result is False
+
+    def test_copy_to_clipboard_pyperclip(self, clip_mgr_with, monkeypatch):
+        """Test the in-process pyperclip path spawns no subprocess."""
+        manager = clip_mgr_with(["pyperclip"])
+
+        copied = []
+        monkeypatch.setattr(
+            clipboard,
+            "_get_pyperclip",
+            lambda: SimpleNamespace(copy=copied.append),
+        )
+        popen = _PopenFactory()
+        monkeypatch.setattr(subprocess, "Popen", popen)
+
+        result = manager.copy_to_clipboard("test text")
+        assert result is True
+        assert copied == ["test text"]
+        assert popen.procs == []
+
+    def test_copy_to_clipboard_pyperclip_falls_back(
+        self, clip_mgr_with, monkeypatch
+    ):
+        """Test fallback to the CLI tools when pyperclip fails."""
+        manager = clip_mgr_with(["pyperclip", "xsel"])
+
+        def fail(text):
+            raise RuntimeError("no copy mechanism")
+
+        monkeypatch.setattr(
+            clipboard, "_get_pyperclip", lambda: SimpleNamespace(copy=fail)
+        )
+        popen = _PopenFactory()
+        monkeypatch.setattr(subprocess, "Popen", popen)
+
+        result = manager.copy_to_clipboard("test text")
+        assert result is True
+        assert popen.procs[0].cmd[0] == "xsel"
+
+    def test_copy_to_clipboard_tool_exits_nonzero(self, clip_mgr, monkeypatch):
+        """Test that a tool dying on startup is treated as a failure."""
+        # xclip exits immediately with an error (e.g. no display)
+        popen = _PopenFactory([1])
+        monkeypatch.setattr(subprocess, "Popen", popen)
+
+        result = clip_mgr.copy_to_clipboard("test text")
+        assert result is False
     
-    def test_copy_to_clipboard_empty_text(self):
-        """Test copying empty text."""
-        manager = ClipboardManager()
-        manager.available_tools = ["xclip"]
-        
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value = Mock(returncode=0)
-            
-            result = manager.copy_to_clipboard("")
-            assert result is True
-            
-            mock_run.assert_called_once_with(
-                ["xclip", "-selection", "clipboard"],
-                input=b"",
-                check=True,
-                timeout=5
-            )
\ No newline at end of file
@@ -2,53 +2,89 @@
 
 import pytest
 from pathlib import Path
-from unittest.mock import patch, MagicMock, PropertyMock, Mock
+from unittest.mock import patch, MagicMock, Mock
 
 from whisper_dictate.dictation import DictationService
 
 
+class _FakePath:
+    """Minimal Path stand-in for cleanup tests.
+
+    Counts unlink() calls instead of relying on MagicMock(spec=Path),
+    which introspects the full Path class on every construction.
+    """
+
+    def __init__(self, path_str, unlink_error=None):
+        self._path_str = path_str
+        self.unlink_calls = 0
+        self._unlink_error = unlink_error
+
+    def __str__(self):
+        return self._path_str
+
+    @property
+    def suffix(self):
+        return Path(self._path_str).suffix
+
+    def exists(self):
+        return True
+
+    def unlink(self):
+        self.unlink_calls += 1
+        if self._unlink_error is not None:
+            raise self._unlink_error
+
+
+@pytest.fixture(scope="class")
+def service(mock_config):
+    """One DictationService shared per test class.
+
+    Construction probes clipboard tools and builds the transcriber, so
+    reuse it across tests; tests patch.object per test instead of
+    constructing a fresh service. Tests that need a different config
+    construct their own instance.
+    """
+    with DictationService(mock_config) as shared_service:
+        yield shared_service
+
+
 class TestDictationService:
     """Test the DictationService class."""
 
-    def test_init(self, mock_config):
+    def test_init(self, service, mock_config):
         """Test DictationService initialization."""
-        with DictationService(mock_config) as service:
-            assert service.config == mock_config
-            assert service.audio_recorder is not None
-            assert service.transcriber is not None
-            assert service.clipboard is not None
+        assert service.config == mock_config
+        assert service.audio_recorder is not None
+        assert service.transcriber is not None
+        assert service.clipboard is not None
 
-    def test_dictate_success(self, mock_config, mock_transcription_result):
+    def test_dictate_success(self, service, mock_transcription_result):
         """Test successful dictation workflow."""
-        with DictationService(mock_config) as service:
-            with (
-                patch.object(service.audio_recorder, "record_to_file") as mock_record,
-                patch.object(
-                    service.transcriber, "transcribe_audio"
-                ) as mock_transcribe,
-                patch.object(service.clipboard, "copy_to_clipboard") as mock_copy,
-            ):
-                # Mock successful operations
-                mock_record.return_value = Path("/tmp/test.wav")
-                mock_transcribe.return_value = mock_transcription_result
-                mock_copy.return_value = True
+        with (
+            patch.object(service.audio_recorder, "record_to_file") as mock_record,
+            patch.object(service.transcriber, "transcribe_audio") as mock_transcribe,
+            patch.object(service.clipboard, "copy_to_clipboard") as mock_copy,
+        ):
+            # Mock successful operations
+            mock_record.return_value = Path("/tmp/test.wav")
+            mock_transcribe.return_value = mock_transcription_result
+            mock_copy.return_value = True
 
-                result = service.dictate()
+            result = service.dictate()
 
-                assert result is not None
-                assert result.text == "This is a test transcription."
-                assert result.language == "en"
+            assert result is not None
+            assert result.text == "This is a test transcription."
+            assert result.language == "en"
 
-                mock_record.assert_called_once()
-                mock_transcribe.assert_called_once_with(Path("/tmp/test.wav"))
-                mock_copy.assert_called_once_with("This is a test transcription.")
+            mock_record.assert_called_once()
+            mock_transcribe.assert_called_once_with(Path("/tmp/test.wav"))
+            mock_copy.assert_called_once_with("This is a test transcription.")
 
     def test_dictate_without_clipboard_copy(
-        self, mock_config, mock_transcription_result
+        self, mock_config_no_clip, mock_transcription_result
     ):
         """Test dictation without clipboard copying."""
-        mock_config.copy_to_clipboard = False
-        with DictationService(mock_config) as service:
+        with DictationService(mock_config_no_clip) as service:
             with (
                 patch.object(service.audio_recorder, "record_to_file") as mock_record,
                 patch.object(
@@ -65,172 +101,162 @@ class TestDictationService:
                 assert result.text == "This is a test transcription."
                 mock_copy.assert_not_called()
 
-    def test_dictate_with_custom_duration(self, mock_config, mock_transcription_result):
+    def test_dictate_skips_clipboard_for_empty_text(self, service):
+        """Test that empty/whitespace transcriptions are not copied."""
+        from whisper_dictate.transcription import TranscriptionResult
+
+        with (
+            patch.object(service.audio_recorder, "record_to_file") as mock_record,
+            patch.object(service.transcriber, "transcribe_audio") as mock_transcribe,
+            patch.object(service.clipboard, "copy_to_clipboard") as mock_copy,
+        ):
+            mock_record.return_value = Path("/tmp/test.wav")
+            mock_transcribe.return_value = TranscriptionResult(
+                text=" ", language=None
+            )
+
+            result = service.dictate()
+
+            assert result is not None
+            # Copying whitespace would clear the user's clipboard
+            mock_copy.assert_not_called()
+
+    def test_dictate_with_custom_duration(self, service, mock_transcription_result):
         """Test dictation with custom duration."""
-        with DictationService(mock_config) as service:
-            with (
-                patch.object(service.audio_recorder, "record_to_file") as mock_record,
-                patch.object(
-                    service.transcriber, "transcribe_audio"
-                ) as mock_transcribe,
-                patch.object(service.clipboard, "copy_to_clipboard") as mock_copy,
-            ):
-                mock_record.return_value = Path("/tmp/test.wav")
-                mock_transcribe.return_value = mock_transcription_result
-                mock_copy.return_value = True
+        with (
+            patch.object(service.audio_recorder, "record_to_file") as mock_record,
+            patch.object(service.transcriber, "transcribe_audio") as mock_transcribe,
+            patch.object(service.clipboard, "copy_to_clipboard") as mock_copy,
+        ):
+            mock_record.return_value = Path("/tmp/test.wav")
+            mock_transcribe.return_value = mock_transcription_result
+            mock_copy.return_value = True
 
-                result = service.dictate(duration=10.0)
+            result = service.dictate(duration=10.0)
 
-                assert result is not None
-                mock_record.assert_called_once_with(10.0)
+            assert result is not None
+            mock_record.assert_called_once_with(10.0)
 
-    def test_dictate_recording_failure(self, mock_config):
+    def test_dictate_recording_failure(self, service):
         """Test handling of recording failures."""
-        with DictationService(mock_config) as service:
-            with patch.object(service.audio_recorder, "record_to_file") as mock_record:
-                mock_record.side_effect = Exception("Recording failed")
+        with patch.object(service.audio_recorder, "record_to_file") as mock_record:
+            mock_record.side_effect = Exception("Recording failed")
 
-                with pytest.raises(Exception, match="Recording failed"):
-                    service.dictate()
+            with pytest.raises(Exception, match="Recording failed"):
+                service.dictate()
 
-    def test_dictate_transcription_failure(self, mock_config):
+    def test_dictate_transcription_failure(self, service):
         """Test handling of transcription failures."""
-        with DictationService(mock_config) as service:
-            with (
-                patch.object(service.audio_recorder, "record_to_file") as mock_record,
-                patch.object(
-                    service.transcriber, "transcribe_audio"
-                ) as mock_transcribe,
-            ):
-                mock_record.return_value = Path("/tmp/test.wav")
-                mock_transcribe.side_effect = Exception("Transcription failed")
+        with (
+            patch.object(service.audio_recorder, "record_to_file") as mock_record,
+            patch.object(service.transcriber, "transcribe_audio") as mock_transcribe,
+        ):
+            mock_record.return_value = Path("/tmp/test.wav")
+            mock_transcribe.side_effect = Exception("Transcription failed")
 
-                with pytest.raises(Exception, match="Transcription failed"):
-                    service.dictate()
+            with pytest.raises(Exception, match="Transcription failed"):
+                service.dictate()
 
-    def test_dictate_clipboard_failure(self, mock_config, mock_transcription_result):
+    def test_dictate_clipboard_failure(self, service, mock_transcription_result):
         """Test handling of clipboard failures (should not fail dictation)."""
-        with DictationService(mock_config) as service:
-            with (
-                patch.object(service.audio_recorder, "record_to_file") as mock_record,
-                patch.object(
-                    service.transcriber, "transcribe_audio"
-                ) as mock_transcribe,
-                patch.object(service.clipboard, "copy_to_clipboard") as mock_copy,
-                patch("os.unlink") as mock_unlink,
-            ):
-                mock_record.return_value = Path("/tmp/test.wav")
-                mock_transcribe.return_value = mock_transcription_result
-                mock_copy.return_value = False  # Clipboard copy fails
-                mock_unlink.return_value = None
+        with (
+            patch.object(service.audio_recorder, "record_to_file") as mock_record,
+            patch.object(service.transcriber, "transcribe_audio") as mock_transcribe,
+            patch.object(service.clipboard, "copy_to_clipboard") as mock_copy,
+            patch("os.unlink") as mock_unlink,
+        ):
+            mock_record.return_value = Path("/tmp/test.wav")
+            mock_transcribe.return_value = mock_transcription_result
+            mock_copy.return_value = False  # Clipboard copy fails
+            mock_unlink.return_value = None
 
-                result = service.dictate()
+            result = service.dictate()
 
-                assert result is not None
-                assert result.text == "This is a test transcription."
-                mock_copy.assert_called_once()
+            assert result is not None
+            assert result.text == "This is a test transcription."
+            mock_copy.assert_called_once()
 
     def test_dictate_file_cleanup_on_success(
-        self, mock_config, mock_transcription_result
+        self, service, mock_transcription_result
     ):
         """Test that temporary files are cleaned up on success."""
-        with DictationService(mock_config) as service:
-            temp_file = Path("/tmp/test.wav")
-            mock_path = MagicMock(spec=Path)
-            mock_path.__str__ = PropertyMock(return_value=str(temp_file))
-            mock_path.exists.return_value = True
+        mock_path = _FakePath("/tmp/test.wav")
 
-            with (
-                patch.object(service.audio_recorder, "record_to_file") as mock_record,
-                patch.object(
-                    service.transcriber, "transcribe_audio"
-                ) as mock_transcribe,
-                patch.object(service.clipboard, "copy_to_clipboard") as mock_copy,
-            ):
-                mock_record.return_value = mock_path
-                mock_transcribe.return_value = mock_transcription_result
-                mock_copy.return_value = True
+        with (
+            patch.object(service.audio_recorder, "record_to_file") as mock_record,
+            patch.object(service.transcriber, "transcribe_audio") as mock_transcribe,
+            patch.object(service.clipboard, "copy_to_clipboard") as mock_copy,
+        ):
+            mock_record.return_value = mock_path
+            mock_transcribe.return_value = mock_transcription_result
+            mock_copy.return_value = True
 
-                result = service.dictate()
+            result = service.dictate()
 
-                assert result is not None
-                mock_path.unlink.assert_called_once()
+            assert result is not None
+            assert mock_path.unlink_calls == 1
 
-    def test_dictate_file_cleanup_on_failure(self, mock_config):
+    def test_dictate_file_cleanup_on_failure(self, service):
         """Test that temporary files are cleaned up even on failure."""
-        with DictationService(mock_config) as service:
-            temp_file = Path("/tmp/test.wav")
-            mock_path = MagicMock(spec=Path)
-            mock_path.__str__ = PropertyMock(return_value=str(temp_file))
-            mock_path.exists.return_value = True
+        mock_path = _FakePath("/tmp/test.wav")
 
-            with (
-                patch.object(service.audio_recorder, "record_to_file") as mock_record,
-                patch.object(
-                    service.transcriber, "transcribe_audio"
-                ) as mock_transcribe,
-            ):
-                mock_record.return_value = mock_path
-                mock_transcribe.side_effect = Exception("Transcription failed")
+        with (
+            patch.object(service.audio_recorder, "record_to_file") as mock_record,
+            patch.object(service.transcriber, "transcribe_audio") as mock_transcribe,
+        ):
+            mock_record.return_value = mock_path
+            mock_transcribe.side_effect = Exception("Transcription failed")
 
-                with pytest.raises(Exception):
-                    service.dictate()
+            with pytest.raises(Exception):
+                service.dictate()
 
-                mock_path.unlink.assert_called_once()
+            assert mock_path.unlink_calls == 1
 
     def test_dictate_file_cleanup_nonexistent_file(
-        self, mock_config, mock_transcription_result
+        self, service, mock_transcription_result
     ):
         """Test cleanup when file doesn't exist."""
-        with DictationService(mock_config) as service:
-            temp_file = Path("/tmp/nonexistent.wav")
-            mock_path = MagicMock(spec=Path)
-            mock_path.__str__ = PropertyMock(return_value=str(temp_file))
-            mock_path.exists.return_value = True
-            mock_path.unlink.side_effect = OSError("File not found")
+        mock_path = _FakePath(
+            "/tmp/nonexistent.wav", unlink_error=OSError("File not found")
+        )
 
-            with (
-                patch.object(service.audio_recorder, "record_to_file") as mock_record,
-                patch.object(
-                    service.transcriber, "transcribe_audio"
-                ) as mock_transcribe,
-                patch.object(service.clipboard, "copy_to_clipboard") as mock_copy,
-            ):
-                mock_record.return_value = mock_path
-                mock_transcribe.return_value = mock_transcription_result
-                mock_copy.return_value = True
+        with (
+            patch.object(service.audio_recorder, "record_to_file") as mock_record,
+            patch.object(service.transcriber, "transcribe_audio") as mock_transcribe,
+            patch.object(service.clipboard, "copy_to_clipboard") as mock_copy,
+        ):
+            mock_record.return_value = mock_path
+            mock_transcribe.return_value = mock_transcription_result
+            mock_copy.return_value = True
 
-                result = service.dictate()
+            result = service.dictate()
 
-                assert result is not None
-                mock_path.unlink.assert_called_once()
+            assert result is not None
+            assert mock_path.unlink_calls == 1
 
-    def test_get_system_info(self, mock_config):
+    def test_get_system_info(self, service):
         """Test system information gathering."""
-        with DictationService(mock_config) as service:
-            with (
-                patch.object(
-                    service.audio_recorder, "get_audio_devices"
-                ) as mock_devices,
-                patch.object(
-                    service.clipboard,
-                    "available_tools",
-                    new_callable=lambda: ["xclip", "xsel"],
-                ),
-            ):
-                mock_devices.return_value = ("default", "pulse")
+        with (
+            patch.object(service.audio_recorder, "get_audio_devices") as mock_devices,
+            patch.object(
+                service.clipboard,
+                "available_tools",
+                new_callable=lambda: ["xclip", "xsel"],
+            ),
+        ):
+            mock_devices.return_value = ("default", "pulse")
 
-                info = service.get_system_info()
+            info = service.get_system_info()
 
-                assert "audio_devices" in info
-                assert "clipboard_tools" in info
-                assert "config" in info
+            assert "audio_devices" in info
+            assert "clipboard_tools" in info
+            assert "config" in info
 
-                assert info["audio_devices"] == ("default", "pulse")
-                assert info["clipboard_tools"] == ["xclip", "xsel"]
-                assert info["config"]["audio_sample_rate"] == 16000
-                assert info["config"]["copy_to_clipboard"] is True
-                assert info["config"]["openai_model"] == "whisper-1"
+            assert info["audio_devices"] == ("default", "pulse")
+            assert info["clipboard_tools"] == ["xclip", "xsel"]
+            assert info["config"]["audio_sample_rate"] == 16000
+            assert info["config"]["copy_to_clipboard"] is True
+            assert info["config"]["openai_model"] == "whisper-1"
 
     def test_transcript_saved_with_recording_id(
         self, mock_config, mock_transcription_result
@@ -1,10 +1,15 @@
 """Tests for notification functionality."""
 
+import subprocess
 import tempfile
 import unittest
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
+import pytest
+
+import whisper_dictate.notifications as notifications
 from whisper_dictate.notifications import (
     _load_notification_id,
     send_notification,
@@ -13,6 +18,7 @@ from whisper_dictate.notifications import (
     notify_error,
     notify_info,
     notify_stopping_transcription,
+    NotificationBatcher,
     PersistentNotification,
     notify_recording_persistent_start,
     notify_recording_persistent_start_blocking,
@@ -22,241 +28,462 @@ from whisper_dictate.notifications import (
 )
 
 
-class TestSendNotification(unittest.TestCase):
-    """Test the send_notification function."""
+@pytest.fixture
+def fake_notify_iface(monkeypatch):
+    """Fake org.freedesktop.Notifications proxy recording Notify calls.
 
-    def test_send_notification_success(self):
-        """Test successful notification sending."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(returncode=0)
+    Replaces the module's cached D-Bus interface so tests assert the single
+    Notify method call instead of subprocess argv lists.
+    """
+    iface = Mock(Notify=Mock(return_value=1))
+    monkeypatch.setattr(notifications, "_iface", iface)
+    return iface
 
-            result = send_notification("Test Title", "Test Body")
-            assert result is True
 
-            mock_run.assert_called_once_with(
-                [
-                    "notify-send",
-                    "--urgency=normal",
-                    "--expire-time=5000",
-                    "Test Title",
-                    "Test Body",
-                ],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
+class _FakeRun:
+    """subprocess.run stand-in: records calls and replays a settable result.
 
-    def test_send_notification_with_urgency(self):
-        """Test notification with custom urgency."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(returncode=0)
+    A plain callable skips mock.patch's per-test target resolution and call
+    bookkeeping across the ~25 dunstify tests; assert_called_once_with is
+    kept API-compatible so assertions read the same as before.
+    """
 
-            result = send_notification("Test", "Body", urgency="critical")
-            assert result is True
+    def __init__(self):
+        self.calls: list = []
+        self.side_effect = None
+        self.set_result(stdout=b"12345\n")
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.result
+
+    def set_result(self, returncode=0, stdout=b"", stderr=b""):
+        """Set the CompletedProcess-shaped result returned to callers."""
+        self.result = SimpleNamespace(
+            returncode=returncode, stdout=stdout, stderr=stderr
+        )
 
-            mock_run.assert_called_once_with(
-                [
-                    "notify-send",
-                    "--urgency=critical",
-                    "--expire-time=5000",
-                    "Test",
-                    "Body",
-                ],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
+    def reset(self):
+        """Forget recorded calls; the configured result is kept."""
+        self.calls.clear()
 
-    def test_send_notification_with_timeout(self):
-        """Test notification with custom timeout."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(returncode=0)
+    def assert_called_once_with(self, *args, **kwargs):
+        assert len(self.calls) == 1, f"expected exactly 1 call, got {self.calls!r}"
+        assert self.calls[0] == (args, kwargs), f"unexpected call: {self.calls[0]!r}"
 
-            result = send_notification("Test", "Body", timeout=10000)
-            assert result is True
 
-            mock_run.assert_called_once_with(
-                [
-                    "notify-send",
-                    "--urgency=normal",
-                    "--expire-time=10000",
-                    "Test",
-                    "Body",
-                ],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
+@pytest.fixture
+def fake_run(monkeypatch):
+    """Install a recording subprocess.run fake (dunstify ID 12345 by default)."""
+    fake = _FakeRun()
+    monkeypatch.setattr(subprocess, "run", fake)
+    return fake
+
+
+@pytest.fixture
+def dunstify_available(monkeypatch):
+    """Report dunstify as installed without a PATH probe."""
+    monkeypatch.setattr(notifications, "is_dunstify_available", lambda: True)
+
+
+@pytest.fixture
+def dunstify_missing(monkeypatch):
+    """Report dunstify as not installed without a PATH probe."""
+    monkeypatch.setattr(notifications, "is_dunstify_available", lambda: False)
+
+
+class TestSendNotification:
+    """Test the send_notification function."""
+
+    def test_send_notification_success(self, fake_notify_iface):
+        """Test successful notification sending over D-Bus."""
+        result = send_notification("Test Title", "Test Body")
+        assert result == 1
+
+        fake_notify_iface.Notify.assert_called_once_with(
+            "whisper-dictate",
+            0,
+            "",
+            "Test Title",
+            "Test Body",
+            [],
+            {"urgency": 1, "transient": True},
+            5000,
+        )
+
+    def test_send_notification_with_urgency(self, fake_notify_iface):
+        """Test notification with custom urgency."""
+        result = send_notification("Test", "Body", urgency="critical")
+        assert result == 1
+
+        fake_notify_iface.Notify.assert_called_once_with(
+            "whisper-dictate",
+            0,
+            "",
+            "Test",
+            "Body",
+            [],
+            {"urgency": 2, "transient": True},
+            5000,
+        )
+
+    def test_send_notification_with_timeout(self, fake_notify_iface):
+        """Test notification with custom timeout."""
+        result = send_notification("Test", "Body", timeout=10000)
+        assert result == 1
+
+        fake_notify_iface.Notify.assert_called_once_with(
+            "whisper-dictate",
+            0,
+            "",
+            "Test",
+            "Body",
+            [],
+            {"urgency": 1, "transient": True},
+            10000,
+        )
 
-    def test_send_notification_no_body(self):
+    def test_send_notification_no_body(self, fake_notify_iface):
         """Test notification without body text."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(returncode=0)
+        result = send_notification("Test Title")
+        assert result == 1
+
+        fake_notify_iface.Notify.assert_called_once_with(
+            "whisper-dictate",
+            0,
+            "",
+            "Test Title",
+            "",
+            [],
+            {"urgency": 1, "transient": True},
+            5000,
+        )
+
+    def test_send_notification_replaces_id(self, fake_notify_iface):
+        """Test that replaces_id is forwarded to the Notify call."""
+        result = send_notification("Test", "Body", replaces_id=42)
+        assert result == 1
+
+        fake_notify_iface.Notify.assert_called_once_with(
+            "whisper-dictate",
+            42,
+            "",
+            "Test",
+            "Body",
+            [],
+            {"urgency": 1, "transient": True},
+            5000,
+        )
+
+    def test_send_notification_kill_switch(self, monkeypatch, fake_notify_iface):
+        """Test that the disabled notifier returns before any IPC."""
+        monkeypatch.setattr(notifications, "_NOTIFIER_DISABLED", True)
+
+        result = send_notification("Test Title", "Test Body")
+        assert result is False
+
+        fake_notify_iface.Notify.assert_not_called()
+
+    def test_send_notification_dedups_rapid_repeats(self, fake_notify_iface):
+        """Test that an identical notification inside the window skips IPC."""
+        assert send_notification("E", "x", urgency="critical") == 1
+        assert send_notification("E", "x", urgency="critical") is True
+
+        fake_notify_iface.Notify.assert_called_once()
+
+    def test_send_notification_rate_limits_floods(self, fake_notify_iface):
+        """Test that a tight notification loop is bounded by the bucket."""
+        sent = sum(
+            bool(send_notification("Flood", f"event {i}", urgency="critical"))
+            for i in range(100)
+        )
+
+        # The critical bucket holds 20 tokens; a tight loop refills almost
+        # nothing, so the vast majority of the 100 calls must be dropped.
+        assert fake_notify_iface.Notify.call_count <= 25
+        assert sent == fake_notify_iface.Notify.call_count
+
+    def test_send_notification_dbus_error(self, fake_notify_iface):
+        """Test handling of D-Bus call failures."""
+        fake_notify_iface.Notify.side_effect = Exception("ServiceUnknown")
+
+        result = send_notification("Test", "Body")
+        assert result is False
+
+    def test_send_notification_async_resolves_to_id(self, fake_notify_iface):
+        """Test that the async wrapper runs the send on the worker."""
+        future = notifications.send_notification_async("Test", "Body")
+
+        assert future.result(timeout=5) == 1
+        fake_notify_iface.Notify.assert_called_once()
 
-            result = send_notification("Test Title")
+    def test_send_notification_async_reports_failure(self, fake_notify_iface):
+        """Test that failures surface through the returned Future."""
+        fake_notify_iface.Notify.side_effect = Exception("ServiceUnknown")
+
+        future = notifications.send_notification_async("Test", "Body")
+
+        assert future.result(timeout=5) is False
+
+    def test_flush_notifications_waits_for_queued_sends(self, fake_notify_iface):
+        """Test that the flush barrier drains earlier async submissions."""
+        notifications.send_notification_async("Test", "Body")
+
+        assert notifications.flush_notifications(timeout=5) is True
+        fake_notify_iface.Notify.assert_called_once()
+
+    def test_send_notification_fallback_to_notify_send(self):
+        """Test the notify-send fallback when D-Bus is unavailable."""
+        with (
+            patch.object(notifications, "_iface", None),
+            patch.object(notifications, "_dbus_unavailable", True),
+            patch.object(notifications, "_NOTIFY_SEND", "/usr/bin/notify-send"),
+            patch.object(notifications, "_spawn_notify") as mock_spawn,
+        ):
+            mock_spawn.return_value = 0
+
+            result = send_notification("Test Title", "Test Body")
             assert result is True
 
-            mock_run.assert_called_once_with(
+            # argv[0] is the resolved absolute path, not a PATH lookup
+            mock_spawn.assert_called_once_with(
                 [
-                    "notify-send",
+                    "/usr/bin/notify-send",
                     "--urgency=normal",
                     "--expire-time=5000",
+                    "--hint=boolean:transient:true",
                     "Test Title",
-                    "",
-                ],
-                capture_output=True,
-                text=True,
-                check=False,
+                    "Test Body",
+                ]
             )
 
-    def test_send_notification_command_not_found(self):
-        """Test handling when notify-send is not available."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = FileNotFoundError()
-
+    def test_send_notification_fallback_command_not_found(self):
+        """Test that a missing notify-send short-circuits without a spawn."""
+        with (
+            patch.object(notifications, "_iface", None),
+            patch.object(notifications, "_dbus_unavailable", True),
+            patch.object(notifications, "_NOTIFY_SEND", None),
+            patch.object(notifications, "_spawn_notify") as mock_spawn,
+        ):
             result = send_notification("Test", "Body")
-            assert result is False
-
-    def test_send_notification_subprocess_error(self):
-        """Test handling of subprocess errors."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.side_effect = Exception("Subprocess error")
 
-            result = send_notification("Test", "Body")
             assert result is False
-
-    def test_send_notification_non_zero_exit(self):
-        """Test handling of non-zero exit codes."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = Mock(returncode=1)
+            mock_spawn.assert_not_called()
+
+    def test_send_notification_fallback_non_zero_exit(self):
+        """Test handling of non-zero notify-send exit codes."""
+        with (
+            patch.object(notifications, "_iface", None),
+            patch.object(notifications, "_dbus_unavailable", True),
+            patch.object(notifications, "_NOTIFY_SEND", "/usr/bin/notify-send"),
+            patch.object(notifications, "_spawn_notify") as mock_spawn,
+        ):
+            mock_spawn.return_value = 1
 
             result = send_notification("Test", "Body")
             assert result is False
 
 
-class TestNotificationHelpers:
-    """Test the notification helper functions."""
+class TestNotificationBatcher:
+    """Test the NotificationBatcher coalescer."""
 
-    def test_notify_recording_started(self):
-        """Test recording started notification."""
+    def test_batcher_coalesces_bursts(self):
+        """Test that a burst with one summary flushes as a single send."""
         with patch("whisper_dictate.notifications.send_notification") as mock_send:
-            mock_send.return_value = True
+            mock_send.return_value = 7
 
-            result = notify_recording_started()
-            assert result is True
+            batcher = NotificationBatcher()
+            for i in range(5):
+                batcher.enqueue("Dictation", f"chunk {i}")
+            batcher.flush()
 
             mock_send.assert_called_once_with(
-                summary="Dictation",
-                body="Recording started... press again to stop",
+                "Dictation",
+                "chunk 4",
                 urgency="normal",
-                timeout=3000,
+                timeout=5000,
+                replaces_id=0,
             )
 
-    def test_notify_recording_stopped_without_preview(self):
-        """Test recording stopped notification without text preview."""
+    def test_batcher_reuses_id_across_flushes(self):
+        """Test that later flushes replace the earlier popup in place."""
         with patch("whisper_dictate.notifications.send_notification") as mock_send:
-            mock_send.return_value = True
+            mock_send.return_value = 7
 
-            result = notify_recording_stopped()
-            assert result is True
+            batcher = NotificationBatcher()
+            batcher.enqueue("Dictation", "first")
+            batcher.flush()
+            batcher.enqueue("Dictation", "second")
+            batcher.flush()
 
-            mock_send.assert_called_once_with(
-                summary="Dictation",
-                body="Recording stopped and processing...",
-                urgency="normal",
-                timeout=5000,
-            )
+            assert mock_send.call_count == 2
+            assert mock_send.call_args.kwargs["replaces_id"] == 7
 
-    def test_notify_recording_stopped_with_short_preview(self):
-        """Test recording stopped notification with short text preview."""
+    def test_batcher_flushes_when_batch_full(self):
+        """Test that hitting max_batch_size flushes without waiting."""
         with patch("whisper_dictate.notifications.send_notification") as mock_send:
             mock_send.return_value = True
 
-            result = notify_recording_stopped("Short text")
-            assert result is True
+            batcher = NotificationBatcher(max_batch_size=3, max_wait_time=60.0)
+            batcher.enqueue("A", "1")
+            batcher.enqueue("B", "2")
+            assert mock_send.call_count == 0
 
-            mock_send.assert_called_once_with(
-                summary="Dictation",
-                body="Transcription: Short text",
-                urgency="normal",
-                timeout=5000,
-            )
+            batcher.enqueue("A", "3")
 
-    def test_notify_recording_stopped_with_long_preview(self):
-        """Test recording stopped notification with long text preview."""
-        with patch("whisper_dictate.notifications.send_notification") as mock_send:
-            mock_send.return_value = True
+            # Full batch: one send per unique summary, newest body wins
+            assert mock_send.call_count == 2
+            assert mock_send.call_args_list[0].args == ("A", "3")
+            assert mock_send.call_args_list[1].args == ("B", "2")
 
-            long_text = (
-                "This is a very long text that should be truncated to 50 characters"
-            )
-            expected_preview = "This is a very long text that should be truncated..."
 
-            result = notify_recording_stopped(long_text)
-            assert result is True
+class TestNotificationHelpers:
+    """Test the notification helper functions."""
 
-            mock_send.assert_called_once_with(
-                summary="Dictation",
-                body=f"Transcription: {expected_preview}",
-                urgency="normal",
-                timeout=5000,
-            )
+    @pytest.fixture(autouse=True)
+    def mock_send(self, monkeypatch):
+        """Replace send_notification once for every test in this class.
 
-    def test_notify_error(self):
-        """Test error notification."""
-        with patch("whisper_dictate.notifications.send_notification") as mock_send:
-            mock_send.return_value = True
+        Also pins the dictation-slot ID to 0 so expected replaces_id values
+        are stable regardless of test order.
+        """
+        m = Mock(return_value=True)
+        monkeypatch.setattr(notifications, "send_notification", m)
+        monkeypatch.setattr(notifications, "_last_dictation_id", 0)
+        return m
+
+    @pytest.mark.parametrize(
+        "fn,args,expected",
+        [
+            (
+                notify_recording_started,
+                (),
+                dict(
+                    summary="Dictation",
+                    body="Recording started... press again to stop",
+                    urgency="normal",
+                    timeout=3000,
+                    replaces_id=0,
+                ),
+            ),
+            (
+                notify_recording_stopped,
+                (),
+                dict(
+                    summary="Dictation",
+                    body="Recording stopped and processing...",
+                    urgency="normal",
+                    timeout=5000,
+                    replaces_id=0,
+                ),
+            ),
+            (
+                notify_recording_stopped,
+                ("Short text",),
+                dict(
+                    summary="Dictation",
+                    body="Transcription: Short text",
+                    urgency="normal",
+                    timeout=5000,
+                    replaces_id=0,
+                ),
+            ),
+            (
+                notify_error,
+                ("Something went wrong",),
+                dict(
+                    summary="Dictation Error",
+                    body="Something went wrong",
+                    urgency="critical",
+                    timeout=10000,
+                ),
+            ),
+            (
+                notify_info,
+                ("Information message",),
+                dict(
+                    summary="Dictation",
+                    body="Information message",
+                    urgency="low",
+                    timeout=3000,
+                ),
+            ),
+            (
+                notify_stopping_transcription,
+                (),
+                dict(
+                    summary="Dictation",
+                    body="Stopping recording... processing audio",
+                    urgency="normal",
+                    timeout=2000,
+                    replaces_id=0,
+                ),
+            ),
+        ],
+    )
+    def test_helper_dispatch(self, fn, args, expected, mock_send):
+        """Test that each helper forwards its fixed notification shape."""
+        assert fn(*args) is True
+        mock_send.assert_called_once_with(**expected)
+
+    def test_notify_recording_stopped_with_long_preview(self, mock_send):
+        """Test recording stopped notification with long text preview."""
+        long_text = (
+            "This is a very long text that should be truncated to 50 characters"
+        )
+        expected_preview = "This is a very long text that should be truncated..."
 
-            result = notify_error("Something went wrong")
-            assert result is True
+        result = notify_recording_stopped(long_text)
+        assert result is True
 
-            mock_send.assert_called_once_with(
-                summary="Dictation Error",
-                body="Something went wrong",
-                urgency="critical",
-                timeout=10000,
-            )
+        mock_send.assert_called_once_with(
+            summary="Dictation",
+            body=f"Transcription: {expected_preview}",
+            urgency="normal",
+            timeout=5000,
+            replaces_id=0,
+        )
 
-    def test_notify_info(self):
-        """Test info notification."""
-        with patch("whisper_dictate.notifications.send_notification") as mock_send:
-            mock_send.return_value = True
+    def test_notify_recording_stopped_boundary_52_chars(self, mock_send):
+        """Test the exact truncation boundary: 52 chars pass through."""
+        boundary_text = "a" * 52
+        assert notify_recording_stopped(boundary_text) is True
+        assert (
+            mock_send.call_args.kwargs["body"] == f"Transcription: {boundary_text}"
+        )
 
-            result = notify_info("Information message")
-            assert result is True
+        mock_send.reset_mock()
+        assert notify_recording_stopped("a" * 53) is True
+        assert (
+            mock_send.call_args.kwargs["body"]
+            == "Transcription: " + "a" * 49 + "..."
+        )
 
-            mock_send.assert_called_once_with(
-                summary="Dictation",
-                body="Information message",
-                urgency="low",
-                timeout=3000,
-            )
+    def test_lifecycle_helpers_thread_replaces_id(self, mock_send):
+        """Test that the lifecycle helpers reuse the server-assigned ID."""
+        mock_send.return_value = 42
 
-    def test_notify_stopping_transcription(self):
-        """Test stopping transcription notification."""
-        with patch("whisper_dictate.notifications.send_notification") as mock_send:
-            mock_send.return_value = True
+        assert notify_recording_started() is True
+        assert mock_send.call_args.kwargs["replaces_id"] == 0
+        assert notifications._last_dictation_id == 42
 
-            result = notify_stopping_transcription()
-            assert result is True
+        assert notify_stopping_transcription() is True
+        assert mock_send.call_args.kwargs["replaces_id"] == 42
 
-            mock_send.assert_called_once_with(
-                summary="Dictation",
-                body="Stopping recording... processing audio",
-                urgency="normal",
-                timeout=2000,
-            )
+        assert notify_recording_stopped("done") is True
+        assert mock_send.call_args.kwargs["replaces_id"] == 42
 
-    def test_notification_helpers_failure_handling(self):
+    def test_notification_helpers_failure_handling(self, mock_send):
         """Test that helper functions properly handle send_notification failures."""
-        with patch("whisper_dictate.notifications.send_notification") as mock_send:
-            mock_send.return_value = False
+        mock_send.return_value = False
 
-            assert notify_recording_started() is False
-            assert notify_recording_stopped() is False
-            assert notify_error("test") is False
-            assert notify_info("test") is False
-            assert notify_stopping_transcription() is False
+        assert notify_recording_started() is False
+        assert notify_recording_stopped() is False
+        assert notify_error("test") is False
+        assert notify_info("test") is False
+        assert notify_stopping_transcription() is False
 
 
 class TestIsDunstifyAvailable:
@@ -281,7 +508,7 @@ class TestIsDunstifyAvailable:
             mock_which.assert_called_once_with("dunstify")
 
 
-class TestPersistentNotification(unittest.TestCase):
+class TestPersistentNotification:
     """Test the PersistentNotification class."""
 
     def test_init_default_stack_tag(self):
@@ -302,13 +529,8 @@ class TestPersistentNotification(unittest.TestCase):
         assert notification.notification_id is None
         assert notification._is_active is False
 
-    @patch("whisper_dictate.notifications.is_dunstify_available")
-    @patch("subprocess.run")
-    def test_send_success(self, mock_run, mock_dunstify_available):
+    def test_send_success(self, fake_run, dunstify_available):
         """Test successful notification sending."""
-        mock_dunstify_available.return_value = True
-        mock_run.return_value = Mock(returncode=0, stdout="12345\n", stderr="")
-
         notification = PersistentNotification()
         result = notification.send("Test Title", "Test Body")
 
@@ -318,7 +540,7 @@ class TestPersistentNotification(unittest.TestCase):
         assert notification.summary == "Test Title"
         assert notification.urgency == "critical"
 
-        mock_run.assert_called_once_with(
+        fake_run.assert_called_once_with(
             [
                 "dunstify",
                 "-u",
@@ -331,25 +553,20 @@ class TestPersistentNotification(unittest.TestCase):
                 "Test Title",
                 "Test Body",
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             check=False,
         )
 
-    @patch("whisper_dictate.notifications.is_dunstify_available")
-    @patch("subprocess.run")
-    def test_send_with_custom_urgency(self, mock_run, mock_dunstify_available):
+    def test_send_with_custom_urgency(self, fake_run, dunstify_available):
         """Test sending notification with custom urgency."""
-        mock_dunstify_available.return_value = True
-        mock_run.return_value = Mock(returncode=0, stdout="12345\n", stderr="")
-
         notification = PersistentNotification()
         result = notification.send("Test Title", "Test Body", urgency="normal")
 
         assert result == "12345"
         assert notification.urgency == "normal"
 
-        mock_run.assert_called_once_with(
+        fake_run.assert_called_once_with(
             [
                 "dunstify",
                 "-u",
@@ -362,28 +579,22 @@ class TestPersistentNotification(unittest.TestCase):
                 "Test Title",
                 "Test Body",
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             check=False,
         )
 
-    @patch("whisper_dictate.notifications.is_dunstify_available")
-    def test_send_dunstify_not_available(self, mock_dunstify_available):
+    def test_send_dunstify_not_available(self, dunstify_missing):
         """Test sending when dunstify is not available."""
-        mock_dunstify_available.return_value = False
-
         notification = PersistentNotification()
         result = notification.send("Test Title", "Test Body")
 
         assert result is None
         assert notification._is_active is False
 
-    @patch("whisper_dictate.notifications.is_dunstify_available")
-    @patch("subprocess.run")
-    def test_send_failure(self, mock_run, mock_dunstify_available):
+    def test_send_failure(self, fake_run, dunstify_available):
         """Test sending notification with subprocess failure."""
-        mock_dunstify_available.return_value = True
-        mock_run.return_value = Mock(returncode=1, stdout="", stderr="Error")
+        fake_run.set_result(returncode=1, stderr=b"Error")
 
         notification = PersistentNotification()
         result = notification.send("Test Title", "Test Body")
@@ -391,12 +602,9 @@ class TestPersistentNotification(unittest.TestCase):
         assert result is None
         assert notification._is_active is False
 
-    @patch("whisper_dictate.notifications.is_dunstify_available")
-    @patch("subprocess.run")
-    def test_send_exception(self, mock_run, mock_dunstify_available):
+    def test_send_exception(self, fake_run, dunstify_available):
         """Test sending notification with exception."""
-        mock_dunstify_available.return_value = True
-        mock_run.side_effect = Exception("Subprocess error")
+        fake_run.side_effect = OSError("Subprocess error")
 
         notification = PersistentNotification()
         result = notification.send("Test Title", "Test Body")
@@ -404,25 +612,19 @@ class TestPersistentNotification(unittest.TestCase):
         assert result is None
         assert notification._is_active is False
 
-    @patch("whisper_dictate.notifications.is_dunstify_available")
-    @patch("subprocess.run")
-    def test_send_when_already_active(self, mock_run, mock_dunstify_available):
+    def test_send_when_already_active(self, fake_run, dunstify_available):
         """Test sending when notification is already active (should update)."""
-        mock_dunstify_available.return_value = True
-        mock_run.return_value = Mock(returncode=0, stdout="12345\n", stderr="")
-
         notification = PersistentNotification()
         notification.send("Test Title", "Test Body")
 
         # Reset mock to track the update call
-        mock_run.reset_mock()
-        mock_run.return_value = Mock(returncode=0, stdout="12345\n", stderr="")
+        fake_run.reset()
 
         result = notification.send("Test Title", "Updated Body")
 
         # Should call update instead of send
         assert result == "12345"
-        mock_run.assert_called_once_with(
+        fake_run.assert_called_once_with(
             [
                 "dunstify",
                 "-u",
@@ -434,29 +636,23 @@ class TestPersistentNotification(unittest.TestCase):
                 "Test Title",
                 "Updated Body",
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             check=False,
         )
 
-    @patch("whisper_dictate.notifications.is_dunstify_available")
-    @patch("subprocess.run")
-    def test_update_success(self, mock_run, mock_dunstify_available):
+    def test_update_success(self, fake_run, dunstify_available):
         """Test successful notification update."""
-        mock_dunstify_available.return_value = True
-        mock_run.return_value = Mock(returncode=0, stdout="12345\n", stderr="")
-
         notification = PersistentNotification()
         notification.send("Test Title", "Test Body")
 
         # Reset mock to track the update call
-        mock_run.reset_mock()
-        mock_run.return_value = Mock(returncode=0, stdout="12345\n", stderr="")
+        fake_run.reset()
 
         result = notification.update("Updated Body")
 
         assert result == "12345"
-        mock_run.assert_called_once_with(
+        fake_run.assert_called_once_with(
             [
                 "dunstify",
                 "-u",
@@ -468,11 +664,23 @@ class TestPersistentNotification(unittest.TestCase):
                 "Test Title",
                 "Updated Body",
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             check=False,
         )
 
+    def test_update_identical_body_skipped(self, fake_run, dunstify_available):
+        """Test that resending an unchanged body skips the subprocess."""
+        notification = PersistentNotification()
+        notification.send("Test Title", "Test Body")
+        notification.update("Updated Body")
+
+        fake_run.reset()
+        result = notification.update("Updated Body")
+
+        assert result == "12345"
+        assert fake_run.calls == []
+
     def test_update_not_active(self):
         """Test update when notification is not active."""
         notification = PersistentNotification()
@@ -491,50 +699,42 @@ class TestPersistentNotification(unittest.TestCase):
 
         assert result is None
 
-    @patch("whisper_dictate.notifications.is_dunstify_available")
-    @patch("subprocess.run")
-    def test_update_failure(self, mock_run, mock_dunstify_available):
+    def test_update_failure(self, fake_run, dunstify_available):
         """Test update with subprocess failure."""
-        mock_dunstify_available.return_value = True
-        mock_run.return_value = Mock(returncode=0, stdout="12345\n", stderr="")
-
         notification = PersistentNotification()
         notification.send("Test Title", "Test Body")
 
         # Reset mock to simulate failure
-        mock_run.reset_mock()
-        mock_run.return_value = Mock(returncode=1, stdout="", stderr="Error")
+        fake_run.reset()
+        fake_run.set_result(returncode=1, stderr=b"Error")
 
         result = notification.update("Updated Body")
 
         assert result is None
 
-    @patch("whisper_dictate.notifications.is_dunstify_available")
-    @patch("subprocess.run")
-    def test_close_success(self, mock_run, mock_dunstify_available):
+    def test_close_success(self, fake_run, dunstify_available):
         """Test successful notification close."""
-        mock_dunstify_available.return_value = True
-        mock_run.return_value = Mock(returncode=0, stdout="12345\n", stderr="")
-
         notification = PersistentNotification()
         notification.send("Test Title", "Test Body")
 
         # Reset mock to track the close call
-        mock_run.reset_mock()
-        mock_run.return_value = Mock(returncode=0)
+        fake_run.reset()
 
         result = notification.close()
 
         assert result is True
         assert notification._is_active is False
         assert notification.notification_id is None
-        mock_run.assert_called_once_with(
+        fake_run.assert_called_once_with(
             [
                 "dunstify",
                 "-C",
                 "12345",
             ],
-            capture_output=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=False,
             check=False,
         )
 
@@ -546,11 +746,8 @@ class TestPersistentNotification(unittest.TestCase):
 
         assert result is True
 
-    @patch("whisper_dictate.notifications.is_dunstify_available")
-    def test_close_dunstify_not_available(self, mock_dunstify_available):
+    def test_close_dunstify_not_available(self, dunstify_missing):
         """Test close when dunstify is not available."""
-        mock_dunstify_available.return_value = False
-
         notification = PersistentNotification()
         notification._is_active = True
         notification.notification_id = "12345"
@@ -560,19 +757,14 @@ class TestPersistentNotification(unittest.TestCase):
         assert result is True  # Returns True (nothing to close)
         assert notification._is_active is True  # Still active (couldn't close)
 
-    @patch("whisper_dictate.notifications.is_dunstify_available")
-    @patch("subprocess.run")
-    def test_close_failure(self, mock_run, mock_dunstify_available):
+    def test_close_failure(self, fake_run, dunstify_available):
         """Test close with subprocess failure."""
-        mock_dunstify_available.return_value = True
-        mock_run.return_value = Mock(returncode=0, stdout="12345\n", stderr="")
-
         notification = PersistentNotification()
         notification.send("Test Title", "Test Body")
 
         # Reset mock to simulate failure
-        mock_run.reset_mock()
-        mock_run.return_value = Mock(returncode=1)
+        fake_run.reset()
+        fake_run.set_result(returncode=1)
 
         result = notification.close()
 
@@ -580,32 +772,24 @@ class TestPersistentNotification(unittest.TestCase):
         assert notification._is_active is False
         assert notification.notification_id is None
 
-    @patch("whisper_dictate.notifications.is_dunstify_available")
-    @patch("subprocess.run")
-    def test_close_exception(self, mock_run, mock_dunstify_available):
+    def test_close_exception(self, fake_run, dunstify_available):
         """Test close with exception."""
-        mock_dunstify_available.return_value = True
-        mock_run.return_value = Mock(returncode=0, stdout="12345\n", stderr="")
-
         notification = PersistentNotification()
         notification.send("Test Title", "Test Body")
 
         # Reset mock to simulate exception
-        mock_run.reset_mock()
-        mock_run.side_effect = Exception("Subprocess error")
+        fake_run.reset()
+        fake_run.side_effect = OSError("Subprocess error")
 
         result = notification.close()
 
         assert result is False
         assert notification._is_active is False
 
-    @patch("whisper_dictate.notifications.is_dunstify_available")
-    @patch("subprocess.run")
-    def test_send_action_callback_returns_stop(self, mock_run, mock_dunstify_available):
+    def test_send_action_callback_returns_stop(self, fake_run, dunstify_available):
         """Test that send() returns 'stop' when user clicks action button."""
-        mock_dunstify_available.return_value = True
         # Simulate user clicking the stop action button - dunstify returns "stop"
-        mock_run.return_value = Mock(returncode=0, stdout="stop\n", stderr="")
+        fake_run.set_result(stdout=b"stop\n")
 
         notification = PersistentNotification()
         result = notification.send("Test Title", "Test Body")
@@ -614,35 +798,27 @@ class TestPersistentNotification(unittest.TestCase):
         # Notification should be closed
         assert notification._is_active is False
 
-    @patch("whisper_dictate.notifications.is_dunstify_available")
-    @patch("subprocess.run")
-    def test_send_blocking_mode_adds_wait_flag(self, mock_run, mock_dunstify_available):
+    def test_send_blocking_mode_adds_wait_flag(self, fake_run, dunstify_available):
         """Test that -w flag is added when wait_for_action=True."""
-        mock_dunstify_available.return_value = True
-        mock_run.return_value = Mock(returncode=0, stdout="12345\n", stderr="")
-
         notification = PersistentNotification()
         result = notification.send("Test Title", "Test Body", wait_for_action=True)
 
         assert result == "12345"
         # Verify -w flag is in the command
-        call_args = mock_run.call_args[0][0]
+        call_args = fake_run.calls[0][0][0]
         assert "-w" in call_args
 
-    @patch("whisper_dictate.notifications.is_dunstify_available")
-    @patch("subprocess.run")
-    def test_send_empty_dunstify_output(self, mock_run, mock_dunstify_available):
+    def test_send_empty_dunstify_output(self, fake_run, dunstify_available, caplog):
         """Test send() when dunstify returns empty stdout."""
-        mock_dunstify_available.return_value = True
-        mock_run.return_value = Mock(stdout="", stderr="", returncode=0)
+        fake_run.set_result()
 
         notification = PersistentNotification()
-        with self.assertLogs("whisper_dictate.notifications", level="ERROR") as cm:
+        with caplog.at_level("ERROR", logger="whisper_dictate.notifications"):
             result = notification.send("Test", "Message")
 
         assert result is None
         assert notification._consecutive_failures == 1
-        assert "empty" in cm.output[0].lower()
+        assert "empty" in caplog.text.lower()
 
 
 class TestLoadNotificationId(unittest.TestCase):
@@ -701,19 +877,14 @@ class TestLoadNotificationId(unittest.TestCase):
 class TestPersistentNotificationHelpers:
     """Test the persistent notification helper functions."""
 
-    @patch("whisper_dictate.notifications.is_dunstify_available")
-    @patch("subprocess.run")
     def test_notify_recording_persistent_start_success(
-        self, mock_run, mock_dunstify_available
+        self, fake_run, dunstify_available
     ):
         """Test starting persistent notification."""
-        mock_dunstify_available.return_value = True
-        mock_run.return_value = Mock(returncode=0, stdout="12345\n", stderr="")
-
         result = notify_recording_persistent_start()
 
         assert result is True
-        mock_run.assert_called_once_with(
+        fake_run.assert_called_once_with(
             [
                 "dunstify",
                 "-u",
@@ -726,39 +897,31 @@ class TestPersistentNotificationHelpers:
                 "Dictation",
                 "Recording in progress... press again to stop\nOr use context menu (Ctrl+Shift+.) to stop",
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             check=False,
         )
 
-    @patch("whisper_dictate.notifications.is_dunstify_available")
-    def test_notify_recording_persistent_start_failure(self, mock_dunstify_available):
+    def test_notify_recording_persistent_start_failure(self, dunstify_missing):
         """Test starting persistent notification when dunstify not available."""
-        mock_dunstify_available.return_value = False
-
         result = notify_recording_persistent_start()
 
         assert result is False
 
-    @patch("whisper_dictate.notifications.is_dunstify_available")
-    @patch("subprocess.run")
     def test_notify_recording_persistent_start_blocking_success(
-        self, mock_run, mock_dunstify_available
+        self, fake_run, dunstify_available
     ):
         """Test blocking persistent notification returns notification ID on success."""
-        mock_dunstify_available.return_value = True
-        mock_run.return_value = Mock(returncode=0, stdout="12345\n", stderr="")
-
         import whisper_dictate.notifications as notifications
 
         # Reset global state
-        notifications._recording_notification = None
+        notifications.set_recording_notification(None)
 
         result = notify_recording_persistent_start_blocking()
 
         assert result == "12345"
         # Verify wait_for_action=True is passed (should include -w flag)
-        mock_run.assert_called_once_with(
+        fake_run.assert_called_once_with(
             [
                 "dunstify",
                 "-u",
@@ -772,66 +935,57 @@ class TestPersistentNotificationHelpers:
                 "Dictation",
                 "Recording in progress... click Stop Recording to end",
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             check=False,
         )
 
-    @patch("whisper_dictate.notifications.is_dunstify_available")
-    @patch("subprocess.run")
     def test_notify_recording_persistent_start_blocking_returns_stop(
-        self, mock_run, mock_dunstify_available
+        self, fake_run, dunstify_available
     ):
         """Test blocking persistent notification returns 'stop' when user clicks action."""
-        mock_dunstify_available.return_value = True
         # Simulate user clicking the stop action button
-        mock_run.return_value = Mock(returncode=0, stdout="stop\n", stderr="")
+        fake_run.set_result(stdout=b"stop\n")
 
         import whisper_dictate.notifications as notifications
 
         # Reset global state
-        notifications._recording_notification = None
+        notifications.set_recording_notification(None)
 
         result = notify_recording_persistent_start_blocking()
 
         assert result == "stop"
 
-    @patch("whisper_dictate.notifications.is_dunstify_available")
     def test_notify_recording_persistent_start_blocking_failure(
-        self, mock_dunstify_available
+        self, dunstify_missing
     ):
         """Test blocking persistent notification when dunstify not available."""
-        mock_dunstify_available.return_value = False
-
         import whisper_dictate.notifications as notifications
 
         # Reset global state
-        notifications._recording_notification = None
+        notifications.set_recording_notification(None)
 
         result = notify_recording_persistent_start_blocking()
 
         assert result is None
 
-    @patch("whisper_dictate.notifications.is_dunstify_available")
-    @patch("subprocess.run")
     def test_notify_recording_persistent_update_success(
-        self, mock_run, mock_dunstify_available
+        self, fake_run, dunstify_available
     ):
         """Test updating persistent notification."""
-        mock_dunstify_available.return_value = True
-        mock_run.return_value = Mock(returncode=0, stdout="12345\n", stderr="")
 
         # First start the notification
         notify_recording_persistent_start()
 
         # Reset mock to track the update call
-        mock_run.reset_mock()
-        mock_run.return_value = Mock(returncode=0, stdout="12345\n", stderr="")
+        fake_run.reset()
 
         result = notify_recording_persistent_update("Test transcription text")
 
         assert result is True
-        mock_run.assert_called_once_with(
+        # Coalesced: the dunstify call happens at flush time
+        assert notifications._update_coalescer.flush() is True
+        fake_run.assert_called_once_with(
             [
                 "dunstify",
                 "-u",
@@ -843,33 +997,29 @@ class TestPersistentNotificationHelpers:
                 "Dictation",
                 "Recording... Test transcription text",
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             check=False,
         )
 
-    @patch("whisper_dictate.notifications.is_dunstify_available")
-    @patch("subprocess.run")
     def test_notify_recording_persistent_update_long_text(
-        self, mock_run, mock_dunstify_available
+        self, fake_run, dunstify_available
     ):
         """Test updating with long text (should be truncated)."""
-        mock_dunstify_available.return_value = True
-        mock_run.return_value = Mock(returncode=0, stdout="12345\n", stderr="")
 
         # First start the notification
         notify_recording_persistent_start()
 
         # Reset mock to track the update call
-        mock_run.reset_mock()
-        mock_run.return_value = Mock(returncode=0, stdout="12345\n", stderr="")
+        fake_run.reset()
 
         long_text = "a" * 150
         result = notify_recording_persistent_update(long_text)
 
         assert result is True
+        assert notifications._update_coalescer.flush() is True
         expected_preview = "a" * 100 + "..."
-        mock_run.assert_called_once_with(
+        fake_run.assert_called_once_with(
             [
                 "dunstify",
                 "-u",
@@ -881,8 +1031,8 @@ class TestPersistentNotificationHelpers:
                 "Dictation",
                 f"Recording... {expected_preview}",
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             check=False,
         )
 
@@ -891,38 +1041,36 @@ class TestPersistentNotificationHelpers:
         # Reset the global notification state
         import whisper_dictate.notifications as notifications
 
-        notifications._recording_notification = None
+        notifications.set_recording_notification(None)
 
         result = notify_recording_persistent_update("Test text")
 
         assert result is False
 
-    @patch("whisper_dictate.notifications.is_dunstify_available")
-    @patch("subprocess.run")
     def test_notify_recording_persistent_stop_success(
-        self, mock_run, mock_dunstify_available
+        self, fake_run, dunstify_available
     ):
         """Test stopping persistent notification."""
-        mock_dunstify_available.return_value = True
-        mock_run.return_value = Mock(returncode=0, stdout="12345\n", stderr="")
 
         # First start the notification
         notify_recording_persistent_start()
 
         # Reset mock to track the close call
-        mock_run.reset_mock()
-        mock_run.return_value = Mock(returncode=0)
+        fake_run.reset()
 
         result = notify_recording_persistent_stop()
 
         assert result is True
-        mock_run.assert_called_once_with(
+        fake_run.assert_called_once_with(
             [
                 "dunstify",
                 "-C",
                 "12345",
             ],
-            capture_output=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=False,
             check=False,
         )
 
@@ -945,9 +1093,7 @@ class TestNotificationLifecycleIntegration:
     - Stop recording -> notification closes
     """
 
-    @patch("whisper_dictate.notifications.is_dunstify_available")
-    @patch("subprocess.run")
-    def test_full_notification_lifecycle(self, mock_run, mock_dunstify_available):
+    def test_full_notification_lifecycle(self, fake_run, dunstify_available):
         """
         Test the complete notification lifecycle.
 
@@ -959,29 +1105,27 @@ class TestNotificationLifecycleIntegration:
         import whisper_dictate.notifications as notifications
 
         # Setup: dunstify is available
-        mock_dunstify_available.return_value = True
 
         # Reset global state
-        notifications._recording_notification = None
+        notifications.set_recording_notification(None)
 
         # Phase 1: Start recording - notification should appear
-        mock_run.return_value = Mock(returncode=0, stdout="12345\n", stderr="")
 
         result_start = notify_recording_persistent_start()
 
         assert result_start is True, "Start notification should succeed"
-        assert notifications._recording_notification is not None, (
+        assert notifications.get_recording_notification() is not None, (
             "Global notification should be set"
         )
-        assert notifications._recording_notification._is_active is True, (
+        assert notifications.get_recording_notification()._is_active is True, (
             "Notification should be active"
         )
-        assert notifications._recording_notification.notification_id == "12345", (
+        assert notifications.get_recording_notification().notification_id == "12345", (
             "Notification ID should be captured"
         )
 
         # Verify the start call
-        mock_run.assert_called_once_with(
+        fake_run.assert_called_once_with(
             [
                 "dunstify",
                 "-u",
@@ -994,24 +1138,26 @@ class TestNotificationLifecycleIntegration:
                 "Dictation",
                 "Recording in progress... press again to stop\nOr use context menu (Ctrl+Shift+.) to stop",
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             check=False,
         )
 
         # Phase 2: Update recording - notification should update
-        mock_run.reset_mock()
-        mock_run.return_value = Mock(returncode=0, stdout="12345\n", stderr="")
+        fake_run.reset()
 
         result_update = notify_recording_persistent_update("Test transcription text")
 
         assert result_update is True, "Update notification should succeed"
-        assert notifications._recording_notification._is_active is True, (
+        assert notifications._update_coalescer.flush() is True, (
+            "Coalesced update should flush through"
+        )
+        assert notifications.get_recording_notification()._is_active is True, (
             "Notification should still be active"
         )
 
         # Verify the update call
-        mock_run.assert_called_once_with(
+        fake_run.assert_called_once_with(
             [
                 "dunstify",
                 "-u",
@@ -1023,70 +1169,58 @@ class TestNotificationLifecycleIntegration:
                 "Dictation",
                 "Recording... Test transcription text",
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             check=False,
         )
 
         # Phase 3: Stop recording - notification should close
-        mock_run.reset_mock()
-        mock_run.return_value = Mock(returncode=0)
+        fake_run.reset()
 
         result_stop = notify_recording_persistent_stop()
 
         assert result_stop is True, "Stop notification should succeed"
-        assert notifications._recording_notification is None, (
+        assert notifications.get_recording_notification() is None, (
             "Global notification should be cleared"
         )
 
         # Verify the close call
-        mock_run.assert_called_once_with(
+        fake_run.assert_called_once_with(
             [
                 "dunstify",
                 "-C",
                 "12345",
             ],
-            capture_output=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=False,
             check=False,
         )
 
-    @patch("whisper_dictate.notifications.is_dunstify_available")
-    @patch("subprocess.run")
-    def test_lifecycle_with_multiple_updates(self, mock_run, mock_dunstify_available):
+    def test_lifecycle_with_multiple_updates(self, fake_run, dunstify_available):
         """
         Test lifecycle with multiple updates between start and stop.
         """
         import whisper_dictate.notifications as notifications
 
-        mock_dunstify_available.return_value = True
-        notifications._recording_notification = None
+        notifications.set_recording_notification(None)
 
         # Start
-        mock_run.return_value = Mock(returncode=0, stdout="12345\n", stderr="")
         notify_recording_persistent_start()
 
-        # First update
-        mock_run.reset_mock()
-        mock_run.return_value = Mock(returncode=0, stdout="12345\n", stderr="")
-        result1 = notify_recording_persistent_update("First update")
-        assert result1 is True
-
-        # Second update
-        mock_run.reset_mock()
-        mock_run.return_value = Mock(returncode=0, stdout="12345\n", stderr="")
-        result2 = notify_recording_persistent_update("Second update")
-        assert result2 is True
-
-        # Third update with long text (should be truncated)
-        mock_run.reset_mock()
-        mock_run.return_value = Mock(returncode=0, stdout="12345\n", stderr="")
+        # Rapid updates coalesce: only the newest text reaches dunstify
+        fake_run.reset()
+        assert notify_recording_persistent_update("First update") is True
+        assert notify_recording_persistent_update("Second update") is True
         long_text = "a" * 150
-        result3 = notify_recording_persistent_update(long_text)
-        assert result3 is True
+        assert notify_recording_persistent_update(long_text) is True
+
+        assert notifications._update_coalescer.flush() is True
 
-        # Verify truncation
+        # Verify the single coalesced call carries the truncated latest text
         expected_preview = "a" * 100 + "..."
-        mock_run.assert_called_once_with(
+        fake_run.assert_called_once_with(
             [
                 "dunstify",
                 "-u",
@@ -1098,26 +1232,23 @@ class TestNotificationLifecycleIntegration:
                 "Dictation",
                 f"Recording... {expected_preview}",
             ],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             check=False,
         )
 
         # Stop
-        mock_run.reset_mock()
-        mock_run.return_value = Mock(returncode=0)
+        fake_run.reset()
         result_stop = notify_recording_persistent_stop()
         assert result_stop is True
 
-    @patch("whisper_dictate.notifications.is_dunstify_available")
-    def test_lifecycle_dunstify_not_available(self, mock_dunstify_available):
+    def test_lifecycle_dunstify_not_available(self, dunstify_missing):
         """
         Test that lifecycle handles dunstify not being available gracefully.
         """
         import whisper_dictate.notifications as notifications
 
-        mock_dunstify_available.return_value = False
-        notifications._recording_notification = None
+        notifications.set_recording_notification(None)
 
         # Start should fail gracefully
         result_start = notify_recording_persistent_start()
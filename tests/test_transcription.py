@@ -54,7 +54,8 @@ class TestWhisperTranscriber:
 
         assert isinstance(result, TranscriptionResult)
         assert result.text == "This is a test transcription."
-        assert result.language == "en"
+        # Plain json responses never carry a language, so none is reported
+        assert result.language is None
 
         # Verify API call
         mock_openai_client.audio.transcriptions.create.assert_called_once()
@@ -62,6 +63,19 @@ class TestWhisperTranscriber:
         assert call_args[1]["model"] == "whisper-1"
         assert call_args[1]["response_format"] == "json"
 
+    def test_transcribe_audio_with_need_language(
+        self, temp_audio_file, mock_openai_client
+    ):
+        """need_language requests verbose_json and reads the language field."""
+        config = OpenAIConfig(api_key="test-key", need_language=True)
+        transcriber = WhisperTranscriber(config, client=mock_openai_client)
+
+        result = transcriber.transcribe_audio(temp_audio_file)
+
+        assert result.language == "en"
+        call_args = mock_openai_client.audio.transcriptions.create.call_args
+        assert call_args[1]["response_format"] == "verbose_json"
+
     def test_transcribe_audio_file_not_found(self, mock_openai_client):
         """Test transcription with non-existent file."""
         config = OpenAIConfig(api_key="test-key")
@@ -113,3 +127,55 @@ class TestWhisperTranscriber:
 
             with pytest.raises(IOError, match="Cannot read file"):
                 transcriber.transcribe_audio(audio_file)
+
+
+class TestProviderSubmit:
+    """Test the pipelined submit() API on the provider base class."""
+
+    def test_submit_resolves_to_transcribe_result(self):
+        from whisper_dictate.providers.openai_compatible import (
+            OpenAICompatibleProvider,
+        )
+
+        provider = OpenAICompatibleProvider(api_key="test-key")
+        expected = TranscriptionResult(text="pipelined")
+        provider.transcribe_audio = Mock(return_value=expected)
+
+        future = provider.submit(Path("clip.wav"))
+
+        assert future.result(timeout=5) is expected
+        provider.transcribe_audio.assert_called_once_with(Path("clip.wav"))
+        provider.close()
+        assert provider._submit_pool is None
+
+    def test_close_without_submit_is_a_noop(self):
+        from whisper_dictate.providers.openai_compatible import (
+            OpenAICompatibleProvider,
+        )
+
+        provider = OpenAICompatibleProvider(api_key="test-key")
+        provider.close()
+        provider.close()
+
+
+class TestMergeSegmentTexts:
+    """Test overlap deduplication when merging segmented transcripts."""
+
+    def test_merge_drops_overlap_duplicates(self):
+        from whisper_dictate.providers.openai_compatible import _merge_segment_texts
+
+        merged = _merge_segment_texts(
+            ["the quick brown fox jumps", "Fox jumps over the lazy dog"]
+        )
+        assert merged == "the quick brown fox jumps over the lazy dog"
+
+    def test_merge_without_overlap_keeps_everything(self):
+        from whisper_dictate.providers.openai_compatible import _merge_segment_texts
+
+        merged = _merge_segment_texts(["first segment.", "second segment."])
+        assert merged == "first segment. second segment."
+
+    def test_merge_handles_empty_segments(self):
+        from whisper_dictate.providers.openai_compatible import _merge_segment_texts
+
+        assert _merge_segment_texts(["", "hello world", ""]) == "hello world"
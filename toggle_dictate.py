@@ -4,10 +4,14 @@ Fixed toggle dictation for i3 - proper real-time recording with immediate start/
 With database integration for persistence and state management.
 """
 
+import concurrent.futures
+import fcntl
 import os
 import sys
+import threading
 import time
 import logging
+import logging.handlers
 import signal
 import subprocess
 import soundfile as sf
@@ -31,9 +35,12 @@ from whisper_dictate.database import get_database
 from whisper_dictate.audio_storage import get_audio_storage
 
 # State and process tracking
-# Note: Using database for state management (preferred), with file fallbacks for compatibility
-STATE_FILE = Path.home() / ".whisper-dictate-state"
-PID_FILE = Path.home() / ".whisper-dictate-pid"
+# Note: Using database for state management (preferred), with a lock-file
+# fallback for compatibility. Recording liveness is a flock held on
+# LOCK_FILE: the locked fd is inherited by arecord, so the kernel drops
+# the lock the instant the recorder exits - even on SIGKILL - leaving no
+# stale state behind. The recorder PID is stored in the same file.
+LOCK_FILE = Path.home() / ".whisper-dictate.lock"
 AUDIO_FILE = Path.home() / ".whisper-dictate-audio.wav"
 
 # Database state keys
@@ -52,6 +59,14 @@ def setup_logging():
     """
     from pathlib import Path
 
+    # None of the formats below use process/thread names or caller
+    # source info; disabling their collection skips a sys._getframe
+    # walk and two lookups on every LogRecord
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
+
     # Create log directory
     log_dir = Path.home() / ".local" / "share" / "whisper-dictate"
     log_dir.mkdir(parents=True, exist_ok=True)
@@ -71,17 +86,22 @@ def setup_logging():
     # Clear existing handlers to avoid duplicates
     root_logger.handlers.clear()
 
-    # File handler
+    # File handler, wrapped in a MemoryHandler so records hit disk in
+    # batches (or immediately on ERROR); logging.shutdown() flushes the
+    # remainder at exit
     file_handler = logging.FileHandler(log_file)
     file_handler.setLevel(logging.INFO)
     file_handler.setFormatter(formatter)
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        capacity=64, flushLevel=logging.ERROR, target=file_handler
+    )
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
 
-    root_logger.addHandler(file_handler)
+    root_logger.addHandler(buffered_file_handler)
     root_logger.addHandler(console_handler)
 
 
@@ -114,50 +134,84 @@ def is_recording():
             return True
         logging.debug("Database reports not recording, checking file-based state")
     except Exception as e:
-        logging.warning(f"Failed to check database state, falling back to files: {e}")
+        logging.warning("Failed to check database state, falling back to files: %s", e)
     finally:
         if db is not None:
             db.close()
 
-    # Fallback to file-based state (legacy compatibility)
-    file_state = PID_FILE.exists() and STATE_FILE.exists()
-    if file_state:
-        logging.info("Recording detected via file-based fallback")
-    return file_state
+    # Fallback: a held flock means the recorder process (which inherited
+    # the locked fd) is still alive. One flock syscall replaces the old
+    # two-file stat dance and cannot go stale after a crash.
+    try:
+        fd = os.open(LOCK_FILE, os.O_RDONLY)
+    except FileNotFoundError:
+        return False
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        logging.info("Recording detected via lock-file fallback")
+        return True
+    finally:
+        os.close(fd)
+    return False
 
 
 def get_recording_pid():
-    """Get the PID of the recording process."""
+    """Get the PID of the recording process from the lock file."""
     try:
-        if PID_FILE.exists():
-            return int(PID_FILE.read_text().strip())
+        fd = os.open(LOCK_FILE, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        return int(os.pread(fd, 32, 0).strip()) or None
     except (ValueError, OSError):
-        pass
-    return None
+        return None
+    finally:
+        os.close(fd)
 
 
 def start_background_recording(config):
     """Start background recording process using arecord."""
     db = None
+    lock_fd = None
     try:
-        # Build the command - use default device
+        # Take the recording lock before spawning; if another toggle's
+        # recorder still holds it, there is nothing to start
+        lock_fd = os.open(LOCK_FILE, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            logging.warning("Recording lock already held, not starting")
+            return None
+
+        # Build the command - use default device. 16 kHz mono matches what
+        # Whisper resamples to internally; recording CD-quality stereo only
+        # multiplies the upload size (~5.5x) for no accuracy gain.
         cmd = [
             "arecord",
             "-f",
-            "cd",  # CD quality: 16-bit little-endian, 44100Hz, stereo
+            "S16_LE",
+            "-r",
+            "16000",
+            "-c",
+            "1",
             "-t",
             "wav",
             str(AUDIO_FILE),
         ]
 
-        # Start the recording process
+        # Start the recording process. arecord inherits the locked fd,
+        # so the lock lives exactly as long as the recorder does.
         process = subprocess.Popen(
-            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            pass_fds=(lock_fd,),
         )
 
-        # Save PID for later management
-        PID_FILE.write_text(str(process.pid))
-        STATE_FILE.touch()
+        # Save PID for later management (same file as the lock)
+        os.ftruncate(lock_fd, 0)
+        os.pwrite(lock_fd, f"{process.pid}\n".encode("ascii"), 0)
 
         # Create recording entry in database
         recording_id = None
@@ -168,15 +222,15 @@ def start_background_recording(config):
                 file_path=str(AUDIO_FILE),
                 duration=None,  # Will be updated on stop
                 format="wav",  # toggle_dictate.py always records WAV
-                sample_rate=44100,
-                channels=2,
+                sample_rate=16000,
+                channels=1,
             )
             # Set state in database
             db.set_state(STATE_KEY_RECORDING, True)
             db.set_state(STATE_KEY_RECORDING_ID, recording_id)
-            logging.debug(f"Created database recording entry with ID: {recording_id}")
+            logging.debug("Created database recording entry with ID: %s", recording_id)
         except Exception as e:
-            logging.warning(f"Failed to create database recording entry: {e}")
+            logging.warning("Failed to create database recording entry: %s", e)
 
         logging.info("Recording started")
         notify_recording_start()
@@ -184,11 +238,16 @@ def start_background_recording(config):
         return process
 
     except Exception as e:
-        logging.error(f"Failed to start recording: {e}")
+        logging.error("Failed to start recording: %s", e)
         notify_error(f"Failed to start recording: {e}")
         return None
 
     finally:
+        # The parent's copy of the lock fd is closed either way; the lock
+        # itself is kept by arecord's inherited copy (or released here if
+        # the spawn failed)
+        if lock_fd is not None:
+            os.close(lock_fd)
         # Always close database connection
         if db is not None:
             db.close()
@@ -210,25 +269,28 @@ def stop_background_recording():
             db, _ = get_db_and_storage()
             recording_id = db.get_state(STATE_KEY_RECORDING_ID)
         except Exception as e:
-            logging.debug(f"Failed to get recording_id: {e}")
+            logging.debug("Failed to get recording_id: %s", e)
 
         pid = get_recording_pid()
         if pid:
-            # Kill the recording process
+            # Kill the recording process. arecord normally exits within a
+            # few ms of SIGTERM, so poll for it going away instead of a
+            # flat sleep; SIGKILL only fires if it is still alive after
+            # 200 ms. The process is not our child (it was spawned by the
+            # previous toggle invocation), so waitpid is not an option.
             try:
                 os.kill(pid, signal.SIGTERM)
-                time.sleep(0.5)  # Give it time to stop
-                os.kill(pid, signal.SIGKILL)  # Force kill if needed
+                deadline = time.monotonic() + 0.2
+                while time.monotonic() < deadline:
+                    time.sleep(0.01)
+                    os.kill(pid, 0)  # Raises ProcessLookupError once gone
+                os.kill(pid, signal.SIGKILL)  # Force kill on timeout
             except ProcessLookupError:
                 pass  # Process already dead
 
-            # Clean up PID file
-            if PID_FILE.exists():
-                PID_FILE.unlink()
-
-        # Clean up state file
-        if STATE_FILE.exists():
-            STATE_FILE.unlink()
+        # No lock-file cleanup needed: the kernel released the flock when
+        # the recorder's fd closed, and the stale PID bytes are
+        # overwritten by the next start
 
         # Clear database state (reuse db connection if available)
         try:
@@ -237,12 +299,12 @@ def stop_background_recording():
             db.set_state(STATE_KEY_RECORDING, False)
             db.delete_state(STATE_KEY_RECORDING_ID)
         except Exception as e:
-            logging.debug(f"Failed to clear database state: {e}")
+            logging.debug("Failed to clear database state: %s", e)
 
         return True, recording_id
 
     except Exception as e:
-        logging.error(f"Error stopping recording: {e}")
+        logging.error("Error stopping recording: %s", e)
         return False, None
 
     finally:
@@ -251,14 +313,21 @@ def stop_background_recording():
             db.close()
 
 
-def transcribe_audio(config, recording_id=None):
+def transcribe_audio(config, recording_id=None, transcriber=None):
     """Transcribe the recorded audio.
 
+    The network upload is the long pole, so it is started on a worker
+    thread first; the persistent-storage copy and database bookkeeping
+    below run while the request is in flight instead of delaying it.
+
     Args:
         config: Configuration object
         recording_id: Optional recording ID. If not provided, will attempt to get from state.
+        transcriber: Optional pre-built (and ideally pre-warmed) transcriber.
+                     A fresh one is created if not provided.
     """
     db = None
+    executor = None
     try:
         if not AUDIO_FILE.exists():
             logging.error("No audio file found")
@@ -266,6 +335,31 @@ def transcribe_audio(config, recording_id=None):
 
         logging.info("Starting transcription")
 
+        # Probe the duration once up front: it picks the upload strategy
+        # here and feeds the database update further down
+        duration = None
+        try:
+            duration = sf.info(AUDIO_FILE).duration
+        except Exception as e:
+            logging.warning("Failed to probe recording duration: %s", e)
+
+        # Kick off the upload immediately from the just-recorded file; the
+        # persistent-storage copy below duplicates the same audio, so the
+        # transcription does not need to wait for it. Long recordings go
+        # through the segmented concurrent upload when the provider has one.
+        if transcriber is None:
+            transcriber = create_transcriber(config.openai)
+        transcribe = transcriber.transcribe_audio
+        if duration is not None and duration > 20.0:
+            batched = getattr(transcriber, "transcribe_audio_batched", None)
+            if batched is not None:
+                logging.info(
+                    "Long recording (%.1fs), using segmented upload", duration
+                )
+                transcribe = batched
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        transcription_future = executor.submit(transcribe, AUDIO_FILE)
+
         # Get database and audio storage
         db, audio_storage = get_db_and_storage()
 
@@ -278,7 +372,7 @@ def transcribe_audio(config, recording_id=None):
         relative_path = None
         try:
             saved_path, relative_path = audio_storage.save_audio(AUDIO_FILE)
-            logging.info(f"Audio saved to persistent storage: {saved_path}")
+            logging.info("Audio saved to persistent storage: %s", saved_path)
 
             # Update recording entry with file path
             if recording_id and relative_path:
@@ -287,28 +381,25 @@ def transcribe_audio(config, recording_id=None):
                     (relative_path, recording_id),
                 )
         except Exception as e:
-            logging.warning(f"Failed to save audio to persistent storage: {e}")
-
-        # Transcribe audio
-        transcriber = create_transcriber(config.openai)
-        audio_to_transcribe = saved_path if saved_path else AUDIO_FILE
+            logging.warning("Failed to save audio to persistent storage: %s", e)
 
-        # Calculate and update recording duration
-        if recording_id:
+        # Update recording duration (probed before the upload started)
+        if recording_id and duration is not None:
             try:
-                audio_info = sf.info(audio_to_transcribe)
-                duration = audio_info.duration
                 db.execute(
                     "UPDATE recordings SET duration = ? WHERE id = ?",
                     (duration, recording_id),
                 )
                 logging.debug(
-                    f"Updated recording {recording_id} with duration: {duration:.2f}s"
+                    "Updated recording %s with duration: %.2fs",
+                    recording_id,
+                    duration,
                 )
             except Exception as e:
-                logging.warning(f"Failed to calculate recording duration: {e}")
+                logging.warning("Failed to update recording duration: %s", e)
 
-        result = transcriber.transcribe_audio(audio_to_transcribe)
+        # Join the upload started before the bookkeeping above
+        result = transcription_future.result()
 
         # Create transcript entry
         if recording_id:
@@ -320,25 +411,34 @@ def transcribe_audio(config, recording_id=None):
                     model_used=config.openai.model,
                     confidence=None,  # Whisper API doesn't always provide this
                 )
-                logging.debug(f"Created transcript entry for recording {recording_id}")
+                logging.debug("Created transcript entry for recording %s", recording_id)
             except Exception as e:
-                logging.warning(f"Failed to create transcript entry: {e}")
+                logging.warning("Failed to create transcript entry: %s", e)
 
-        # Copy to clipboard
+        # Copy to clipboard on a side thread so it runs concurrently with
+        # the completion notification below; both spawn external helpers
+        # (xclip / dunstify) and neither depends on the other
         clipboard = ClipboardManager()
-        clipboard.copy_to_clipboard(result.text)
+        clipboard_thread = threading.Thread(
+            target=clipboard.copy_to_clipboard, args=(result.text,)
+        )
+        clipboard_thread.start()
 
-        logging.info(f"Transcription completed: {result.text}")
+        logging.info("Transcription completed: %s", result.text)
         notify_recording_stopped(result.text)
 
+        clipboard_thread.join()
+
         return result.text
 
     except Exception as e:
-        logging.error(f"Transcription error: {e}")
+        logging.error("Transcription error: %s", e)
         notify_error(f"Transcription failed: {e}")
         return None
 
     finally:
+        if executor is not None:
+            executor.shutdown(wait=False)
         # Close database connection
         if db is not None:
             db.close()
@@ -362,12 +462,17 @@ def main():
 
         if is_recording():
             logging.info("Stopping recording...")
+            # Build the transcriber now and open its TLS connection on a
+            # side thread: the handshake (1-3 RTTs) runs while the
+            # recorder shuts down instead of delaying the upload
+            transcriber = create_transcriber(config.openai)
+            threading.Thread(target=transcriber.warm_up, daemon=True).start()
             notify_stopping_transcription()
             if not notify_recording_stop():
                 logging.warning("Failed to replace persistent notification")
             success, recording_id = stop_background_recording()
             if success:
-                transcribe_audio(config, recording_id)
+                transcribe_audio(config, recording_id, transcriber=transcriber)
             else:
                 logging.error("Failed to stop recording properly")
         else:
@@ -378,7 +483,7 @@ def main():
                 sys.exit(1)
 
     except Exception as e:
-        logging.error(f"Error: {e}")
+        logging.error("Error: %s", e)
         notify_error(str(e))
         # Clean up on error
         stop_background_recording()
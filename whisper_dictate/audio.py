@@ -1,7 +1,9 @@
 """Audio recording functionality with strong typing."""
 
+import os
 import tempfile
 import logging
+from functools import lru_cache
 from typing import Optional, Tuple
 from pathlib import Path
 from types import ModuleType
@@ -11,6 +13,25 @@ from whisper_dictate.config import AudioConfig
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1)
+def _query_input_devices() -> Tuple[str, ...]:
+    """Enumerate audio input devices, memoized for the process lifetime.
+
+    sd.query_devices() probes ALSA/PulseAudio on every call - tens of
+    milliseconds of IO for an answer that only changes when hardware is
+    plugged or unplugged. Callers that need a fresh scan go through
+    AudioRecorder.get_audio_devices(refresh=True).
+
+    Returns:
+        Tuple[str, ...]: Names of available audio input devices
+    """
+    sd = AudioRecorder._get_sd()
+    devices = sd.query_devices()
+    return tuple(
+        device["name"] for device in devices if device["max_input_channels"] > 0
+    )
+
+
 class AudioRecorder:
     """WHY THIS EXISTS: Audio recording needs to be encapsulated to provide
     consistent interface and error handling across the application.
@@ -61,6 +82,17 @@ class AudioRecorder:
             cls._sf_module = sf
         return cls._sf_module
 
+    # Whisper resamples all input to 16 kHz mono server-side, so uploading
+    # anything richer only inflates the POST body
+    UPLOAD_SAMPLE_RATE = 16000
+
+    # soundfile arguments per supported encode_format; the API detects the
+    # container itself, so the recorder is the only place that cares
+    _ENCODE_SETTINGS = {
+        "opus": (".ogg", {"format": "OGG", "subtype": "OPUS"}),
+        "wav": (".wav", {"format": "WAV", "subtype": "PCM_16"}),
+    }
+
     def __init__(self, config: AudioConfig) -> None:
         """Initialize audio recorder with configuration.
 
@@ -69,6 +101,193 @@ class AudioRecorder:
         """
         self.config = config
 
+    def _downmix_and_resample(self, audio_data) -> tuple:
+        """Collapse recorded audio to mono and resample for upload.
+
+        WHY THIS EXISTS: 44.1 kHz stereo ships ~5.5x more bytes than the
+        16 kHz mono Whisper actually consumes, and the upload is
+        network-bound. Resampling uses scipy's polyphase filter when
+        installed and is skipped otherwise (scipy is optional); the
+        mono mix always applies.
+
+        Args:
+            audio_data: Recorded samples, shape (frames,) or (frames, channels)
+
+        Returns:
+            tuple: (audio_data, sample_rate) ready for soundfile.write
+        """
+        import numpy as np
+
+        audio_data = np.asarray(audio_data, dtype=np.float32)
+        if audio_data.ndim > 1:
+            if audio_data.shape[1] > 1:
+                audio_data = audio_data.mean(axis=1, dtype=np.float32)
+            else:
+                audio_data = audio_data.ravel()
+
+        if self.config.sample_rate <= self.UPLOAD_SAMPLE_RATE:
+            return audio_data, self.config.sample_rate
+
+        try:
+            from scipy.signal import resample_poly
+        except ImportError:
+            logger.debug(
+                "scipy not available, uploading at %d Hz", self.config.sample_rate
+            )
+            return audio_data, self.config.sample_rate
+
+        resampled = resample_poly(
+            audio_data, up=self.UPLOAD_SAMPLE_RATE, down=self.config.sample_rate
+        )
+        return resampled.astype(np.float32), self.UPLOAD_SAMPLE_RATE
+
+    def _trim_silence(self, audio_data, sample_rate):
+        """Drop leading and trailing silence from a mono recording.
+
+        WHY THIS EXISTS: The toggle flow routinely captures 1-3 s of
+        silence on each end of an utterance, which inflates the upload
+        and is billed Whisper compute for nothing. A windowed-RMS
+        energy gate (all vectorized NumPy, O(n)) finds the voiced span;
+        the threshold adapts to the recording's own noise floor, so it
+        works across microphones.
+
+        Args:
+            audio_data: Mono samples, shape (frames,)
+            sample_rate: Sample rate of the samples
+
+        Returns:
+            The voiced slice (with one window of padding on each side),
+            or the input unchanged when no voiced span is detected
+        """
+        import numpy as np
+
+        if audio_data.ndim != 1 or len(audio_data) == 0:
+            return audio_data
+
+        # 100 ms RMS window, capped for very short recordings
+        window = min(max(1, int(sample_rate * 0.1)), len(audio_data))
+        rms = np.sqrt(
+            np.convolve(audio_data**2, np.ones(window) / window, mode="same")
+        )
+        threshold = np.percentile(rms, 10) * 3
+
+        voiced = rms > threshold
+        if not voiced.any():
+            return audio_data
+
+        first = int(np.argmax(voiced))
+        last = len(voiced) - int(np.argmax(voiced[::-1]))
+
+        # Keep one window of padding so word onsets are not clipped
+        first = max(0, first - window)
+        last = min(len(audio_data), last + window)
+
+        trimmed_s = (len(audio_data) - (last - first)) / sample_rate
+        if trimmed_s > 0:
+            logger.debug(f"Trimmed {trimmed_s:.2f}s of edge silence")
+
+        return audio_data[first:last]
+
+    def _write_upload_file(self, sf: "ModuleType", audio_data, sample_rate) -> Path:
+        """Write recorded audio to a temp file in the configured encoding.
+
+        WHY THIS EXISTS: Opus at speech bitrates is ~10x smaller than
+        PCM_16 with no transcription-quality cost, and the upload is
+        network-bound. Opus support requires libsndfile >= 1.0.29; when
+        the encode fails for that reason the recording is rewritten as
+        plain WAV instead of being lost.
+
+        Args:
+            sf: The soundfile module (already resolved by the caller)
+            audio_data: Samples ready to write
+            sample_rate: Sample rate to record in the file header
+
+        Returns:
+            Path: Temporary file containing the encoded audio
+        """
+        suffix, write_kwargs = self._ENCODE_SETTINGS.get(
+            self.config.encode_format, self._ENCODE_SETTINGS["wav"]
+        )
+        if write_kwargs["format"] != "WAV":
+            with tempfile.NamedTemporaryFile(
+                suffix=suffix, delete=False, dir=tempfile.gettempdir()
+            ) as tmp_file:
+                try:
+                    sf.write(tmp_file.name, audio_data, sample_rate, **write_kwargs)
+                    return Path(tmp_file.name)
+                except (ValueError, RuntimeError) as e:
+                    logger.warning(
+                        f"{self.config.encode_format} encoding unavailable ({e}), "
+                        f"falling back to WAV"
+                    )
+                    Path(tmp_file.name).unlink(missing_ok=True)
+
+        # WAV path (configured or fallback): mmap-backed single-pass write
+        with tempfile.NamedTemporaryFile(
+            suffix=".wav", delete=False, dir=tempfile.gettempdir()
+        ) as tmp_file:
+            self._write_wav_mmap(tmp_file.name, audio_data, sample_rate)
+            return Path(tmp_file.name)
+
+    @staticmethod
+    def _write_wav_mmap(path, audio_data, sample_rate: int) -> None:
+        """Write mono float32 samples as a PCM_16 WAV through mmap.
+
+        WHY THIS EXISTS: libsndfile copies the samples into an internal
+        buffer before the kernel buffers them again through the page
+        cache. Quantizing straight into a file-backed mmap does the
+        float32 -> int16 conversion in one vectorized pass and lands the
+        bytes directly in the page cache, skipping the intermediate copy.
+
+        Args:
+            path: Output file path (created/truncated, mode 0o600)
+            audio_data: Mono samples, shape (frames,)
+            sample_rate: Sample rate for the WAV header
+        """
+        import mmap
+        import struct
+
+        import numpy as np
+
+        audio_data = np.asarray(audio_data, dtype=np.float32)
+        data_size = len(audio_data) * 2  # 16-bit mono
+        header = struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b"RIFF",
+            36 + data_size,
+            b"WAVE",
+            b"fmt ",
+            16,  # fmt chunk size
+            1,  # PCM
+            1,  # mono
+            sample_rate,
+            sample_rate * 2,  # byte rate
+            2,  # block align
+            16,  # bits per sample
+            b"data",
+            data_size,
+        )
+
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.ftruncate(fd, len(header) + data_size)
+            mm = mmap.mmap(fd, len(header) + data_size)
+            try:
+                mm[: len(header)] = header
+                scaled = np.multiply(audio_data, 32767.0)
+                np.rint(scaled, out=scaled)
+                np.clip(scaled, -32768, 32767, out=scaled)
+                # Cast-copy straight into the mapped pages; copyto with
+                # unsafe casting avoids materializing an int16 temporary
+                samples = np.frombuffer(mm, dtype=np.int16, offset=len(header))
+                np.copyto(samples, scaled, casting="unsafe")
+                # Release the buffer view so the mmap can close
+                del samples
+            finally:
+                mm.close()
+        finally:
+            os.close(fd)
+
     def record_to_file(self, duration: Optional[float] = None) -> Path:
         """WHY THIS EXISTS: Recording audio directly to files prevents
         memory issues with large recordings and provides consistent file handling.
@@ -101,35 +320,70 @@ class AudioRecorder:
         sf = self._get_sf()
 
         try:
-            # Record audio
-            audio_data = sd.rec(
-                int(duration * self.config.sample_rate),
-                samplerate=self.config.sample_rate,
-                channels=self.config.channels,
-                device=self.config.device,
-                dtype="float32",
-            )
-
-            logger.debug("Recording started, waiting for completion...")
-            sd.wait()
-            logger.debug("Recording completed")
+            audio_data, write_rate = self._capture(duration)
 
             # Save to temporary file
-            with tempfile.NamedTemporaryFile(
-                suffix=".wav", delete=False, dir=tempfile.gettempdir()
-            ) as tmp_file:
+            file_path = self._write_upload_file(sf, audio_data, write_rate)
+            logger.info(f"Audio saved to temporary file: {file_path}")
+
+            return file_path
+
+        except sd.PortAudioError as e:
+            logger.error(f"Audio device error: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error during recording: {e}")
+            raise
+
+    def record_to_bytes(self, duration: Optional[float] = None):
+        """Record audio into an in-memory buffer, never touching disk.
+
+        WHY THIS EXISTS: For callers that only upload the recording (no
+        persistent audio history), the temp-file write and unlink are
+        pure overhead. The encoded bytes land in a BytesIO whose .name
+        carries the container suffix, matching the (filename, file_obj)
+        shape the transcription API accepts.
+
+        Args:
+            duration: Recording duration in seconds (uses config default if None)
+
+        Returns:
+            io.BytesIO: Encoded recording, positioned at the start
+
+        Raises:
+            sd.PortAudioError: If audio device access fails
+        """
+        import io
+
+        duration = duration or self.config.duration
+
+        sd = self._get_sd()
+        sf = self._get_sf()
+
+        try:
+            audio_data, write_rate = self._capture(duration)
+
+            suffix, write_kwargs = self._ENCODE_SETTINGS.get(
+                self.config.encode_format, self._ENCODE_SETTINGS["wav"]
+            )
+            buffer = io.BytesIO()
+            try:
+                sf.write(buffer, audio_data, write_rate, **write_kwargs)
+            except (ValueError, RuntimeError) as e:
+                logger.warning(
+                    f"{self.config.encode_format} encoding unavailable ({e}), "
+                    f"falling back to WAV"
+                )
+                suffix = ".wav"
+                buffer = io.BytesIO()
                 sf.write(
-                    tmp_file.name,
-                    audio_data,
-                    self.config.sample_rate,
-                    format="WAV",
-                    subtype="PCM_16",
+                    buffer, audio_data, write_rate, format="WAV", subtype="PCM_16"
                 )
 
-                file_path = Path(tmp_file.name)
-                logger.info(f"Audio saved to temporary file: {file_path}")
-
-                return file_path
+            buffer.name = f"recording{suffix}"
+            buffer.seek(0)
+            logger.info(f"Audio recorded to memory ({buffer.getbuffer().nbytes} bytes)")
+            return buffer
 
         except sd.PortAudioError as e:
             logger.error(f"Audio device error: {e}")
@@ -138,23 +392,53 @@ class AudioRecorder:
             logger.error(f"Unexpected error during recording: {e}")
             raise
 
-    def get_audio_devices(self) -> Tuple[str, ...]:
+    def _capture(self, duration: float) -> tuple:
+        """Record from the device and run the shared shrink pipeline.
+
+        Args:
+            duration: Recording duration in seconds
+
+        Returns:
+            tuple: (audio_data, sample_rate) ready for encoding
+        """
+        sd = self._get_sd()
+
+        audio_data = sd.rec(
+            int(duration * self.config.sample_rate),
+            samplerate=self.config.sample_rate,
+            channels=self.config.channels,
+            device=self.config.device,
+            dtype="float32",
+        )
+
+        logger.debug("Recording started, waiting for completion...")
+        sd.wait()
+        logger.debug("Recording completed")
+
+        # Shrink the payload before it is encoded
+        audio_data, write_rate = self._downmix_and_resample(audio_data)
+        audio_data = self._trim_silence(audio_data, write_rate)
+        return audio_data, write_rate
+
+    def get_audio_devices(self, refresh: bool = False) -> Tuple[str, ...]:
         """WHY THIS EXISTS: Users need to know available audio devices
         for configuration and troubleshooting.
 
         RESPONSIBILITY: List available audio input devices.
         BOUNDARIES:
-        - DOES: Query and return device names
+        - DOES: Return memoized device names (PortAudio probes are slow)
         - DOES NOT: Handle device selection or configuration
 
+        Args:
+            refresh: Drop the memoized result and re-probe the hardware
+
         Returns:
             Tuple[str, ...]: Names of available audio input devices
         """
-        sd = self._get_sd()
-        devices = sd.query_devices()
-        input_devices = tuple(
-            device["name"] for device in devices if device["max_input_channels"] > 0
-        )
+        if refresh:
+            _query_input_devices.cache_clear()
+
+        input_devices = _query_input_devices()
 
         logger.debug(f"Found {len(input_devices)} audio input devices")
         return input_devices
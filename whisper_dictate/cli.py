@@ -1,6 +1,7 @@
 """Command-line interface for whisper-dictate."""
 
 import logging
+import logging.handlers
 import sys
 from pathlib import Path
 from typing import Optional
@@ -18,6 +19,14 @@ def setup_logging(level: str, enable_db_logging: bool = True) -> None:
     """Configure application logging with file and optional database output."""
     from pathlib import Path
 
+    # None of the formats below use process/thread names or caller
+    # source info; disabling their collection skips a sys._getframe
+    # walk and two lookups on every LogRecord
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
+
     # Create log directory
     log_dir = Path.home() / ".local" / "share" / "whisper-dictate"
     log_dir.mkdir(parents=True, exist_ok=True)
@@ -37,17 +46,22 @@ def setup_logging(level: str, enable_db_logging: bool = True) -> None:
     # Clear existing handlers to avoid duplicates
     root_logger.handlers.clear()
 
-    # File handler
+    # File handler, wrapped in a MemoryHandler so records hit disk in
+    # batches (or immediately on ERROR); logging.shutdown() flushes the
+    # remainder at exit
     file_handler = logging.FileHandler(log_file)
     file_handler.setLevel(getattr(logging, level.upper()))
     file_handler.setFormatter(formatter)
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        capacity=64, flushLevel=logging.ERROR, target=file_handler
+    )
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(getattr(logging, level.upper()))
     console_handler.setFormatter(formatter)
 
-    root_logger.addHandler(file_handler)
+    root_logger.addHandler(buffered_file_handler)
     root_logger.addHandler(console_handler)
 
     # Add database logging handler if enabled
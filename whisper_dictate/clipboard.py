@@ -1,11 +1,65 @@
 """Clipboard integration for Arch Linux with strong typing."""
 
+import functools
 import logging
+import shutil
 import subprocess
 
 logger = logging.getLogger(__name__)
 
 
+def _get_pyperclip():
+    """Import pyperclip if installed (optional dependency).
+
+    pyperclip copies in-process where a compiled backend is available,
+    skipping the fork+exec of an external CLI tool entirely.
+
+    Returns:
+        The pyperclip module, or None when it is not installed
+    """
+    try:
+        import pyperclip
+
+        return pyperclip
+    except ImportError:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_clipboard_tools() -> tuple[str, ...]:
+    """WHY THIS EXISTS: Different Linux distributions have different
+    clipboard tools, and we need to detect what's available. The probe
+    is a pure-Python PATH scan (no subprocess per tool) and the result
+    is cached for the process: constructing multiple ClipboardManagers
+    pays for detection once.
+
+    RESPONSIBILITY: Detect available clipboard tools on the system.
+    BOUNDARIES:
+    - DOES: Check for clipboard tools in PATH (cached per process)
+    - DOES NOT: Install or configure tools
+
+    Returns:
+        tuple[str, ...]: Names of available clipboard tools
+    """
+    # Preference order: wl-copy and xsel detach immediately; xclip can
+    # linger on stdin until another app takes the selection, so it is
+    # the last resort (and is invoked with -loops 1 to bound that).
+    tools = ["wl-copy", "xsel", "xclip"]
+    available = []
+
+    # In-process copy beats any subprocess tool when it is installed
+    if _get_pyperclip() is not None:
+        available.append("pyperclip")
+        logger.debug("Found clipboard library: pyperclip")
+
+    for tool in tools:
+        if shutil.which(tool):
+            available.append(tool)
+            logger.debug(f"Found clipboard tool: {tool}")
+
+    return tuple(available)
+
+
 class ClipboardManager:
     """WHY THIS EXISTS: Clipboard operations need to be abstracted to handle
     different Linux environments and provide consistent error handling.
@@ -21,38 +75,8 @@ class ClipboardManager:
     
     def __init__(self) -> None:
         """Initialize clipboard manager and detect available tools."""
-        self.available_tools = self._detect_clipboard_tools()
-        
-    def _detect_clipboard_tools(self) -> list[str]:
-        """WHY THIS EXISTS: Different Linux distributions have different
-        clipboard tools, and we need to detect what's available.
-        
-        RESPONSIBILITY: Detect available clipboard tools on the system.
-        BOUNDARIES:
-        - DOES: Check for clipboard tools in PATH
-        - DOES NOT: Install or configure tools
-        
-        Returns:
-            list[str]: Names of available clipboard tools
-        """
-        tools = ["xclip", "xsel", "wl-copy"]
-        available = []
-        
-        for tool in tools:
-            try:
-                subprocess.run(
-                    ["which", tool],
-                    check=True,
-                    capture_output=True,
-                    timeout=2
-                )
-                available.append(tool)
-                logger.debug(f"Found clipboard tool: {tool}")
-            except (subprocess.TimeoutExpired, subprocess.CalledProcessError):
-                continue
-        
-        return available
-    
+        self.available_tools = list(_detect_clipboard_tools())
+
     def copy_to_clipboard(self, text: str) -> bool:
         """WHY THIS EXISTS: Text needs to be copied to clipboard reliably
         across different Linux environments.
@@ -71,37 +95,56 @@ class ClipboardManager:
         if not self.available_tools:
             logger.error("No clipboard tools available")
             return False
-        
+
         for tool in self.available_tools:
+            if tool == "pyperclip":
+                pyperclip = _get_pyperclip()
+                try:
+                    pyperclip.copy(text)
+                    logger.info("Text copied to clipboard using pyperclip")
+                    return True
+                except Exception as e:
+                    logger.warning(f"Failed to copy with pyperclip: {e}")
+                    continue
+
+            if tool == "xclip":
+                cmd = ["xclip", "-selection", "clipboard", "-loops", "1"]
+            elif tool == "xsel":
+                cmd = ["xsel", "--clipboard", "--input"]
+            elif tool == "wl-copy":
+                cmd = ["wl-copy"]
+            else:
+                continue
+
             try:
-                if tool == "xclip":
-                    subprocess.run(
-                        ["xclip", "-selection", "clipboard"],
-                        input=text.encode("utf-8"),
-                        check=True,
-                        timeout=5
-                    )
-                elif tool == "xsel":
-                    subprocess.run(
-                        ["xsel", "--clipboard", "--input"],
-                        input=text.encode("utf-8"),
-                        check=True,
-                        timeout=5
-                    )
-                elif tool == "wl-copy":
-                    subprocess.run(
-                        ["wl-copy"],
-                        input=text.encode("utf-8"),
-                        check=True,
-                        timeout=5
-                    )
-                
-                logger.info(f"Text copied to clipboard using {tool}")
-                return True
-                
-            except (subprocess.TimeoutExpired, subprocess.CalledProcessError) as e:
+                # Detached spawn: the selection owner is expected to
+                # outlive us, so there is nothing to wait for - control
+                # returns as soon as the pipe is drained.
+                process = subprocess.Popen(
+                    cmd,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True,
+                    close_fds=True,
+                )
+                process.stdin.write(text.encode("utf-8"))
+                process.stdin.close()
+            except OSError as e:
                 logger.warning(f"Failed to copy with {tool}: {e}")
                 continue
-        
+
+            # Opportunistic check only: a tool that dies on startup (no
+            # display, bad invocation) has usually exited by now, while
+            # a healthy one is either done (rc 0) or still serving.
+            if process.poll() not in (None, 0):
+                logger.warning(
+                    f"{tool} exited with code {process.returncode}"
+                )
+                continue
+
+            logger.info(f"Text copied to clipboard using {tool}")
+            return True
+
         logger.error("All clipboard tools failed")
         return False
\ No newline at end of file
@@ -1,13 +1,11 @@
 """Configuration management for whisper-dictate."""
 
 import os
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-from pydantic import BaseModel, Field
-from dotenv import load_dotenv
-
-load_dotenv()
 
 
 class WhisperProvider(str, Enum):
@@ -57,7 +55,8 @@ PROVIDER_DEFAULTS: dict[WhisperProvider, dict] = {
 }
 
 
-class DatabaseConfig(BaseModel):
+@dataclass(slots=True)
+class DatabaseConfig:
     """WHY THIS EXISTS: Database configuration needs to follow XDG
     Base Directory spec for proper Linux integration.
 
@@ -65,23 +64,18 @@ class DatabaseConfig(BaseModel):
     BOUNDARIES:
     - DOES: Provide path configuration for database and recordings
     - DOES NOT: Handle actual database operations
+
+    Attributes:
+        path: Database file path (defaults to XDG data directory)
+        recordings_path: Recordings directory path (defaults to XDG data directory)
+        log_retention_days: Number of days to retain database logs
+        min_free_space_mb: Minimum free disk space required in MB before recording
     """
 
-    path: Optional[Path] = Field(
-        default=None, description="Database file path (defaults to XDG data directory)"
-    )
-    recordings_path: Optional[Path] = Field(
-        default=None,
-        description="Recordings directory path (defaults to XDG data directory)",
-    )
-    log_retention_days: int = Field(
-        default=30,
-        description="Number of days to retain database logs",
-    )
-    min_free_space_mb: int = Field(
-        default=100,
-        description="Minimum free disk space required in MB before recording",
-    )
+    path: Optional[Path] = None
+    recordings_path: Optional[Path] = None
+    log_retention_days: int = 30
+    min_free_space_mb: int = 100
 
     def get_database_path(self) -> Path:
         """Get the full database file path.
@@ -116,7 +110,8 @@ class DatabaseConfig(BaseModel):
         )
 
 
-class AudioConfig(BaseModel):
+@dataclass(slots=True)
+class AudioConfig:
     """WHY THIS EXISTS: Audio recording parameters need to be configurable
     for different environments and use cases.
 
@@ -124,37 +119,40 @@ class AudioConfig(BaseModel):
     BOUNDARIES:
     - DOES: Provide typed configuration for audio parameters
     - DOES NOT: Handle actual audio recording or validation
+
+    Attributes:
+        sample_rate: Audio sample rate in Hz
+        channels: Number of audio channels
+        duration: Maximum recording duration in seconds
+        device: Audio input device index or name
+        mp3_enabled: Enable MP3 conversion before API upload. Reduces file
+            size by 80-90% with no impact on transcription quality. Set to
+            False to keep original WAV format.
+        mp3_bitrate: MP3 encoding bitrate (e.g., '64k', '128k', '192k').
+            Higher values produce larger files with marginal quality
+            improvement for speech. '128k' is recommended for voice
+            transcription.
+        keep_wav: Keep original WAV file after MP3 conversion. When False
+            (default), WAV is deleted after successful MP3 creation to save
+            space. Set to True if you need to preserve original recordings.
+        encode_format: Encoding used when writing the recorded audio:
+            'opus' (Opus in an OGG container, ~10x smaller than PCM for
+            speech) or 'wav' (uncompressed PCM_16). Falls back to 'wav'
+            automatically when libsndfile lacks Opus support.
     """
 
-    sample_rate: int = Field(default=16000, description="Audio sample rate in Hz")
-    channels: int = Field(default=1, description="Number of audio channels")
-    duration: float = Field(
-        default=5.0, description="Maximum recording duration in seconds"
-    )
-    device: Optional[int | str] = Field(
-        default=None, description="Audio input device index or name"
-    )
-    mp3_enabled: bool = Field(
-        default=True,
-        description="Enable MP3 conversion before API upload. "
-        "Reduces file size by 80-90% with no impact on transcription quality. "
-        "Set to False to keep original WAV format.",
-    )
-    mp3_bitrate: str = Field(
-        default="128k",
-        description="MP3 encoding bitrate (e.g., '64k', '128k', '192k'). "
-        "Higher values produce larger files with marginal quality improvement for speech. "
-        "'128k' is recommended for voice transcription.",
-    )
-    keep_wav: bool = Field(
-        default=False,
-        description="Keep original WAV file after MP3 conversion. "
-        "When False (default), WAV is deleted after successful MP3 creation to save space. "
-        "Set to True if you need to preserve original recordings.",
-    )
+    sample_rate: int = 16000
+    channels: int = 1
+    duration: float = 5.0
+    device: Optional[int | str] = None
+    mp3_enabled: bool = True
+    mp3_bitrate: str = "128k"
+    keep_wav: bool = False
+    encode_format: str = "opus"
 
 
-class WhisperConfig(BaseModel):
+@dataclass(slots=True)
+class WhisperConfig:
     """WHY THIS EXISTS: Whisper API configuration needs to support any
     OpenAI-compatible provider (OpenAI, Groq, Together AI, local servers).
 
@@ -166,38 +164,32 @@ class WhisperConfig(BaseModel):
     RELATIONSHIPS:
     - USED BY: create_transcriber() factory to build provider instances
     - REPLACES: OpenAIConfig (which is now an alias for backward compatibility)
+
+    Attributes:
+        provider: Provider type: openai, groq, together, deepinfra, local, custom
+        api_key: API key. If empty, resolved from provider's default env var.
+        base_url: Custom API base URL. Overrides provider default.
+        model: Model name (may differ per provider, e.g. 'whisper-large-v3'
+            for Groq)
+        timeout: API request timeout in seconds
+        language: Language hint as ISO 639-1 code (e.g. 'en', 'de').
+            If None, Whisper auto-detects the language.
+        temperature: Sampling temperature (0.0 = deterministic, higher =
+            more creative). For transcription, 0.0 is recommended.
+        need_language: Request the detected language alongside the text.
+            Requires the verbose_json response format, which also makes
+            the server compute segment timestamps; leave False (the
+            default) when only the transcript is wanted.
     """
 
-    provider: str = Field(
-        default="openai",
-        description="Provider type: openai, groq, together, deepinfra, local, custom",
-    )
-    api_key: str = Field(
-        default="",
-        description="API key. If empty, resolved from provider's default env var.",
-    )
-    base_url: Optional[str] = Field(
-        default=None,
-        description="Custom API base URL. Overrides provider default.",
-    )
-    model: str = Field(
-        default="whisper-1",
-        description="Model name (may differ per provider, e.g. 'whisper-large-v3' for Groq)",
-    )
-    timeout: float = Field(
-        default=30.0,
-        description="API request timeout in seconds",
-    )
-    language: Optional[str] = Field(
-        default=None,
-        description="Language hint as ISO 639-1 code (e.g. 'en', 'de'). "
-        "If None, Whisper auto-detects the language.",
-    )
-    temperature: float = Field(
-        default=0.0,
-        description="Sampling temperature (0.0 = deterministic, higher = more creative). "
-        "For transcription, 0.0 is recommended.",
-    )
+    provider: str = "openai"
+    api_key: str = ""
+    base_url: Optional[str] = None
+    model: str = "whisper-1"
+    timeout: float = 30.0
+    language: Optional[str] = None
+    temperature: float = 0.0
+    need_language: bool = False
 
 
 # Backward compatibility: OpenAIConfig is now an alias for WhisperConfig
@@ -215,6 +207,7 @@ def _load_whisper_config_from_env() -> WhisperConfig:
     - WHISPER_TIMEOUT: Request timeout in seconds. Default: 30.0
     - WHISPER_LANGUAGE: Language hint (ISO 639-1). Default: None (auto-detect)
     - WHISPER_TEMPERATURE: Sampling temperature. Default: 0.0
+    - WHISPER_NEED_LANGUAGE: Set to "1" to request detected language. Default: off
 
     Returns:
         WhisperConfig: Configuration loaded from environment variables.
@@ -227,10 +220,12 @@ def _load_whisper_config_from_env() -> WhisperConfig:
         timeout=float(os.getenv("WHISPER_TIMEOUT", "30.0")),
         language=os.getenv("WHISPER_LANGUAGE") or None,
         temperature=float(os.getenv("WHISPER_TEMPERATURE", "0.0")),
+        need_language=os.getenv("WHISPER_NEED_LANGUAGE") == "1",
     )
 
 
-class AppConfig(BaseModel):
+@dataclass(slots=True)
+class AppConfig:
     """WHY THIS EXISTS: Application configuration needs to be centralized
     for easy management and testing.
 
@@ -238,17 +233,23 @@ class AppConfig(BaseModel):
     BOUNDARIES:
     - DOES: Provide typed access to all configuration
     - DOES NOT: Handle configuration persistence or validation
+
+    Attributes:
+        database: Database and recordings storage settings
+        audio: Audio recording settings
+        openai: Whisper provider settings
+        log_level: Logging level
+        copy_to_clipboard: Copy transcription to clipboard
     """
 
-    database: DatabaseConfig = Field(default_factory=lambda: DatabaseConfig())
-    audio: AudioConfig = Field(default_factory=AudioConfig)
-    openai: OpenAIConfig = Field(default_factory=_load_whisper_config_from_env)
-    log_level: str = Field(default="INFO", description="Logging level")
-    copy_to_clipboard: bool = Field(
-        default=True, description="Copy transcription to clipboard"
-    )
+    database: DatabaseConfig = field(default_factory=DatabaseConfig)
+    audio: AudioConfig = field(default_factory=AudioConfig)
+    openai: OpenAIConfig = field(default_factory=_load_whisper_config_from_env)
+    log_level: str = "INFO"
+    copy_to_clipboard: bool = True
 
 
+@lru_cache(maxsize=1)
 def load_config() -> AppConfig:
     """WHY THIS EXISTS: Configuration loading needs to be centralized
     to ensure consistent initialization across the application.
@@ -258,12 +259,23 @@ def load_config() -> AppConfig:
     - DOES: Load configuration from environment variables
     - DOES NOT: Handle configuration file management
 
+    The result is memoized: the environment does not change mid-process,
+    so repeated callers share one validated AppConfig instead of
+    re-parsing per call. Use load_config.cache_clear() to force a reload
+    (failures are never cached).
+
     Returns:
         AppConfig: Validated application configuration
 
     Raises:
         ValueError: If required configuration is missing
     """
+    # dotenv is only needed here; importing it at module scope would tax
+    # every consumer of the config types (e.g. DunstMonitor users)
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
     config = AppConfig()
 
     # Resolve API key: explicit config > provider env var
@@ -1,6 +1,8 @@
 """Main dictation service orchestrating audio recording and transcription."""
 
+import concurrent.futures
 import logging
+import threading
 from pathlib import Path
 from types import TracebackType
 from typing import Optional, Tuple
@@ -42,7 +44,16 @@ class DictationService:
         self.config = config
         self.audio_recorder = AudioRecorder(config.audio)
         self.transcriber = create_transcriber(config.openai)
-        self.clipboard = ClipboardManager()
+
+        # Clipboard-tool detection and the transcriber's connection
+        # warmup both run off-thread: dictate() is dominated by the
+        # wall-clock recording, so neither needs to sit on the critical
+        # path. The future is resolved lazily via the clipboard property.
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self._clipboard_future = executor.submit(ClipboardManager)
+        executor.shutdown(wait=False)
+        self._clipboard: Optional[ClipboardManager] = None
+        threading.Thread(target=self.transcriber.warm_up, daemon=True).start()
 
         # Initialize audio converter for MP3 support
         self.audio_converter = AudioConverter(
@@ -53,6 +64,17 @@ class DictationService:
         self._db: Optional[Database] = None
         self._audio_storage: Optional[AudioStorage] = None
 
+    @property
+    def clipboard(self) -> ClipboardManager:
+        """Get the clipboard manager, waiting for background detection.
+
+        Returns:
+            ClipboardManager: Manager built concurrently with __init__
+        """
+        if self._clipboard is None:
+            self._clipboard = self._clipboard_future.result()
+        return self._clipboard
+
     @property
     def database(self) -> Database:
         """Get or create database instance (lazy initialization).
@@ -130,10 +152,11 @@ class DictationService:
             actual_duration = duration or self.config.audio.duration
 
             # Convert to MP3 if enabled (before transcription)
-            # The audio_file may be WAV or MP3 depending on mp3_enabled setting
+            # The audio_file may be WAV or MP3 depending on mp3_enabled setting;
+            # Opus recordings are already compressed and skip the MP3 step
             audio_file = wav_file
-            audio_format = "wav"
-            if self.config.audio.mp3_enabled:
+            audio_format = wav_file.suffix.lstrip(".") or "wav"
+            if self.config.audio.mp3_enabled and wav_file.suffix == ".wav":
                 logger.info(
                     f"Converting WAV to MP3 (bitrate={self.config.audio.mp3_bitrate})"
                 )
@@ -214,13 +237,17 @@ class DictationService:
             except Exception as e:
                 logger.debug(f"Failed to log transcription event: {e}")
 
-            # Copy to clipboard if enabled
-            if self.config.copy_to_clipboard:
+            # Copy to clipboard if enabled and there is something to copy;
+            # owning the selection with empty text would clear the user's
+            # existing clipboard for a false-trigger recording
+            if self.config.copy_to_clipboard and result.text.strip():
                 success = self.clipboard.copy_to_clipboard(result.text)
                 if success:
                     logger.info("Transcription copied to clipboard")
                 else:
                     logger.warning("Failed to copy to clipboard")
+            elif self.config.copy_to_clipboard:
+                logger.debug("Transcription empty, skipping clipboard copy")
 
             logger.info("Dictation workflow completed successfully")
             return result
@@ -16,12 +16,54 @@ BOUNDARIES:
 by ensuring the notification system is always available when needed.
 """
 
+import os
+import shutil
 import subprocess
 import time
 import logging
+from functools import lru_cache
 from typing import Optional
 
 
+def _find_dunst_pid() -> Optional[int]:
+    """Find a running dunst process by scanning /proc.
+
+    Pure syscalls instead of a pgrep fork+exec+wait per check; also
+    avoids the 'ps aux' fallback buffering the whole process table.
+    Matching on /proc/<pid>/comm is exact, so dunstify invocations are
+    not mistaken for the daemon.
+
+    Returns:
+        Optional[int]: PID of the first dunst process, or None
+
+    Raises:
+        OSError: If /proc is unavailable (callers fall back to pgrep)
+    """
+    for entry in os.scandir('/proc'):
+        if not entry.name.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry.name}/comm', 'rb') as f:
+                comm = f.read()
+        except OSError:
+            # Process exited between scandir and open
+            continue
+        if comm.strip() == b'dunst':
+            return int(entry.name)
+    return None
+
+
+@lru_cache(maxsize=1)
+def _dunst_binary_available() -> bool:
+    """Check once per process whether the dunst binary is in PATH.
+
+    PATH contents are stable for the lifetime of the process, so the
+    scan result is memoized; repeated get_dunst_status calls become a
+    table lookup.
+    """
+    return shutil.which('dunst') is not None
+
+
 class DunstMonitor:
     """
     WHY THIS EXISTS: Provides a centralized way to ensure dunst is running
@@ -34,42 +76,65 @@ class DunstMonitor:
     - DOES NOT: Monitor dunst health after startup or handle crashes
     """
     
+    # How long a liveness result stays fresh; dunst rarely flaps faster
+    _RUNNING_TTL = 2.0
+
     def __init__(self):
         """Initialize the DunstMonitor."""
         self.logger = logging.getLogger(__name__)
-    
-    def is_dunst_running(self) -> bool:
+        self._running_cache: Optional[tuple] = None  # (monotonic, bool)
+
+    def is_dunst_running(self, force: bool = False) -> bool:
         """
         WHY THIS EXISTS: Need to check if dunst daemon is currently running
-        before attempting notifications.
-        
+        before attempting notifications. The result is cached for a couple
+        of seconds because ensure_dunst_running, get_dunst_status and
+        start_dunst all re-ask in quick succession.
+
         RESPONSIBILITY: Check system process list for running dunst instances.
-        
+
+        Args:
+            force: Skip the TTL cache and re-scan (used after start_dunst)
+
         Returns:
             bool: True if dunst is running, False otherwise
         """
+        now = time.monotonic()
+        if (
+            not force
+            and self._running_cache is not None
+            and now - self._running_cache[0] < self._RUNNING_TTL
+        ):
+            return self._running_cache[1]
+
+        result = self._probe_dunst_running()
+        self._running_cache = (now, result)
+        return result
+
+    def _probe_dunst_running(self) -> bool:
+        """Actually scan the process table for dunst (uncached)."""
+        try:
+            # Scan /proc directly - no process spawn per check
+            return _find_dunst_pid() is not None
+        except OSError:
+            # /proc unavailable (non-Linux); fall back to pgrep
+            pass
+
         try:
-            # Check for dunst processes
             result = subprocess.run(
-                ['pgrep', '-f', 'dunst'],
+                ['pgrep', '-x', 'dunst'],
                 capture_output=True,
                 text=True,
                 check=False
             )
             return result.returncode == 0 and result.stdout.strip() != ""
-            
+
         except FileNotFoundError:
-            # pgrep not available, try alternative
-            try:
-                result = subprocess.run(
-                    ['ps', 'aux'],
-                    capture_output=True,
-                    text=True,
-                    check=False
-                )
-                return 'dunst' in result.stdout.lower()
-            except Exception:
-                return False
+            # No /proc and no pgrep: nothing cheap left to ask. The old
+            # 'ps aux' fallback lower-cased the entire process table per
+            # call and matched substrings (so dunstify counted too).
+            self.logger.warning("Cannot check dunst status: pgrep not available")
+            return False
         except Exception as e:
             self.logger.warning(f"Error checking dunst status: {e}")
             return False
@@ -84,29 +149,37 @@ class DunstMonitor:
         Returns:
             bool: True if dunst was started successfully, False otherwise
         """
+        dunst_path = shutil.which('dunst')
+        if dunst_path is None:
+            self.logger.error("dunst command not found - is dunst installed?")
+            return False
+
         try:
-            # Start dunst in background
-            subprocess.Popen(
+            # posix_spawn is a single syscall - no fork() copying this
+            # process's page tables just to exec a daemon
+            os.posix_spawn(
+                dunst_path,
                 ['dunst'],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                start_new_session=True
+                os.environ,
+                file_actions=[
+                    (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+                    (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+                ],
+                setsid=True,
             )
-            
-            # Give dunst time to start
-            time.sleep(0.5)
-            
-            # Verify it started
-            if self.is_dunst_running():
-                self.logger.info("Dunst notification daemon started")
-                return True
-            else:
-                self.logger.error("Failed to start dunst")
-                return False
-                
-        except FileNotFoundError:
-            self.logger.error("dunst command not found - is dunst installed?")
+
+            # Poll with exponential backoff (~500ms budget in total)
+            # instead of a fixed pessimistic sleep: dunst is usually
+            # accepting notifications within a few tens of ms
+            for delay in (0.005, 0.01, 0.02, 0.04, 0.08, 0.15, 0.2):
+                time.sleep(delay)
+                if self.is_dunst_running(force=True):
+                    self.logger.info("Dunst notification daemon started")
+                    return True
+
+            self.logger.error("Failed to start dunst")
             return False
+
         except Exception as e:
             self.logger.error(f"Error starting dunst: {e}")
             return False
@@ -134,37 +207,45 @@ class DunstMonitor:
         and user feedback purposes.
         
         RESPONSIBILITY: Return comprehensive dunst status information.
-        
+
+        A single process-table scan yields both the liveness bool and
+        the PID; the previous is_dunst_running + _get_dunst_pid pair
+        scanned twice for the same answer.
+
         Returns:
             dict: Status information including running state and any errors
         """
-        running = self.is_dunst_running()
-        
+        try:
+            pid = _find_dunst_pid()
+        except OSError:
+            pid = self._get_dunst_pid()
+
+        running = pid is not None
+        # The scan just happened; refresh the liveness cache with it
+        self._running_cache = (time.monotonic(), running)
+
         status = {
             'running': running,
             'available': self._check_dunst_binary(),
-            'pid': self._get_dunst_pid() if running else None
+            'pid': pid
         }
-        
+
         return status
     
     def _check_dunst_binary(self) -> bool:
-        """Check if dunst binary is available in PATH."""
-        try:
-            subprocess.run(
-                ['which', 'dunst'],
-                capture_output=True,
-                check=True
-            )
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        """Check if dunst binary is available in PATH (memoized)."""
+        return _dunst_binary_available()
     
     def _get_dunst_pid(self) -> Optional[int]:
         """Get the PID of the running dunst process."""
+        try:
+            return _find_dunst_pid()
+        except OSError:
+            pass
+
         try:
             result = subprocess.run(
-                ['pgrep', 'dunst'],
+                ['pgrep', '-x', 'dunst'],
                 capture_output=True,
                 text=True,
                 check=True
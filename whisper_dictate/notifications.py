@@ -39,10 +39,15 @@ the dunstctl context command. The default keybinding is Ctrl+Shift+. but
 can be customized in your dunst configuration.
 """
 
+import concurrent.futures
+import functools
 import logging
+import os
 import shutil
 import subprocess
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Literal, Optional
 
@@ -54,44 +59,71 @@ RECORDING_STACK_TAG = "whisper-dictate-recording"
 # File to persist notification ID between script invocations (DEPRECATED)
 # NOTE: This is kept for backward compatibility but is no longer used.
 # Stack tags provide a more reliable solution that works across processes.
-NOTIFICATION_ID_FILE = Path.home() / ".whisper-dictate-notification-id"
+# Lives in XDG_RUNTIME_DIR when available: that directory is tmpfs, so the
+# per-toggle read/write round-trips never touch the disk, and the session
+# cleanup removes stale IDs for free. $HOME remains the fallback.
+_runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+NOTIFICATION_ID_FILE = (
+    Path(_runtime_dir) / "whisper-dictate-notification-id"
+    if _runtime_dir
+    else Path.home() / ".whisper-dictate-notification-id"
+)
 
 # Set up module-level logger
 logger = logging.getLogger(__name__)
 
 
 def _save_notification_id(notification_id: str) -> None:
-    """Save notification ID to file for persistence across script invocations."""
+    """Save notification ID to file for persistence across script invocations.
+
+    Raw os.open/write/close instead of pathlib's write_text: one syscall
+    each, no encoder machinery, and the file is created 0600 in one step.
+    """
     try:
-        NOTIFICATION_ID_FILE.write_text(notification_id)
-    except Exception as e:
-        logger.warning(f"Failed to save notification ID: {e}")
+        fd = os.open(
+            NOTIFICATION_ID_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+        )
+        try:
+            os.write(fd, notification_id.encode())
+        finally:
+            os.close(fd)
+    except OSError as e:
+        logger.warning("Failed to save notification ID: %s", e)
 
 
 def _load_notification_id() -> Optional[str]:
-    """Load notification ID from file."""
+    """Load notification ID from file.
+
+    EAFP: a missing file is the common case and is answered by the open()
+    error instead of a separate exists() stat (which was also a TOCTOU
+    window between the check and the read).
+    """
     try:
-        if NOTIFICATION_ID_FILE.exists():
-            content = NOTIFICATION_ID_FILE.read_text().strip()
-            lines = content.splitlines()
-            if lines:
-                return lines[0]
-            else:
-                logger.warning(
-                    f"Notification ID file exists but is empty: {NOTIFICATION_ID_FILE}"
-                )
-    except Exception as e:
-        logger.warning(f"Failed to load notification ID: {e}")
+        with open(NOTIFICATION_ID_FILE, "rb") as f:
+            content = f.read()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning("Failed to load notification ID: %s", e)
+        return None
+
+    lines = content.decode("utf-8", "replace").strip().splitlines()
+    if lines:
+        return lines[0]
+    logger.warning(
+        "Notification ID file exists but is empty: %s", NOTIFICATION_ID_FILE
+    )
     return None
 
 
 def _clear_notification_id() -> None:
     """Clear saved notification ID."""
     try:
-        if NOTIFICATION_ID_FILE.exists():
-            NOTIFICATION_ID_FILE.unlink()
-    except Exception as e:
-        logger.warning(f"Failed to clear notification ID: {e}")
+        os.unlink(NOTIFICATION_ID_FILE)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.warning("Failed to clear notification ID: %s", e)
 
 
 def notify_recording_start() -> bool:
@@ -108,6 +140,9 @@ def notify_recording_start() -> bool:
     Returns:
         bool: True if notification was sent successfully
     """
+    if _NOTIFIER_DISABLED:
+        return False
+
     try:
         if not is_dunstify_available():
             logger.warning(
@@ -127,12 +162,15 @@ def notify_recording_start() -> bool:
             "Dictation in progress...",
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        # Output is never inspected beyond the return code: no capture pipes
+        result = subprocess.run(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False
+        )
 
         if result.returncode != 0:
             logger.error(
-                "Failed to send recording notification: %s",
-                result.stderr.strip() if result.stderr else "unknown error",
+                "Failed to send recording notification (exit code %d)",
+                result.returncode,
             )
             return False
 
@@ -142,7 +180,7 @@ def notify_recording_start() -> bool:
     except FileNotFoundError:
         logger.error("dunstify not found")
         return False
-    except Exception as e:
+    except (OSError, subprocess.SubprocessError) as e:
         logger.error("Failed to send recording notification: %s", e)
         return False
 
@@ -157,6 +195,9 @@ def notify_recording_stop() -> bool:
     Returns:
         bool: True if notification was sent successfully
     """
+    if _NOTIFIER_DISABLED:
+        return False
+
     try:
         if not is_dunstify_available():
             logger.warning("dunstify not available, cannot send stop notification")
@@ -174,12 +215,13 @@ def notify_recording_stop() -> bool:
             "Transcription in progress...",
         ]
 
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        result = subprocess.run(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False
+        )
 
         if result.returncode != 0:
             logger.error(
-                "Failed to send stop notification: %s",
-                result.stderr.strip() if result.stderr else "unknown error",
+                "Failed to send stop notification (exit code %d)", result.returncode
             )
             return False
 
@@ -191,7 +233,7 @@ def notify_recording_stop() -> bool:
     except FileNotFoundError:
         logger.error("dunstify not found")
         return False
-    except Exception as e:
+    except (OSError, subprocess.SubprocessError) as e:
         logger.error("Failed to send stop notification: %s", e)
         return False
 
@@ -200,12 +242,118 @@ def notify_recording_stop() -> bool:
 UrgencyLevel = Literal["low", "normal", "critical"]
 TimeoutMs = int  # Timeout in milliseconds
 
+# App name reported to the notification server via D-Bus
+NOTIFY_APP_NAME = "whisper-dictate"
+
+# Absolute notify-send path for the fallback, resolved once at import. A
+# missing binary is then a None check per call instead of a full PATH walk
+# ending in ENOENT, and spawning with the absolute path skips the kernel's
+# PATH resolution too.
+_NOTIFY_SEND = shutil.which("notify-send")
+
+# Kill switch for headless environments (CI, test boxes, SSH sessions with
+# no notification daemon). Two ways to trip it: the explicit env var, or the
+# absence of any display server (no DISPLAY and no WAYLAND_DISPLAY — nothing
+# could render a popup, but notify-send/dunstify would still exec and fail
+# inside, paying full spawn cost for nothing). When set, every send path
+# returns at a single attribute check, before any argv building, D-Bus
+# traffic, or subprocess spawn. Binary probing is deliberately NOT part of
+# this check: a missing notify-send must not disable the D-Bus path, which
+# needs neither notify-send nor dunstify.
+_NOTIFIER_DISABLED = os.environ.get("WHISPER_DICTATE_NO_NOTIFY") == "1" or not (
+    os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")
+)
+
+# freedesktop notification urgency hint values (byte: 0=low, 1=normal, 2=critical)
+URGENCY_MAP: dict[str, int] = {"low": 0, "normal": 1, "critical": 2}
+
+# Lazily-initialized D-Bus session connection shared by all notifications.
+# Shelling out to notify-send forks a process and opens a fresh D-Bus session
+# per call; a cached org.freedesktop.Notifications proxy turns each
+# notification into a single method call on an already-open connection.
+_bus = None
+_iface = None
+_dbus_unavailable = False
+
+# Identical notifications repeated inside this window (e.g. an error retry
+# storm firing notify_error in a loop) are dropped before any IPC happens:
+# the user already sees the popup, so repeating it only costs round-trips.
+DEDUP_WINDOW_S = 2.0
+
+# Recently-sent (summary, body, urgency) hashes -> monotonic send time,
+# insertion-ordered so expired entries can be purged from the front. Capped
+# so a pathological caller cannot grow it without bound.
+_DEDUP_MAX_ENTRIES = 64
+_recent: OrderedDict[int, float] = OrderedDict()
+
+# Token-bucket rate limits per urgency (tokens/second, also the burst cap).
+# A runaway error loop is dropped at a float compare instead of saturating
+# the notification daemon with IPC; critical gets the most headroom.
+_NOTIFY_RATE_PER_S: dict[str, float] = {"low": 5.0, "normal": 10.0, "critical": 20.0}
+
+# urgency -> [tokens, last_refill]; last_refill of 0.0 means "fill on first use"
+_rate_buckets: dict[str, list[float]] = {
+    urgency: [burst, 0.0] for urgency, burst in _NOTIFY_RATE_PER_S.items()
+}
+
+# Dedicated single worker for fire-and-forget sends. One thread keeps the
+# notification order deterministic; threads are created lazily, so processes
+# that never use the async path pay nothing.
+_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="notif"
+)
+
+
+def _get_notify_iface():
+    """Return the cached org.freedesktop.Notifications D-Bus interface.
+
+    RESPONSIBILITY: Connect to the session bus once per process and hand out
+    the shared Notify proxy.
+
+    DOES:
+    - Lazily import dbus and connect on first use
+    - Cache the interface (and the failure, so we don't retry every call)
+
+    DOES NOT:
+    - Raise: returns None when python-dbus is missing or no session bus
+      exists, in which case callers fall back to notify-send
+
+    Returns:
+        The dbus.Interface for org.freedesktop.Notifications, or None
+    """
+    global _bus, _iface, _dbus_unavailable
+
+    if _iface is not None or _dbus_unavailable:
+        return _iface
+
+    try:
+        import dbus
+
+        _bus = dbus.SessionBus()
+        _iface = dbus.Interface(
+            _bus.get_object(
+                "org.freedesktop.Notifications", "/org/freedesktop/Notifications"
+            ),
+            "org.freedesktop.Notifications",
+        )
+    except ImportError:
+        _dbus_unavailable = True
+        logger.warning("python-dbus not available, falling back to notify-send")
+    except Exception as e:
+        _dbus_unavailable = True
+        logger.warning("Could not connect to notification service: %s", e)
+
+    return _iface
 
+
+@functools.lru_cache(maxsize=1)
 def is_dunstify_available() -> bool:
     """
     Check if dunstify binary is available on the system.
 
     RESPONSIBILITY: Determine whether dunstify can be used for notifications.
+    The PATH walk runs once per process; every later call is a cache hit.
+    Tests toggling availability should call is_dunstify_available.cache_clear().
 
     Returns:
         bool: True if dunstify binary exists, False otherwise
@@ -244,6 +392,9 @@ def send_dunstify(
         Optional[str]: Notification ID if dunstify was used and returned one,
                        None otherwise or on error
     """
+    if _NOTIFIER_DISABLED:
+        return None
+
     try:
         dunstify_available = is_dunstify_available()
         if dunstify_available:
@@ -252,45 +403,112 @@ def send_dunstify(
             logger.warning("dunstify not available, falling back to notify-send")
             cmd = ["notify-send", "-u", urgency, "-t", str(timeout), summary, body]
 
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+        # Only stdout (the dunstify ID) is ever read; stderr goes straight
+        # to /dev/null instead of a pipe we would allocate, read and decode
+        result = subprocess.run(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=False
+        )
 
         if result.returncode != 0:
-            logger.error(
-                "Notification failed: %s",
-                result.stderr.strip() if result.stderr else "unknown error",
-            )
+            logger.error("Notification failed (exit code %d)", result.returncode)
             return None
 
         # dunstify returns the notification ID in stdout
         if dunstify_available and result.stdout.strip():
-            return result.stdout.strip()
+            return result.stdout.strip().decode("ascii", "replace")
 
         return None
 
     except FileNotFoundError as e:
         logger.error("Notification command not found: %s", e)
         return None
-    except Exception as e:
+    except (OSError, subprocess.SubprocessError) as e:
+        # Spawn/exec failures only — programming errors propagate
         logger.error("Failed to send notification: %s", e)
         return None
 
 
+def _spawn_notify(argv: list[str]) -> int:
+    """Spawn a notifier process directly via posix_spawn and reap it.
+
+    RESPONSIBILITY: Run argv to completion with stdout/stderr discarded,
+    returning the exit code.
+
+    WHY NOT subprocess: fork+exec copies the parent's page tables, which
+    scales with resident set size — painful in a process that may hold
+    Whisper model weights. posix_spawn uses vfork-style cloning on glibc
+    and skips that copy entirely. argv[0] must be an absolute path (the
+    module resolves notify-send once at import), so no PATH walk either.
+
+    Args:
+        argv: Full command line; argv[0] is the absolute executable path
+
+    Returns:
+        int: The process exit code (non-zero on abnormal termination)
+    """
+    pid = os.posix_spawn(
+        argv[0],
+        argv,
+        os.environ,
+        file_actions=[
+            (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0o644),
+            (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0o644),
+        ],
+    )
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status)
+
+
+@functools.lru_cache(maxsize=16)
+def _notify_send_args(urgency: str, timeout: int) -> tuple:
+    """Constant option arguments for the notify-send fallback.
+
+    Urgency levels and timeouts come from a tiny fixed set, so the
+    formatted arguments (and the transient hint for timed popups) are
+    built once per combination instead of per call. The executable path
+    is looked up at call time: it stays swappable (tests patch it).
+    """
+    args = (f"--urgency={urgency}", f"--expire-time={timeout}")
+    if timeout > 0:
+        args += ("--hint=boolean:transient:true",)
+    return args
+
+
+def _remember_sent(key: int, now: float) -> None:
+    """Record a successfully delivered payload in the dedup window.
+
+    Only called after the send succeeded: rate-limited drops and D-Bus or
+    spawn failures must stay out of the cache so an identical retry is
+    actually delivered instead of short-circuiting to a stale True.
+    """
+    _recent[key] = now
+    if len(_recent) > _DEDUP_MAX_ENTRIES:
+        _recent.popitem(last=False)
+
+
 def send_notification(
     summary: str,
     body: str = "",
     urgency: UrgencyLevel = "normal",
     timeout: TimeoutMs = 5000,
-) -> bool:
+    replaces_id: int = 0,
+) -> int:
     """
     WHY THIS EXISTS: Provides a consistent way to send desktop notifications
     across the application with proper error handling and type safety.
 
-    RESPONSIBILITY: Send a desktop notification using notify-send command.
+    RESPONSIBILITY: Send a desktop notification via the session bus, falling
+    back to the notify-send command when no D-Bus binding is available.
 
     DOES:
     - Send notifications with configurable urgency and timeout
-    - Handle command execution errors gracefully
-    - Provide boolean success/failure feedback
+    - Reuse one D-Bus connection instead of forking notify-send per call
+    - Replace an existing notification in place when replaces_id is given
+    - Drop exact duplicates arriving within DEDUP_WINDOW_S seconds (the
+      duplicate call returns True without any IPC)
+    - Bound the worst-case send rate per urgency with a token bucket
+      (excess calls return False without any IPC)
+    - Handle D-Bus and command execution errors gracefully
 
     DOES NOT:
     - Queue notifications if system is busy
@@ -302,57 +520,331 @@ def send_notification(
         body: Optional detailed message body
         urgency: Notification urgency level ("low", "normal", or "critical")
         timeout: Display duration in milliseconds (0 for persistent)
+        replaces_id: Server-assigned ID of a notification to update in place
+                     (0 creates a new notification)
 
     Returns:
-        bool: True if notification was sent successfully, False otherwise
+        int: The server-assigned notification ID on the D-Bus path, True on
+             the notify-send fallback (which cannot report IDs), and False
+             on failure — callers only needing success can test truthiness
 
     Examples:
         >>> send_notification("Recording Started", "Press again to stop")
-        True
+        1
         >>> send_notification("Error", "Failed to start recording", "critical", 10000)
-        True
+        2
     """
-    try:
-        cmd = [
-            "notify-send",
-            f"--urgency={urgency}",
-            f"--expire-time={timeout}",
-            summary,
-            body,
-        ]
+    if _NOTIFIER_DISABLED:
+        return False
 
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=False,  # Don't raise exception on non-zero exit
-        )
+    # Drop exact repeats inside the dedup window before paying for any IPC.
+    # The key is only recorded after a send succeeds (via _remember_sent),
+    # so a rate-limited or failed attempt never suppresses an identical
+    # retry into a false "already shown" success.
+    now = time.monotonic()
+    key = hash((summary, body, urgency))
+    while _recent:
+        _, oldest_ts = next(iter(_recent.items()))
+        if now - oldest_ts < DEDUP_WINDOW_S:
+            break
+        _recent.popitem(last=False)
+    if key in _recent:
+        return True
 
-        return result.returncode == 0
+    # Token-bucket rate limit: floods are dropped here, before any IPC
+    bucket = _rate_buckets[urgency]
+    rate = _NOTIFY_RATE_PER_S[urgency]
+    bucket[0] = min(rate, bucket[0] + (now - bucket[1]) * rate)
+    bucket[1] = now
+    if bucket[0] < 1.0:
+        logger.debug("Notification rate limit hit (urgency=%s), dropping", urgency)
+        return False
+    bucket[0] -= 1.0
+
+    # Short-lived popups are marked transient so the daemon does not add
+    # them to its history/queues — a long dictation session fires many
+    # low-value notifications that would otherwise accumulate backlog
+    hints: dict = {"urgency": URGENCY_MAP[urgency]}
+    if timeout > 0:
+        hints["transient"] = True
+
+    iface = _iface if _iface is not None else _get_notify_iface()
+    if iface is not None:
+        try:
+            notification_id = int(
+                iface.Notify(
+                    NOTIFY_APP_NAME,
+                    replaces_id,  # 0 = new notification
+                    "",  # app_icon
+                    summary,
+                    body,
+                    [],  # actions
+                    hints,
+                    timeout,
+                )
+            )
+        except Exception:
+            # dbus.DBusException and friends: server gone or call failed
+            return False
+        _remember_sent(key, now)
+        return notification_id
+
+    # Fallback: spawn notify-send when D-Bus is not usable. Output is
+    # discarded at the fd level: no capture pipes or text decoding for
+    # output we never read.
+    if _NOTIFY_SEND is None:
+        return False
+
+    try:
+        cmd = [_NOTIFY_SEND, *_notify_send_args(urgency, timeout), summary, body]
+
+        if _spawn_notify(cmd) == 0:
+            _remember_sent(key, now)
+            return True
+        return False
 
     except FileNotFoundError:
         # notify-send command not found
         return False
-    except Exception:
-        # Other subprocess errors
+    except (OSError, subprocess.SubprocessError):
+        # Other spawn failures; programming errors propagate
         return False
 
 
+def send_notification_async(
+    summary: str,
+    body: str = "",
+    urgency: UrgencyLevel = "normal",
+    timeout: TimeoutMs = 5000,
+    replaces_id: int = 0,
+) -> "concurrent.futures.Future[int]":
+    """
+    WHY THIS EXISTS: send_notification blocks for the full IPC round-trip
+    (or the notify-send subprocess lifetime on the fallback path). Callers
+    on a latency-sensitive path can hand the send to the dedicated worker
+    thread and continue immediately.
+
+    RESPONSIBILITY: Queue a notification on the single notification worker.
+
+    DOES:
+    - Return in microseconds regardless of notification server latency
+    - Preserve send order (the worker is single-threaded)
+
+    DOES NOT:
+    - Report success inline; inspect the returned Future if the result
+      matters, or use send_notification directly
+
+    Args:
+        summary: The notification title/summary text
+        body: Optional detailed message body
+        urgency: Notification urgency level ("low", "normal", or "critical")
+        timeout: Display duration in milliseconds (0 for persistent)
+        replaces_id: Server-assigned ID of a notification to update in place
+
+    Returns:
+        concurrent.futures.Future resolving to send_notification's result
+    """
+    return _executor.submit(
+        send_notification,
+        summary,
+        body,
+        urgency=urgency,
+        timeout=timeout,
+        replaces_id=replaces_id,
+    )
+
+
+def flush_notifications(timeout: Optional[float] = None) -> bool:
+    """
+    WHY THIS EXISTS: send_notification_async hands work to a background
+    worker; callers that are about to exit (or tests asserting on sends)
+    need a way to wait until everything queued so far has been dispatched.
+
+    RESPONSIBILITY: Block until the notification worker has drained all
+    sends submitted before this call.
+
+    DOES:
+    - Ride the single worker's FIFO order: a no-op barrier task completes
+      only after every earlier submission has run
+
+    DOES NOT:
+    - Wait for sends submitted after the call, or report their results
+
+    Args:
+        timeout: Maximum seconds to wait, or None to wait indefinitely
+
+    Returns:
+        bool: True once the queue is drained, False if the timeout expired
+    """
+    try:
+        _executor.submit(lambda: None).result(timeout)
+        return True
+    except concurrent.futures.TimeoutError:
+        return False
+
+
+class NotificationBatcher:
+    """
+    Coalesces bursts of notifications into one send per unique summary.
+
+    WHY THIS EXISTS: Each notification is an IPC round-trip. A rapid error
+    cascade or per-chunk progress updates can fire many notifications in a
+    few milliseconds; showing each one separately wastes server work and
+    buries the user. Entries enqueued within max_wait_time are collapsed so
+    only the most recent body per summary is actually sent.
+
+    RESPONSIBILITY: Queue (summary, body, urgency, timeout) tuples and flush
+    them as one send_notification call per unique summary, reusing the
+    server-assigned ID so later flushes update the same popup.
+
+    BOUNDARIES:
+    - DOES: Batch on a short timer, flush early when the batch fills up
+    - DOES NOT: Replace send_notification for one-shot callers; this is an
+      opt-in coalescer for bursty call sites
+
+    Usage:
+        batcher = NotificationBatcher()
+        batcher.enqueue("Dictation", "chunk 1...")
+        batcher.enqueue("Dictation", "chunk 2...")  # supersedes chunk 1
+    """
+
+    def __init__(
+        self, max_batch_size: int = 10, max_wait_time: float = 0.05
+    ) -> None:
+        """Initialize the batcher with its flush thresholds."""
+        self.max_batch_size = max_batch_size
+        self.max_wait_time = max_wait_time
+        self._queue: list[tuple[str, str, UrgencyLevel, TimeoutMs]] = []
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        # Last server-assigned ID per summary, for replace-in-place flushes
+        self._replaces_ids: dict[str, int] = {}
+
+    def enqueue(
+        self,
+        summary: str,
+        body: str = "",
+        urgency: UrgencyLevel = "normal",
+        timeout: TimeoutMs = 5000,
+    ) -> None:
+        """Queue a notification, flushing early when the batch is full."""
+        with self._lock:
+            self._queue.append((summary, body, urgency, timeout))
+            if len(self._queue) < self.max_batch_size:
+                if self._timer is None:
+                    self._timer = threading.Timer(self.max_wait_time, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+            batch = self._drain_locked()
+        self._send_batch(batch)
+
+    def flush(self) -> None:
+        """Send everything queued so far; safe to call with an empty queue."""
+        with self._lock:
+            batch = self._drain_locked()
+        if batch:
+            self._send_batch(batch)
+
+    def _drain_locked(self) -> list[tuple[str, str, UrgencyLevel, TimeoutMs]]:
+        """Take the queue contents and cancel the pending timer (lock held)."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._queue = self._queue, []
+        return batch
+
+    def _send_batch(
+        self, batch: list[tuple[str, str, UrgencyLevel, TimeoutMs]]
+    ) -> None:
+        """Collapse the batch to the newest entry per summary and send."""
+        latest: OrderedDict[str, tuple[str, UrgencyLevel, TimeoutMs]] = OrderedDict()
+        for summary, body, urgency, timeout in batch:
+            latest[summary] = (body, urgency, timeout)
+
+        for summary, (body, urgency, timeout) in latest.items():
+            result = send_notification(
+                summary,
+                body,
+                urgency=urgency,
+                timeout=timeout,
+                replaces_id=self._replaces_ids.get(summary, 0),
+            )
+            # The notify-send fallback reports plain booleans, not IDs
+            if not isinstance(result, bool):
+                self._replaces_ids[summary] = result
+
+
+# Notification slot shared by the recording-lifecycle helpers. A dictation
+# session fires started -> stopping -> stopped with the same summary; by
+# threading the server-assigned ID back as replaces_id, the stream updates a
+# single popup in place instead of stacking three.
+_last_dictation_id: int = 0
+
+# Constant kwargs for the fixed-shape lifecycle helpers, built once at import
+# instead of per call. The stopping/stopped dicts omit the dynamic fields
+# (replaces_id, preview body), which are passed alongside the expansion.
+_STARTED_KW = {
+    "summary": "Dictation",
+    "body": "Recording started... press again to stop",
+    "urgency": "normal",
+    "timeout": 3000,
+    "replaces_id": 0,
+}
+_STOPPING_KW = {
+    "summary": "Dictation",
+    "body": "Stopping recording... processing audio",
+    "urgency": "normal",
+    "timeout": 2000,
+}
+_STOPPED_KW = {
+    "summary": "Dictation",
+    "urgency": "normal",
+    "timeout": 5000,
+}
+
+
+# Interned body prefixes for the recording helpers. Plain concatenation on
+# these skips f-string formatting machinery on paths that run per streaming
+# update.
+_RECORDING_PREFIX = "Recording... "
+_TRANSCRIPTION_PREFIX = "Transcription: "
+
+
+@functools.lru_cache(maxsize=32)
+def _truncate(text: str, max_len: int, keep: int) -> str:
+    """Truncate text to keep characters with a "..." marker past max_len.
+
+    Memoized: a stabilising streaming transcriber resends the same partial
+    text repeatedly, so the slice+concat is computed once per distinct
+    preview instead of per notification.
+    """
+    return text if len(text) <= max_len else text[:keep] + "..."
+
+
+def _store_dictation_id(result: int) -> bool:
+    """Record the server-assigned dictation notification ID and report success.
+
+    The notify-send fallback returns plain booleans (it cannot report IDs),
+    which are left out of the slot so a stale ID is never reused.
+    """
+    global _last_dictation_id
+    if not isinstance(result, bool):
+        _last_dictation_id = result
+    return bool(result)
+
+
 def notify_recording_started() -> bool:
     """
     WHY THIS EXISTS: Standardized notification for when recording begins.
 
-    RESPONSIBILITY: Send a consistent "recording started" notification.
+    RESPONSIBILITY: Send a consistent "recording started" notification,
+    opening the single notification slot reused for the whole session.
 
     Returns:
         bool: True if notification sent successfully
     """
-    return send_notification(
-        summary="Dictation",
-        body="Recording started... press again to stop",
-        urgency="normal",
-        timeout=3000,
-    )
+    return _store_dictation_id(send_notification(**_STARTED_KW))
 
 
 def notify_recording_stopped(text_preview: str = "") -> bool:
@@ -360,7 +852,8 @@ def notify_recording_stopped(text_preview: str = "") -> bool:
     WHY THIS EXISTS: Standardized notification for when recording stops.
 
     RESPONSIBILITY: Send a consistent "recording stopped" notification with
-    optional transcription preview.
+    optional transcription preview, replacing the session's earlier
+    notifications in place.
 
     Args:
         text_preview: First part of transcribed text to show
@@ -368,16 +861,16 @@ def notify_recording_stopped(text_preview: str = "") -> bool:
     Returns:
         bool: True if notification sent successfully
     """
+    # Single f-string per branch: no intermediate preview string is built
+    # on the truncation path (49 + "..." = 52 chars total)
     body = "Recording stopped and processing..."
     if text_preview:
-        if len(text_preview) > 52:
-            preview = text_preview[:49] + "..."  # 49 + 3 = 52 total
-        else:
-            preview = text_preview
-        body = f"Transcription: {preview}"
+        # Slice at the boundary so the memoized _truncate keys on (and
+        # retains) at most 60 characters, never the whole transcript
+        body = _TRANSCRIPTION_PREFIX + _truncate(text_preview[:60], 52, 49)
 
-    return send_notification(
-        summary="Dictation", body=body, urgency="normal", timeout=5000
+    return _store_dictation_id(
+        send_notification(**_STOPPED_KW, body=body, replaces_id=_last_dictation_id)
     )
 
 
@@ -393,8 +886,15 @@ def notify_error(error_message: str) -> bool:
     Returns:
         bool: True if notification sent successfully
     """
-    return send_notification(
-        summary="Dictation Error", body=error_message, urgency="critical", timeout=10000
+    # The server ID is deliberately discarded: error popups are never
+    # replaced in place, so only delivery success matters here
+    return bool(
+        send_notification(
+            summary="Dictation Error",
+            body=error_message,
+            urgency="critical",
+            timeout=10000,
+        )
     )
 
 
@@ -410,8 +910,10 @@ def notify_info(info_message: str) -> bool:
     Returns:
         bool: True if notification sent successfully
     """
-    return send_notification(
-        summary="Dictation", body=info_message, urgency="low", timeout=3000
+    return bool(
+        send_notification(
+            summary="Dictation", body=info_message, urgency="low", timeout=3000
+        )
     )
 
 
@@ -421,19 +923,29 @@ def notify_stopping_transcription() -> bool:
     and transcription is about to begin, preventing confusion about whether
     the key press was registered.
 
-    RESPONSIBILITY: Send a consistent "stopping recording" notification.
+    RESPONSIBILITY: Send a consistent "stopping recording" notification,
+    replacing the session's "started" notification in place.
 
     Returns:
         bool: True if notification sent successfully
     """
-    return send_notification(
-        summary="Dictation",
-        body="Stopping recording... processing audio",
-        urgency="normal",
-        timeout=2000,
+    return _store_dictation_id(
+        send_notification(**_STOPPING_KW, replaces_id=_last_dictation_id)
     )
 
 
+# TTL cache for is_dunst_running: update() can fire per coalescing window
+# during recording, and the daemon rarely flaps faster than this.
+_DAEMON_TTL_S = 2.0
+_daemon_cache: Optional[tuple[float, bool]] = None
+
+
+def _invalidate_daemon_cache() -> None:
+    """Drop the cached daemon-liveness answer (called after send failures)."""
+    global _daemon_cache
+    _daemon_cache = None
+
+
 def is_dunst_running() -> bool:
     """
     Check if the dunst notification daemon is currently running.
@@ -441,15 +953,50 @@ def is_dunst_running() -> bool:
     RESPONSIBILITY: Verify that the notification daemon is alive and can
     receive commands. This is critical for detecting daemon crashes.
 
+    The answer is cached for a couple of seconds. When the shared D-Bus
+    connection exists, a NameHasOwner query on the bus replaces the pgrep
+    fork entirely; failure paths call _invalidate_daemon_cache() so crash
+    recovery is not delayed by a stale True.
+
     Returns:
         bool: True if dunst process is running, False otherwise
     """
+    global _daemon_cache
+
+    now = time.monotonic()
+    if _daemon_cache is not None and now - _daemon_cache[0] < _DAEMON_TTL_S:
+        return _daemon_cache[1]
+
+    result = _probe_daemon_running()
+    _daemon_cache = (now, result)
+    return result
+
+
+def _probe_daemon_running() -> bool:
+    """Ask the bus, /proc, or pgrep (in that order) for a live daemon.
+
+    NameHasOwner is preferred — one round-trip on the open connection that
+    verifies the notification *service*, not just a process. The /proc comm
+    scan is pure syscalls; pgrep remains only for /proc-less systems.
+    """
+    if _bus is not None:
+        try:
+            return bool(_bus.name_has_owner("org.freedesktop.Notifications"))
+        except Exception:
+            pass  # bus connection died; fall back to the process probe
+
+    try:
+        from whisper_dictate.dunst_monitor import _find_dunst_pid
+
+        return _find_dunst_pid() is not None
+    except OSError:
+        pass  # /proc unavailable (non-Linux); fall back to pgrep
+
     try:
-        # Check if dunst process exists
         result = subprocess.run(
             ["pgrep", "-x", "dunst"],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             check=False,
         )
         return result.returncode == 0
@@ -457,6 +1004,32 @@ def is_dunst_running() -> bool:
         return False
 
 
+# Fire-and-forget subprocess kwargs for calls that never read output: all
+# three stdio streams go straight to /dev/null (no pipe allocation), and
+# close_fds=False skips the child-side descriptor walk over /proc/self/fd —
+# safe because this process holds no sensitive inheritable FDs, and
+# worthwhile because it can hold many (model weights, audio device).
+_CLOSE_KWARGS: dict = {
+    "stdin": subprocess.DEVNULL,
+    "stdout": subprocess.DEVNULL,
+    "stderr": subprocess.DEVNULL,
+    "close_fds": False,
+    "check": False,
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _persistent_send_prefix(urgency: str) -> tuple[str, ...]:
+    """Constant argv prefix for PersistentNotification.send, per urgency.
+
+    -t 0 makes the notification persistent, -p prints the notification ID,
+    and -A adds the T5b "Stop Recording" action button (shown in dunst's
+    context menu, Ctrl+Shift+.). Cached so repeated sends only append the
+    dynamic summary/body instead of rebuilding the whole list.
+    """
+    return ("dunstify", "-u", urgency, "-t", "0", "-p", "-A", "stop,Stop Recording")
+
+
 class PersistentNotification:
     """
     Manages a persistent notification that stays visible during recording.
@@ -469,8 +1042,31 @@ class PersistentNotification:
     - Stale notification IDs: Validates daemon state before operations
     """
 
-    _last_operation_time: float = 0.0
-    _min_operation_interval: float = 0.1  # Minimum 100ms between operations
+    # No per-instance __dict__: attribute access on the update hot path is a
+    # fixed-offset slot load, and the short-lived per-recording instances
+    # stop contributing dict allocations for the GC to traverse.
+    __slots__ = (
+        "stack_tag",
+        "notification_id",
+        "_is_active",
+        "summary",
+        "urgency",
+        "_consecutive_failures",
+        "_max_consecutive_failures",
+        "_last_known_daemon_state",
+        "_update_prefix",
+        "_update_prefix_key",
+        "_last_sent_body",
+    )
+
+    # Rate-limit state shared by all instances. Monotonic so NTP wall-clock
+    # jumps can't open (or jam) the window, in integer ns so the compare is
+    # integer math on a single vDSO clock read. The lock makes the
+    # check-then-set atomic: two rapid toggles can't both pass the check and
+    # double-send.
+    _last_operation_time_ns: int = 0
+    _min_operation_interval_ns: int = 100_000_000  # Minimum 100ms between operations
+    _op_lock: threading.Lock = threading.Lock()
 
     def __init__(self, stack_tag: str = "dictation-recording"):
         """Initialize the persistent notification manager."""
@@ -483,6 +1079,56 @@ class PersistentNotification:
         self._consecutive_failures: int = 0
         self._max_consecutive_failures: int = 3
         self._last_known_daemon_state: bool = True
+        # Cached update() argv prefix, rebuilt only when the urgency,
+        # notification ID or summary actually change. update() runs once per
+        # coalescing window during recording, so the constant part of the
+        # command is not re-allocated per call.
+        self._update_prefix: list[str] = []
+        self._update_prefix_key: Optional[tuple] = None
+        # Body of the last successful send/update. A steady-state poller
+        # resending an unchanged transcription partial is answered here,
+        # before any daemon check, D-Bus call or dunstify fork.
+        self._last_sent_body: Optional[str] = None
+
+    def _notify_via_dbus(
+        self, summary: str, body: str, urgency: UrgencyLevel, replaces_id: int
+    ) -> Optional[str]:
+        """Send or update this notification with one D-Bus method call.
+
+        Reuses the module's cached org.freedesktop.Notifications proxy:
+        no dunstify fork/exec, no stdout pipe to parse for the ID. The
+        "stop" action is declared just as dunstify's -A flag does (the
+        callback still needs dunst's context menu). Returns the
+        server-assigned ID as a string, or None so the caller can fall
+        back to the dunstify subprocess.
+        """
+        iface = _get_notify_iface()
+        if iface is None:
+            return None
+
+        try:
+            return str(
+                int(
+                    iface.Notify(
+                        NOTIFY_APP_NAME,
+                        replaces_id,
+                        "",  # app_icon
+                        summary,
+                        body,
+                        ["stop", "Stop Recording"],
+                        {"urgency": URGENCY_MAP[urgency]},
+                        0,  # persistent
+                    )
+                )
+            )
+        except Exception as e:
+            logger.debug("D-Bus persistent notify failed (%s), falling back", e)
+            return None
+
+    def _replaces_id_int(self) -> int:
+        """Current notification ID as an int for D-Bus, 0 when unusable."""
+        notification_id = str(self.notification_id or "")
+        return int(notification_id) if notification_id.isdigit() else 0
 
     def send(
         self,
@@ -494,7 +1140,8 @@ class PersistentNotification:
         """Send a persistent notification with -t 0 for indefinite display.
 
         EDGE CASE 1: Multiple Rapid Start/Stop
-        - Implements rate limiting using _last_operation_time and _min_operation_interval
+        - Implements rate limiting using _last_operation_time_ns and
+          _min_operation_interval_ns (atomic compare-and-set under _op_lock)
         - If too soon after last operation, skip the action to prevent race conditions
 
         EDGE CASE 2: Notification Daemon Crash During Recording
@@ -513,38 +1160,49 @@ class PersistentNotification:
             Optional[str]: Notification ID if successful, None otherwise.
                           If wait_for_action=True, returns action name clicked.
         """
+        if _NOTIFIER_DISABLED:
+            return None
+
         self.summary = summary
         self.urgency = urgency
 
         if self._is_active:
             return self.update(body)
 
+        # EDGE CASE: Rate limiting - compare-and-set under the class lock so
+        # the check and the timestamp write are one atomic step. Runs before
+        # either backend so the D-Bus fast path honors the same interval as
+        # the dunstify fallback.
+        with PersistentNotification._op_lock:
+            now_ns = time.monotonic_ns()
+            elapsed_ns = now_ns - PersistentNotification._last_operation_time_ns
+            if elapsed_ns < PersistentNotification._min_operation_interval_ns:
+                logger.debug(
+                    "Rate limiting: skipping send, only %.3fs since last operation",
+                    elapsed_ns / 1e9,
+                )
+                return None
+            PersistentNotification._last_operation_time_ns = now_ns
+
+        # Direct D-Bus first: one in-process method call instead of a
+        # dunstify fork+exec+pipe. wait_for_action needs dunstify's
+        # blocking -w mode, which D-Bus can't express without a main loop.
+        if not wait_for_action:
+            notification_id = self._notify_via_dbus(summary, body, urgency, 0)
+            if notification_id is not None:
+                self.notification_id = notification_id
+                self._is_active = True
+                self._consecutive_failures = 0
+                self._last_known_daemon_state = True
+                self._last_sent_body = body
+                logger.info("Persistent notification sent: %s", self.notification_id)
+                return self.notification_id
+
         if not is_dunstify_available():
             logger.warning("dunstify not available, falling back")
             return None
 
-        # EDGE CASE: Rate limiting - check if enough time has passed since last operation
-        current_time = time.time()
-        elapsed = current_time - PersistentNotification._last_operation_time
-        if elapsed < PersistentNotification._min_operation_interval:
-            logger.debug(
-                f"Rate limiting: skipping send, only {elapsed:.3f}s since last operation"
-            )
-            return None
-
-        cmd = [
-            "dunstify",
-            "-u",
-            urgency,
-            "-t",
-            "0",  # 0 = persistent/infinite
-            "-p",  # Print notification ID
-        ]
-
-        # T5b: Add action button for stopping recording
-        # The action appears in dunst's context menu (Ctrl+Shift+.)
-        # When clicked, dunstify outputs the action name to stdout
-        cmd.extend(["-A", "stop,Stop Recording"])
+        cmd = list(_persistent_send_prefix(urgency))
 
         # T5b: Optionally wait for user action
         # This blocks until user clicks the action button
@@ -554,24 +1212,25 @@ class PersistentNotification:
         cmd.extend([summary, body])
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+            # Bytes mode: the first stdout line carries the ID or action name
+            # (ASCII either way), so full-stream UTF-8 decoding is skipped;
+            # stderr is never read, so it skips the pipe entirely
+            result = subprocess.run(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=False
+            )
             # Update last operation time regardless of success/failure
-            PersistentNotification._last_operation_time = time.time()
+            PersistentNotification._last_operation_time_ns = time.monotonic_ns()
+
+            # T5b: When the user clicks the action button, dunstify prints
+            # the action name instead of a notification ID
+            output = result.stdout.split(b"\n", 1)[0].strip().decode("ascii", "replace")
 
             # Guard against empty dunstify output
-            output_lines = result.stdout.strip().splitlines()
-            if not output_lines:
+            if not output:
                 self._consecutive_failures += 1
                 logger.error("dunstify returned empty output")
                 return None
 
-            output = output_lines[0]
-
-            # T5b: Handle action callback
-            # When user clicks action button, dunstify returns the action name
-            # The output could be either notification ID or action name
-            output = result.stdout.strip().splitlines()[0]
-
             if result.returncode == 0 and output:
                 # Check if this is an action response (e.g., "stop")
                 # or a notification ID (numeric string)
@@ -588,21 +1247,26 @@ class PersistentNotification:
                 # EDGE CASE 2: Reset failure counter on success
                 self._consecutive_failures = 0
                 self._last_known_daemon_state = True
-                logger.info(f"Persistent notification sent: {self.notification_id}")
+                self._last_sent_body = body
+                logger.info("Persistent notification sent: %s", self.notification_id)
                 return self.notification_id
 
             # EDGE CASE 2: Track failure
             self._consecutive_failures += 1
             logger.error(
-                f"Failed to send persistent notification (failure #{self._consecutive_failures}): {result.stderr}"
+                "Failed to send persistent notification (failure #%d, exit code %d)",
+                self._consecutive_failures,
+                result.returncode,
             )
             return None
-        except Exception as e:
+        except (OSError, subprocess.SubprocessError) as e:
             # EDGE CASE 2: Track failure
-            PersistentNotification._last_operation_time = time.time()
+            PersistentNotification._last_operation_time_ns = time.monotonic_ns()
             self._consecutive_failures += 1
             logger.error(
-                f"Error sending persistent notification (failure #{self._consecutive_failures}): {e}"
+                "Error sending persistent notification (failure #%d): %s",
+                self._consecutive_failures,
+                e,
             )
             return None
 
@@ -618,6 +1282,11 @@ class PersistentNotification:
             logger.warning("No active notification to update")
             return None
 
+        # Dirty check: an unchanged body would repaint the same pixels.
+        # Common when the transcription partial is stable between polls.
+        if body == self._last_sent_body:
+            return self.notification_id
+
         # EDGE CASE: Check daemon health before attempting update
         if not is_dunst_running():
             logger.warning(
@@ -626,37 +1295,58 @@ class PersistentNotification:
             self._is_active = False
             self._last_known_daemon_state = False
             self._consecutive_failures += 1
-            PersistentNotification._last_operation_time = time.time()
+            PersistentNotification._last_operation_time_ns = time.monotonic_ns()
             return None
 
-        cmd = [
-            "dunstify",
-            "-u",
-            self.urgency,
-            "-t",
-            "0",
-            "-r",
-            self.notification_id,
-            self.summary,
-            body,
-        ]
+        # Direct D-Bus update: replaces_id keeps the same popup in place
+        notification_id = self._notify_via_dbus(
+            self.summary, body, self.urgency, self._replaces_id_int()
+        )
+        if notification_id is not None:
+            PersistentNotification._last_operation_time_ns = time.monotonic_ns()
+            self.notification_id = notification_id
+            self._consecutive_failures = 0
+            self._last_known_daemon_state = True
+            self._last_sent_body = body
+            return self.notification_id
+
+        key = (self.urgency, self.notification_id, self.summary)
+        if self._update_prefix_key != key:
+            self._update_prefix = [
+                "dunstify",
+                "-u",
+                self.urgency,
+                "-t",
+                "0",
+                "-r",
+                self.notification_id,
+                self.summary,
+            ]
+            self._update_prefix_key = key
+        cmd = [*self._update_prefix, body]
 
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-            PersistentNotification._last_operation_time = time.time()
+            result = subprocess.run(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=False
+            )
+            PersistentNotification._last_operation_time_ns = time.monotonic_ns()
 
             if result.returncode == 0:
-                if result.stdout.strip():
-                    self.notification_id = result.stdout.strip()
+                output = result.stdout.split(b"\n", 1)[0].strip()
+                if output:
+                    self.notification_id = output.decode("ascii", "replace")
                 # EDGE CASE 2: Reset failure counter on success
                 self._consecutive_failures = 0
                 self._last_known_daemon_state = True
+                self._last_sent_body = body
                 return self.notification_id
 
             # EDGE CASE 2: Track failure and mark as inactive if daemon crashed
             self._consecutive_failures += 1
             logger.error(
-                f"Failed to update notification (failure #{self._consecutive_failures}): {result.stderr}"
+                "Failed to update notification (failure #%d, exit code %d)",
+                self._consecutive_failures,
+                result.returncode,
             )
             # If we've had multiple consecutive failures, assume daemon crashed
             if self._consecutive_failures >= self._max_consecutive_failures:
@@ -665,16 +1355,20 @@ class PersistentNotification:
                 )
                 self._is_active = False
                 self._last_known_daemon_state = False
+                _invalidate_daemon_cache()
             return None
-        except Exception as e:
-            PersistentNotification._last_operation_time = time.time()
+        except (OSError, subprocess.SubprocessError) as e:
+            PersistentNotification._last_operation_time_ns = time.monotonic_ns()
             self._consecutive_failures += 1
             logger.error(
-                f"Error updating notification (failure #{self._consecutive_failures}): {e}"
+                "Error updating notification (failure #%d): %s",
+                self._consecutive_failures,
+                e,
             )
             if self._consecutive_failures >= self._max_consecutive_failures:
                 self._is_active = False
                 self._last_known_daemon_state = False
+                _invalidate_daemon_cache()
             return None
 
     def close(self) -> bool:
@@ -683,31 +1377,133 @@ class PersistentNotification:
             logger.info("Close: notification not active, skipping")
             return True
 
+        # Direct D-Bus close when the ID is a server-assigned integer
+        replaces_id = self._replaces_id_int()
+        iface = _get_notify_iface() if replaces_id else None
+        if iface is not None:
+            try:
+                iface.CloseNotification(replaces_id)
+                self._is_active = False
+                self.notification_id = None
+                self._last_sent_body = None
+                return True
+            except Exception as e:
+                logger.debug("D-Bus close failed (%s), falling back", e)
+
         if not is_dunstify_available():
             logger.warning("dunstify not available - cannot close notification")
             return True
 
         logger.info(
-            f"Closing notification {self.notification_id} with command: dunstify -C {self.notification_id}"
+            "Closing notification %s with command: dunstify -C %s",
+            self.notification_id,
+            self.notification_id,
         )
 
         cmd = ["dunstify", "-C", str(self.notification_id)]
 
         try:
-            result = subprocess.run(cmd, capture_output=True, check=False)
+            # close() never reads output, so discard it at the fd level
+            # instead of paying for capture pipes
+            result = subprocess.run(cmd, **_CLOSE_KWARGS)
             self._is_active = False
             self.notification_id = None
+            self._last_sent_body = None
             return result.returncode == 0
-        except Exception as e:
-            logger.error(f"Error closing notification: {e}")
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.error("Error closing notification: %s", e)
             self._is_active = False
             return False
 
 
-# Module-level instance for recording notifications
+# Module-level instance for recording notifications. A plain global (not a
+# ContextVar): the coalescer timer and notification worker run on their own
+# threads, which start with empty contexts and would lose the handle, and
+# pytest-xdist workers are separate processes where globals are already
+# isolated. The accessors below are the supported seam for tests.
 _recording_notification: Optional[PersistentNotification] = None
 
 
+def get_recording_notification() -> Optional[PersistentNotification]:
+    """Return the process-wide recording notification, if any."""
+    return _recording_notification
+
+
+def set_recording_notification(
+    notification: Optional[PersistentNotification],
+) -> None:
+    """Replace the process-wide recording notification."""
+    global _recording_notification
+    _recording_notification = notification
+
+
+class _UpdateCoalescer:
+    """
+    Debounces persistent-notification updates to one dunstify call per window.
+
+    WHY THIS EXISTS: Streaming transcription can push many partial updates
+    per second, but the notification only ever needs to show the newest
+    text. Each update used to cost a full dunstify fork; coalescing bounds
+    that at one call per window while always carrying the latest string.
+
+    BOUNDARIES:
+    - DOES: Keep only the newest submitted text, flush it on a short timer
+    - DOES NOT: Send anything itself when nothing is pending
+    """
+
+    def __init__(self, window_s: float = 0.1) -> None:
+        """Initialize the coalescer with its flush window."""
+        self.window_s = window_s
+        self._pending_text: Optional[str] = None
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def submit(self, text: str) -> None:
+        """Record the newest text and arm the flush timer if idle."""
+        with self._lock:
+            self._pending_text = text
+            if self._timer is None:
+                self._timer = threading.Timer(self.window_s, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> bool:
+        """Push the newest pending text to the recording notification.
+
+        Returns:
+            bool: True if an update was sent successfully, False when
+                  nothing was pending or the notification is gone
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            text, self._pending_text = self._pending_text, None
+
+        if text is None:
+            return False
+
+        # Truncate once per flush instead of per submitted update. The
+        # boundary slice keeps multi-KB transcripts out of _truncate's
+        # memo cache, which would otherwise pin them for its 32 entries.
+        preview = _truncate(text[:110], 100, 100)
+        notification = get_recording_notification()
+        if notification and notification._is_active:
+            return notification.update(_RECORDING_PREFIX + preview) is not None
+        return False
+
+    def reset(self) -> None:
+        """Drop any pending state without sending; used between tests."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._pending_text = None
+
+
+_update_coalescer = _UpdateCoalescer()
+
+
 def notify_recording_persistent_start() -> bool:
     """Send a persistent notification when recording starts.
 
@@ -721,9 +1517,9 @@ def notify_recording_persistent_start() -> bool:
     for the action callback to be handled. In the default non-blocking mode,
     the action button is displayed but the callback cannot be received.
     """
-    global _recording_notification
-    _recording_notification = PersistentNotification()
-    result = _recording_notification.send(
+    notification = PersistentNotification()
+    set_recording_notification(notification)
+    result = notification.send(
         summary="Dictation",
         body="Recording in progress... press again to stop\n"
         "Or use context menu (Ctrl+Shift+.) to stop",
@@ -748,16 +1544,16 @@ def notify_recording_persistent_start_blocking() -> Optional[str]:
     Returns:
         Optional[str]: "stop" if user clicked stop action, notification ID if successful, None otherwise
     """
-    global _recording_notification
-    _recording_notification = PersistentNotification()
-    result = _recording_notification.send(
+    notification = PersistentNotification()
+    set_recording_notification(notification)
+    result = notification.send(
         summary="Dictation",
         body="Recording in progress... click Stop Recording to end",
         wait_for_action=True,
     )
     # If user clicked stop action, result will be "stop"
     if result == "stop":
-        _recording_notification = None
+        set_recording_notification(None)
         _clear_notification_id()
         return "stop"
 
@@ -767,27 +1563,36 @@ def notify_recording_persistent_start_blocking() -> Optional[str]:
 
 
 def notify_recording_persistent_update(text: str) -> bool:
-    """Update the persistent notification with transcription text."""
-    global _recording_notification
-    if _recording_notification and _recording_notification._is_active:
-        preview = text[:100] + "..." if len(text) > 100 else text
-        result = _recording_notification.update(f"Recording... {preview}")
-        return result is not None
+    """Queue a persistent-notification update with transcription text.
+
+    Updates are coalesced: rapid calls collapse to one dunstify invocation
+    per coalescing window, always carrying the newest text. The actual send
+    happens on the coalescer's timer (or a synchronous flush on stop).
+    """
+    notification = get_recording_notification()
+    if notification and notification._is_active:
+        _update_coalescer.submit(text)
+        return True
     return False
 
 
 def notify_recording_persistent_stop() -> bool:
     """Close the persistent notification when recording stops."""
-    global _recording_notification
+    # Deliver any coalesced update synchronously so the final text is
+    # visible before the notification closes
+    _update_coalescer.flush()
+
+    notification = get_recording_notification()
     logger.info(
-        f"notify_recording_persistent_stop called: _recording_notification={_recording_notification}"
+        "notify_recording_persistent_stop called: _recording_notification=%s",
+        notification,
     )
 
     # If no active notification object but we have a saved ID, try to close it
-    if not _recording_notification or not _recording_notification._is_active:
+    if not notification or not notification._is_active:
         saved_id = _load_notification_id()
         if saved_id:
-            logger.info(f"Found saved notification ID: {saved_id}, attempting to close")
+            logger.info("Found saved notification ID: %s, attempting to close", saved_id)
             # Create a temporary notification object to close it
             temp_notification = PersistentNotification()
             temp_notification.notification_id = saved_id
@@ -796,9 +1601,9 @@ def notify_recording_persistent_stop() -> bool:
             _clear_notification_id()
             return result
 
-    if _recording_notification and _recording_notification._is_active:
-        result = _recording_notification.close()
-        _recording_notification = None
+    if notification and notification._is_active:
+        result = notification.close()
+        set_recording_notification(None)
         _clear_notification_id()
         return result
     logger.warning(
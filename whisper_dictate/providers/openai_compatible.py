@@ -16,11 +16,16 @@ RELATIONSHIPS:
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional, Union
 
 import openai
 from openai import OpenAI
 
+try:
+    import httpx
+except ImportError:  # pragma: no cover - normally bundled with the openai SDK
+    httpx = None
+
 from whisper_dictate.transcription import (
     TranscriptionError,
     TranscriptionProvider,
@@ -29,6 +34,88 @@ from whisper_dictate.transcription import (
 
 logger = logging.getLogger(__name__)
 
+# MIME types for the multipart upload, keyed by file suffix
+_CONTENT_TYPES = {
+    ".flac": "audio/flac",
+    ".mp3": "audio/mpeg",
+    ".ogg": "audio/ogg",
+    ".wav": "audio/wav",
+}
+
+
+def _is_effectively_silent(audio_file: Union[Path, BinaryIO]) -> bool:
+    """Return True when a recording is too short or quiet to hold speech.
+
+    A double-tapped toggle produces a sub-second, near-silent file;
+    uploading it pays a full network round trip for an empty transcript.
+    Recordings under 0.3 s, or whose first two seconds have a mean
+    absolute amplitude below 1e-4, are treated as empty. Accepts a path
+    or a seekable buffer (rewound afterwards). Any probe failure errs
+    on the side of uploading.
+    """
+    source = str(audio_file) if isinstance(audio_file, Path) else audio_file
+    try:
+        import numpy as np
+        import soundfile as sf
+
+        info = sf.info(source)
+        if info.samplerate and info.frames / info.samplerate < 0.3:
+            return True
+
+        with sf.SoundFile(source) as snd:
+            samples = snd.read(
+                frames=min(snd.frames, 2 * snd.samplerate), dtype="float32"
+            )
+        return float(np.abs(samples).mean()) < 1e-4
+    except Exception as e:
+        logger.debug(f"Silence probe failed ({e}), uploading anyway")
+        return False
+    finally:
+        if not isinstance(audio_file, Path):
+            audio_file.seek(0)
+
+
+def _upload_name_and_type(buffer: BinaryIO) -> tuple:
+    """Derive the multipart filename and MIME type for an audio buffer.
+
+    Buffers from AudioRecorder.record_to_bytes carry the container
+    suffix in .name; anything else is presented as WAV.
+    """
+    name = Path(getattr(buffer, "name", "recording.wav")).name
+    content_type = _CONTENT_TYPES.get(Path(name).suffix.lower(), "audio/wav")
+    return name, content_type
+
+
+def _merge_segment_texts(texts: list) -> str:
+    """Join per-segment transcripts, deduplicating the overlap region.
+
+    Adjacent segments share ~1 s of audio so no words are lost at the
+    cut, which means the end of one transcript can repeat at the start
+    of the next. The longest matching word run (compared
+    case/punctuation-insensitively, up to 8 words) is dropped from the
+    later segment before joining.
+
+    Args:
+        texts: Segment transcripts in playback order
+
+    Returns:
+        str: The merged transcript
+    """
+
+    def norm(word: str) -> str:
+        return word.lower().strip(".,!?;:")
+
+    merged: list = []
+    for text in texts:
+        words = text.split()
+        if merged and words:
+            for k in range(min(8, len(merged), len(words)), 0, -1):
+                if [norm(w) for w in merged[-k:]] == [norm(w) for w in words[:k]]:
+                    words = words[k:]
+                    break
+        merged.extend(words)
+    return " ".join(merged)
+
 
 class OpenAICompatibleProvider(TranscriptionProvider):
     """WHY THIS EXISTS: Users need a single provider implementation that works
@@ -56,6 +143,7 @@ class OpenAICompatibleProvider(TranscriptionProvider):
         language: Optional[str] = None,
         temperature: float = 0.0,
         provider_name: str = "openai",
+        need_language: bool = False,
     ) -> None:
         """Initialize OpenAI-compatible transcription provider.
 
@@ -68,16 +156,40 @@ class OpenAICompatibleProvider(TranscriptionProvider):
                      None means auto-detect.
             temperature: Sampling temperature (0.0 = deterministic)
             provider_name: Human-readable provider name for logging
+            need_language: Request the detected language via verbose_json.
+                The default json/text formats never populate it, so False
+                keeps the server from computing unused segment timestamps.
         """
         self._provider_name = provider_name
         self._model = model
         self._language = language
         self._temperature = temperature
+        self._api_key = api_key
+        self._need_language = need_language
+
+        # The httpx client is held explicitly so warm_up() can open the
+        # TCP+TLS connection without reaching into SDK internals. Keepalive
+        # limits size the pool for transcribe_audio_batched's concurrent
+        # segment uploads, and the 60 s expiry keeps the warmed connection
+        # alive across back-to-back dictations instead of paying a fresh
+        # TCP+TLS handshake per toggle.
+        client_kwargs = {}
+        if httpx is not None:
+            self._http_client = httpx.Client(
+                timeout=timeout,
+                limits=httpx.Limits(
+                    max_keepalive_connections=8, keepalive_expiry=60.0
+                ),
+            )
+            client_kwargs["http_client"] = self._http_client
+        else:
+            self._http_client = None
 
         self._client = OpenAI(
             api_key=api_key,
             base_url=base_url,
             timeout=timeout,
+            **client_kwargs,
         )
 
     @property
@@ -90,17 +202,55 @@ class OpenAICompatibleProvider(TranscriptionProvider):
         """Current model name (exposed for database logging)."""
         return self._model
 
-    def transcribe_audio(self, audio_file: Path) -> TranscriptionResult:
+    def warm_up(self) -> None:
+        """Open the TCP+TLS connection before the first transcription call.
+
+        WHY THIS EXISTS: A cold HTTPS connection costs 1-3 network round
+        trips (TCP + TLS) before the first audio byte moves. Issuing a
+        throwaway HEAD request from a side thread while recording
+        shutdown and database bookkeeping run hides that latency; the
+        pooled connection is then reused by transcribe_audio.
+
+        Any HTTP status counts as success - even a 401 or 404 means the
+        handshake completed. Transport errors are logged and swallowed;
+        transcribe_audio will simply reconnect.
+        """
+        if self._http_client is None:
+            return
+
+        try:
+            self._http_client.head(str(self._client.base_url))
+            logger.debug(f"Warmed connection to {self._client.base_url}")
+        except Exception as e:
+            logger.debug(f"Connection warm-up failed (non-fatal): {e}")
+
+    def close(self) -> None:
+        """Release the pooled HTTP connections and any submit() workers.
+
+        Idle keepalive sockets are cleaned up by the OS at process exit
+        anyway, so calling this is optional for the short-lived CLI; it
+        exists for long-running embedders that construct providers
+        repeatedly.
+        """
+        super().close()
+        if self._http_client is not None:
+            self._http_client.close()
+
+    def transcribe_audio(
+        self, audio_file: Union[Path, BinaryIO]
+    ) -> TranscriptionResult:
         """WHY THIS EXISTS: Audio transcription needs to be handled consistently
         with proper error handling and result formatting across all providers.
 
         RESPONSIBILITY: Transcribe audio file using OpenAI-compatible API.
         BOUNDARIES:
         - DOES: Make API call, handle errors, and return structured result
-        - DOES NOT: Handle file validation beyond existence check
+        - DOES NOT: Validate file contents before upload
 
         Args:
-            audio_file: Path to audio file to transcribe
+            audio_file: Path to an audio file, or an in-memory buffer
+                (e.g. AudioRecorder.record_to_bytes output) whose .name
+                carries the container suffix
 
         Returns:
             TranscriptionResult: Structured transcription result
@@ -109,8 +259,11 @@ class OpenAICompatibleProvider(TranscriptionProvider):
             IOError: If audio file cannot be read
             TranscriptionError: If API call fails
         """
-        if not audio_file.exists():
-            raise IOError(f"Audio file not found: {audio_file}")
+        if _is_effectively_silent(audio_file):
+            logger.info(f"Recording {audio_file} is empty/silent, skipping API call")
+            return TranscriptionResult(
+                text="", language=None, provider=self._provider_name
+            )
 
         logger.info(
             f"Transcribing with {self._provider_name}: {audio_file} "
@@ -118,20 +271,39 @@ class OpenAICompatibleProvider(TranscriptionProvider):
         )
 
         try:
-            with open(audio_file, "rb") as file:
-                response = self._client.audio.transcriptions.create(
-                    model=self._model,
-                    file=file,
-                    response_format="json",
-                    language=self._language,
-                    temperature=self._temperature,
+            if self._http_client is not None:
+                # Hot path: a direct multipart POST skips the SDK's
+                # per-call request-model construction and pydantic
+                # response parsing
+                result = self._transcribe_via_httpx(audio_file)
+            else:
+                response_format = (
+                    "verbose_json" if self._need_language else "json"
                 )
+                if isinstance(audio_file, Path):
+                    with open(audio_file, "rb") as file:
+                        response = self._client.audio.transcriptions.create(
+                            model=self._model,
+                            file=file,
+                            response_format=response_format,
+                            language=self._language,
+                            temperature=self._temperature,
+                        )
+                else:
+                    name, content_type = _upload_name_and_type(audio_file)
+                    response = self._client.audio.transcriptions.create(
+                        model=self._model,
+                        file=(name, audio_file, content_type),
+                        response_format=response_format,
+                        language=self._language,
+                        temperature=self._temperature,
+                    )
 
-            result = TranscriptionResult(
-                text=response.text,
-                language=getattr(response, "language", None),
-                provider=self._provider_name,
-            )
+                result = TranscriptionResult(
+                    text=response.text,
+                    language=response.language if self._need_language else None,
+                    provider=self._provider_name,
+                )
 
             logger.info(
                 f"Transcription completed: {len(result.text)} characters, "
@@ -143,8 +315,230 @@ class OpenAICompatibleProvider(TranscriptionProvider):
         except openai.APIError as e:
             logger.error(f"{self._provider_name} API error: {e}")
             raise TranscriptionError(str(e), provider=self._provider_name) from e
-        except IOError:
+        except FileNotFoundError as e:
+            # EAFP: open() stats the path anyway, so no separate
+            # exists() check runs before it
+            raise IOError(f"Audio file not found: {audio_file}") from e
+        except (TranscriptionError, IOError):
             raise
         except Exception as e:
             logger.error(f"Unexpected transcription error: {e}")
             raise
+
+    def _transcribe_via_httpx(
+        self, audio_file: Union[Path, BinaryIO]
+    ) -> TranscriptionResult:
+        """POST the audio straight to /audio/transcriptions over httpx.
+
+        Functionally equivalent to the SDK call in transcribe_audio but
+        without its per-request model building and response validation,
+        which is measurable interpreter overhead on a one-shot call. The
+        pooled connection (possibly opened early by warm_up) is reused.
+
+        Raises:
+            TranscriptionError: On HTTP error status or transport failure
+        """
+        if isinstance(audio_file, Path):
+            content_type = _CONTENT_TYPES.get(
+                audio_file.suffix.lower(), "audio/wav"
+            )
+
+            # Hand httpx the open file object: it streams the body in fixed
+            # chunks instead of slurping the whole payload into a bytes first
+            with open(audio_file, "rb") as file:
+                text, language = self._post_transcription(
+                    (audio_file.name, file, content_type)
+                )
+        else:
+            name, content_type = _upload_name_and_type(audio_file)
+            text, language = self._post_transcription(
+                (name, audio_file, content_type)
+            )
+
+        return TranscriptionResult(
+            text=text,
+            language=language,
+            provider=self._provider_name,
+        )
+
+    def _post_transcription(self, file_field) -> tuple:
+        """POST one multipart transcription request.
+
+        file_field is an httpx files tuple (name, file-like, content-type);
+        file-likes (open files, BytesIO segments) are streamed as-is, so
+        the payload is copied once into the TLS buffer rather than staged
+        through an intermediate bytes. By default response_format='text'
+        makes the server return the bare transcript - no JSON envelope to
+        parse and no metadata we would discard (the plain json format
+        never carries a language field either). When the provider was
+        built with need_language, verbose_json is requested instead and
+        the detected language is read from the envelope.
+
+        Returns:
+            tuple: (text, language) - language is None unless need_language
+
+        Raises:
+            TranscriptionError: On HTTP error status or transport failure
+        """
+        import httpx as _httpx
+
+        url = str(self._client.base_url).rstrip("/") + "/audio/transcriptions"
+        data = {
+            "model": self._model,
+            "response_format": "verbose_json" if self._need_language else "text",
+            "temperature": str(self._temperature),
+        }
+        if self._language:
+            data["language"] = self._language
+
+        try:
+            response = self._http_client.post(
+                url,
+                headers={"Authorization": f"Bearer {self._api_key}"},
+                data=data,
+                files={"file": file_field},
+            )
+        except _httpx.HTTPError as e:
+            logger.error(f"{self._provider_name} transport error: {e}")
+            raise TranscriptionError(str(e), provider=self._provider_name) from e
+
+        if response.status_code >= 400:
+            message = f"HTTP {response.status_code}: {response.text[:200]}"
+            logger.error(f"{self._provider_name} API error: {message}")
+            raise TranscriptionError(message, provider=self._provider_name)
+
+        if self._need_language:
+            payload = response.json()
+            return payload.get("text", "").strip(), payload.get("language")
+        return response.text.strip(), None
+
+    def transcribe_audio_batched(
+        self,
+        audio_file: Path,
+        segment_sec: float = 25.0,
+        overlap: float = 1.0,
+        max_workers: int = 8,
+    ) -> TranscriptionResult:
+        """Transcribe a long recording as concurrent overlapping segments.
+
+        WHY THIS EXISTS: The API processes one uploaded file serially,
+        so a multi-minute dictation pays remote compute proportional to
+        its length. Independent ~25 s segments are embarrassingly
+        parallel: uploading them concurrently overlaps both the network
+        transfer and the remote inference. Segments overlap by ~1 s so
+        no words are lost at the cuts; the duplicated words are removed
+        when the transcripts are merged.
+
+        Falls back to the single-file path for recordings that fit in
+        one segment or when the file cannot be segmented.
+
+        Args:
+            audio_file: Path to audio file to transcribe
+            segment_sec: Length of each segment in seconds
+            overlap: Seconds of audio shared by adjacent segments
+            max_workers: Upper bound on concurrent uploads
+
+        Returns:
+            TranscriptionResult: Merged transcription result
+
+        Raises:
+            IOError: If audio file cannot be read
+            TranscriptionError: If any segment upload fails
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        # No up-front exists() check: a missing file fails segmentation
+        # and the single-file fallback raises the IOError with one stat
+        # fewer on the happy path
+        buffers = self._segment_audio(audio_file, segment_sec, overlap)
+        if buffers is None:
+            return self.transcribe_audio(audio_file)
+
+        logger.info(
+            f"Transcribing {audio_file} as {len(buffers)} concurrent "
+            f"~{segment_sec:.0f}s segments"
+        )
+
+        try:
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, len(buffers))
+            ) as pool:
+                futures = [
+                    pool.submit(self._transcribe_segment, bio, index)
+                    for index, bio in enumerate(buffers)
+                ]
+                texts = [future.result() for future in futures]
+        except openai.APIError as e:
+            logger.error(f"{self._provider_name} API error: {e}")
+            raise TranscriptionError(str(e), provider=self._provider_name) from e
+
+        result = TranscriptionResult(
+            text=_merge_segment_texts(texts),
+            language=self._language,
+            provider=self._provider_name,
+        )
+
+        logger.info(
+            f"Batched transcription completed: {len(result.text)} characters "
+            f"from {len(buffers)} segments"
+        )
+
+        return result
+
+    def _segment_audio(self, audio_file: Path, segment_sec: float, overlap: float):
+        """Split a recording into overlapping in-memory WAV buffers.
+
+        Returns None when the recording fits in a single segment or the
+        file cannot be read as audio, signalling the caller to fall back
+        to the plain single-file upload.
+        """
+        import io
+
+        try:
+            import soundfile as sf
+
+            buffers = []
+            with sf.SoundFile(str(audio_file)) as snd:
+                samplerate = snd.samplerate
+                seg_frames = int(segment_sec * samplerate)
+                step = int((segment_sec - overlap) * samplerate)
+
+                if snd.frames <= seg_frames:
+                    return None
+
+                for start in range(0, snd.frames, step):
+                    snd.seek(start)
+                    bio = io.BytesIO()
+                    sf.write(
+                        bio,
+                        snd.read(frames=seg_frames),
+                        samplerate,
+                        format="WAV",
+                        subtype="PCM_16",
+                    )
+                    bio.seek(0)
+                    buffers.append(bio)
+            return buffers
+        except Exception as e:
+            logger.warning(f"Could not segment {audio_file} ({e}), uploading whole")
+            return None
+
+    def _transcribe_segment(self, buffer, index: int) -> str:
+        """Transcribe one in-memory WAV segment and return its text.
+
+        The BytesIO buffer is handed to the upload layer directly - the
+        segment never touches disk.
+        """
+        name = f"segment-{index}.wav"
+        if self._http_client is not None:
+            text, _ = self._post_transcription((name, buffer, "audio/wav"))
+            return text
+
+        response = self._client.audio.transcriptions.create(
+            model=self._model,
+            file=(name, buffer, "audio/wav"),
+            response_format="json",
+            language=self._language,
+            temperature=self._temperature,
+        )
+        return response.text
@@ -7,12 +7,11 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
-import openai
-from openai import OpenAI
-
 from whisper_dictate.config import OpenAIConfig
 
 if TYPE_CHECKING:
+    from openai import OpenAI
+
     from whisper_dictate.config import WhisperConfig
 
 logger = logging.getLogger(__name__)
@@ -95,6 +94,54 @@ class TranscriptionProvider(ABC):
         """
         ...
 
+    def warm_up(self) -> None:
+        """Prepare the provider for an imminent transcription call.
+
+        Providers that talk to remote APIs can open their TCP+TLS
+        connection here so the handshake overlaps other work instead of
+        delaying the upload. Must never raise; the default is a no-op.
+        """
+
+    # Lazily created by submit(); None until the pipelined API is used
+    _submit_pool = None
+
+    def submit(self, audio_file: Path):
+        """Start a transcription in the background and return its Future.
+
+        WHY THIS EXISTS: transcribe_audio blocks the caller for the full
+        upload and remote inference. Submitting instead lets the caller
+        overlap that window with its own work - notification updates,
+        database bookkeeping, or the user's next recording. Two workers
+        keep one upload in flight while the previous one drains without
+        letting a backlog of stale dictations pile up.
+
+        Args:
+            audio_file: Path to the audio file to transcribe.
+
+        Returns:
+            concurrent.futures.Future resolving to the
+            TranscriptionResult; .result() re-raises whatever
+            transcribe_audio would have raised.
+        """
+        if self._submit_pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            self._submit_pool = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="whisper"
+            )
+        return self._submit_pool.submit(self.transcribe_audio, audio_file)
+
+    def close(self) -> None:
+        """Release background resources held by the provider.
+
+        Drains any in-flight submit() work before returning so results
+        are never silently dropped at shutdown. Idempotent; providers
+        that hold their own resources (connection pools) extend this.
+        """
+        if self._submit_pool is not None:
+            self._submit_pool.shutdown(wait=True)
+            self._submit_pool = None
+
 
 class WhisperTranscriber:
     """WHY THIS EXISTS: OpenAI Whisper API integration needs to be encapsulated
@@ -110,15 +157,25 @@ class WhisperTranscriber:
     - USED BY: DictationService for transcription
     """
 
-    def __init__(self, config: OpenAIConfig, client: Optional[OpenAI] = None) -> None:
+    def __init__(
+        self, config: OpenAIConfig, client: Optional["OpenAI"] = None
+    ) -> None:
         """Initialize Whisper transcriber with configuration.
 
+        The OpenAI SDK is imported lazily so that modules which only
+        need the config types or the provider ABC do not pay its
+        import cost.
+
         Args:
             config: OpenAI API configuration
             client: Optional OpenAI client for testing (defaults to new instance)
         """
         self.config = config
-        self.client = client or OpenAI(api_key=config.api_key)
+        if client is None:
+            from openai import OpenAI
+
+            client = OpenAI(api_key=config.api_key)
+        self.client = client
 
     def transcribe_audio(self, audio_file: Path) -> TranscriptionResult:
         """WHY THIS EXISTS: Audio transcription needs to be handled consistently
@@ -139,19 +196,26 @@ class WhisperTranscriber:
             openai.APIError: If API call fails
             IOError: If audio file cannot be read
         """
-        if not audio_file.exists():
-            raise IOError(f"Audio file not found: {audio_file}")
+        import openai
 
         logger.info(f"Transcribing audio file: {audio_file}")
 
+        # The plain json format never populates language; verbose_json
+        # does, but makes the server compute segment timestamps too, so
+        # it is requested only when the caller actually wants the field
+        need_language = self.config.need_language
+
         try:
             with open(audio_file, "rb") as file:
                 response = self.client.audio.transcriptions.create(
-                    model=self.config.model, file=file, response_format="json"
+                    model=self.config.model,
+                    file=file,
+                    response_format="verbose_json" if need_language else "json",
                 )
 
             result = TranscriptionResult(
-                text=response.text, language=getattr(response, "language", None)
+                text=response.text,
+                language=response.language if need_language else None,
             )
 
             logger.info(
@@ -164,6 +228,10 @@ class WhisperTranscriber:
         except openai.APIError as e:
             logger.error(f"OpenAI API error: {e}")
             raise
+        except FileNotFoundError as e:
+            # EAFP: open() already stats the path, so a separate
+            # exists() check would just duplicate the syscall
+            raise IOError(f"Audio file not found: {audio_file}") from e
         except Exception as e:
             logger.error(f"Unexpected error during transcription: {e}")
             raise
@@ -218,4 +286,5 @@ def create_transcriber(config: "WhisperConfig") -> TranscriptionProvider:
         language=config.language,
         temperature=config.temperature,
         provider_name=config.provider,
+        need_language=config.need_language,
     )